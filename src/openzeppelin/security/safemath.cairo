@@ -64,6 +64,39 @@ func uint256_checked_sub_lt{
     return (c)
 end
 
+# Adds two integers. Skips the `uint256_check` of `a` and `b`, which must
+# already be valid Uint256, e.g. amounts checked once by the caller's entry
+# point or values read from storage that only ever holds valid Uint256.
+# Still reverts if the sum overflows.
+func uint256_add_nocheck_inputs{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (a: Uint256, b: Uint256) -> (c: Uint256):
+    let (c: Uint256, is_overflow) = uint256_add(a, b)
+    with_attr error_message("Safemath: addition overflow"):
+        assert is_overflow = FALSE
+    end
+    return (c)
+end
+
+# Subtracts two integers. Skips the `uint256_check` of `a` and `b`, like
+# `uint256_add_nocheck_inputs`.
+# Still reverts if minuend (`b`) is greater than subtrahend (`a`).
+func uint256_sub_le_nocheck_inputs{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (a: Uint256, b: Uint256) -> (c: Uint256):
+    alloc_locals
+    let (is_le) = uint256_le(b, a)
+    with_attr error_message("Safemath: subtraction overflow"):
+        assert is_le = TRUE
+    end
+    let (c: Uint256) = uint256_sub(a, b)
+    return (c)
+end
+
 # Multiplies two integers.
 # Reverts if product is greater than 2^256.
 func uint256_checked_mul{
@@ -15,12 +15,17 @@ from openzeppelin.token.erc20.library import (
     ERC20_decimals,
     ERC20_balanceOf,
     ERC20_allowance,
+    ERC20_balanceOfBatch,
+    ERC20_allowanceBatch,
+    ERC20_nonces,
 
     ERC20_initializer,
     ERC20_approve,
+    ERC20_permit,
     ERC20_increaseAllowance,
     ERC20_decreaseAllowance,
     ERC20_transfer,
+    ERC20_transferBatch,
     ERC20_transferFrom,
     ERC20_mint
 )
@@ -129,6 +134,43 @@ func allowance{
     return (remaining)
 end
 
+@view
+func balanceOfBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*) -> (balances_len: felt, balances: Uint256*):
+    let (balances_len, balances: Uint256*) = ERC20_balanceOfBatch(accounts_len, accounts)
+    return (balances_len, balances)
+end
+
+@view
+func allowanceBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        spenders_len: felt,
+        spenders: felt*
+    ) -> (remaining_len: felt, remaining: Uint256*):
+    let (remaining_len, remaining: Uint256*) = ERC20_allowanceBatch(
+        owners_len, owners, spenders_len, spenders
+    )
+    return (remaining_len, remaining)
+end
+
+@view
+func nonces{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt) -> (nonce: felt):
+    let (nonce) = ERC20_nonces(owner)
+    return (nonce)
+end
+
 #
 # Externals
 #
@@ -143,6 +185,21 @@ func transfer{
     return (TRUE)
 end
 
+@external
+func transferBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        amounts_len: felt,
+        amounts: Uint256*
+    ) -> (success: felt):
+    ERC20_transferBatch(recipients_len, recipients, amounts_len, amounts)
+    return (TRUE)
+end
+
 @external
 func transferFrom{
         syscall_ptr : felt*, 
@@ -167,6 +224,24 @@ func approve{
     return (TRUE)
 end
 
+@external
+func permit{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owner: felt,
+        spender: felt,
+        amount: Uint256,
+        deadline: felt,
+        nonce: felt,
+        signature_len: felt,
+        signature: felt*
+    ) -> (success: felt):
+    ERC20_permit(owner, spender, amount, deadline, nonce, signature_len, signature)
+    return (TRUE)
+end
+
 @external
 func increaseAllowance{
         syscall_ptr : felt*, 
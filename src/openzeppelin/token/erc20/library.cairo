@@ -4,19 +4,29 @@
 %lang starknet
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin
-from starkware.starknet.common.syscalls import get_caller_address
-from starkware.cairo.common.math import assert_not_zero, assert_lt
+from starkware.starknet.common.syscalls import (
+    get_caller_address, get_contract_address, get_block_timestamp, get_tx_info
+)
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.hash_state import hash_init, hash_update, hash_finalize
+from starkware.cairo.common.math import assert_not_zero, assert_lt, assert_le_felt
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.uint256 import (
-    Uint256, uint256_check
+    Uint256, uint256_check, uint256_eq
 )
 
-from openzeppelin.utils.constants import UINT8_MAX
+from openzeppelin.utils.constants import UINT8_MAX, UINT128_MAX
 
 from openzeppelin.security.safemath import (
-    uint256_checked_add, uint256_checked_sub_le
+    uint256_add_nocheck_inputs, uint256_sub_le_nocheck_inputs
 )
 
+from openzeppelin.account.IAccount import IAccount
+
+# Prefix of the hashed permit message, so that a signature over it can't be
+# mistaken for a signature over any other kind of message
+const ERC20_PERMIT_PREFIX = 'ERC20 Permit'
+
 #
 # Events
 #
@@ -57,6 +67,10 @@ end
 func ERC20_allowances(owner: felt, spender: felt) -> (allowance: Uint256):
 end
 
+@storage_var
+func ERC20_permit_nonces(owner: felt) -> (nonce: felt):
+end
+
 #
 # Constructor
 #
@@ -133,11 +147,55 @@ func ERC20_allowance{
     return (remaining)
 end
 
+func ERC20_nonces{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt) -> (nonce: felt):
+    let (nonce) = ERC20_permit_nonces.read(owner)
+    return (nonce)
+end
+
+func ERC20_balanceOfBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*) -> (balances_len: felt, balances: Uint256*):
+    alloc_locals
+    let (local balances: Uint256*) = alloc()
+    _balances_of(accounts_len, accounts, balances)
+    return (accounts_len, balances)
+end
+
+func ERC20_allowanceBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        spenders_len: felt,
+        spenders: felt*
+    ) -> (remaining_len: felt, remaining: Uint256*):
+    alloc_locals
+    with_attr error_message("ERC20: owners and spenders lengths differ"):
+        assert owners_len = spenders_len
+    end
+
+    let (local remaining: Uint256*) = alloc()
+    _allowances_of(owners_len, owners, spenders, remaining)
+    return (owners_len, remaining)
+end
+
 func ERC20_transfer{
         syscall_ptr : felt*, 
         pedersen_ptr : HashBuiltin*,
         range_check_ptr
     }(recipient: felt, amount: Uint256):
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        uint256_check(amount)
+    end
+
     let (sender) = get_caller_address()
     _transfer(sender, recipient, amount)
     return ()
@@ -153,38 +211,111 @@ func ERC20_transferFrom{
         amount: Uint256
     ) -> ():
     alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        uint256_check(amount)
+    end
+
     let (caller) = get_caller_address()
     let (caller_allowance: Uint256) = ERC20_allowances.read(owner=sender, spender=caller)
 
-    with_attr error_message("ERC20: transfer amount exceeds allowance"):
-        let (new_allowance: Uint256) = uint256_checked_sub_le(caller_allowance, amount)
+    # the maximum allowance is unlimited, so it is never decreased
+    let (is_unlimited) = uint256_eq(caller_allowance, Uint256(UINT128_MAX, UINT128_MAX))
+    if is_unlimited == FALSE:
+        with_attr error_message("ERC20: transfer amount exceeds allowance"):
+            let (new_allowance: Uint256) = uint256_sub_le_nocheck_inputs(caller_allowance, amount)
+        end
+        ERC20_allowances.write(sender, caller, new_allowance)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
     end
-    ERC20_allowances.write(sender, caller, new_allowance)
 
     _transfer(sender, recipient, amount)
     return ()
 end
 
-func ERC20_approve{
+func ERC20_transferBatch{
         syscall_ptr : felt*, 
         pedersen_ptr : HashBuiltin*,
         range_check_ptr
-    }(spender: felt, amount: Uint256):
-    with_attr error_message("ERC20: amount is not a valid Uint256"):
-        uint256_check(amount)
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        amounts_len: felt,
+        amounts: Uint256*
+    ):
+    alloc_locals
+    with_attr error_message("ERC20: recipients and amounts lengths differ"):
+        assert recipients_len = amounts_len
     end
 
-    let (caller) = get_caller_address()
-    with_attr error_message("ERC20: zero address cannot approve"):
-        assert_not_zero(caller)
+    let (sender) = get_caller_address()
+    with_attr error_message("ERC20: cannot transfer from the zero address"):
+        assert_not_zero(sender)
     end
 
-    with_attr error_message("ERC20: cannot approve to the zero address"):
-        assert_not_zero(spender)
+    # debit the sender once for the whole batch
+    let (total: Uint256) = _batch_total(amounts_len, amounts, Uint256(0, 0))
+    let (sender_balance: Uint256) = ERC20_balances.read(account=sender)
+    with_attr error_message("ERC20: transfer amount exceeds balance"):
+        let (new_sender_balance: Uint256) = uint256_sub_le_nocheck_inputs(sender_balance, total)
+    end
+    ERC20_balances.write(sender, new_sender_balance)
+
+    _batch_credit(sender, recipients_len, recipients, amounts)
+    return ()
+end
+
+func ERC20_approve{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, amount: Uint256):
+    let (caller) = get_caller_address()
+    _approve(caller, spender, amount)
+    return ()
+end
+
+func ERC20_permit{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owner: felt,
+        spender: felt,
+        amount: Uint256,
+        deadline: felt,
+        nonce: felt,
+        signature_len: felt,
+        signature: felt*
+    ):
+    alloc_locals
+    let (block_timestamp) = get_block_timestamp()
+    # compared over the whole felt range, so that any large deadline never expires
+    with_attr error_message("ERC20: permit expired"):
+        assert_le_felt(block_timestamp, deadline)
     end
 
-    ERC20_allowances.write(caller, spender, amount)
-    Approval.emit(caller, spender, amount)
+    let (current_nonce) = ERC20_permit_nonces.read(owner)
+    with_attr error_message("ERC20: invalid permit nonce"):
+        assert nonce = current_nonce
+    end
+    ERC20_permit_nonces.write(owner, current_nonce + 1)
+
+    let (hash) = _permit_hash(owner, spender, amount, deadline, nonce)
+    # reverts unless the owner account accepts the signature
+    IAccount.is_valid_signature(
+        contract_address=owner,
+        hash=hash,
+        signature_len=signature_len,
+        signature=signature
+    )
+
+    _approve(owner, spender, amount)
     return ()
 end
 
@@ -202,7 +333,7 @@ func ERC20_increaseAllowance{
 
     # add allowance
     with_attr error_message("ERC20: allowance overflow"):
-        let (new_allowance: Uint256) = uint256_checked_add(current_allowance, added_value)
+        let (new_allowance: Uint256) = uint256_add_nocheck_inputs(current_allowance, added_value)
     end
 
     ERC20_approve(spender, new_allowance)
@@ -223,7 +354,7 @@ func ERC20_decreaseAllowance{
     let (current_allowance: Uint256) = ERC20_allowances.read(owner=caller, spender=spender)
 
     with_attr error_message("ERC20: allowance below zero"):
-        let (new_allowance: Uint256) = uint256_checked_sub_le(current_allowance, subtracted_value)
+        let (new_allowance: Uint256) = uint256_sub_le_nocheck_inputs(current_allowance, subtracted_value)
     end
 
     ERC20_approve(spender, new_allowance)
@@ -245,14 +376,14 @@ func ERC20_mint{
 
     let (supply: Uint256) = ERC20_total_supply.read()
     with_attr error_message("ERC20: mint overflow"):
-        let (new_supply: Uint256) = uint256_checked_add(supply, amount)
+        let (new_supply: Uint256) = uint256_add_nocheck_inputs(supply, amount)
     end
     ERC20_total_supply.write(new_supply)
 
     let (balance: Uint256) = ERC20_balances.read(account=recipient)
     # overflow is not possible because sum is guaranteed to be less than total supply
     # which we check for overflow below
-    let (new_balance: Uint256) = uint256_checked_add(balance, amount)
+    let (new_balance: Uint256) = uint256_add_nocheck_inputs(balance, amount)
     ERC20_balances.write(recipient, new_balance)
 
     Transfer.emit(0, recipient, amount)
@@ -275,12 +406,12 @@ func ERC20_burn{
 
     let (balance: Uint256) = ERC20_balances.read(account)
     with_attr error_message("ERC20: burn amount exceeds balance"):
-        let (new_balance: Uint256) = uint256_checked_sub_le(balance, amount)
+        let (new_balance: Uint256) = uint256_sub_le_nocheck_inputs(balance, amount)
     end
     ERC20_balances.write(account, new_balance)
 
     let (supply: Uint256) = ERC20_total_supply.read()
-    let (new_supply: Uint256) = uint256_checked_sub_le(supply, amount)
+    let (new_supply: Uint256) = uint256_sub_le_nocheck_inputs(supply, amount)
     ERC20_total_supply.write(new_supply)
     Transfer.emit(account, 0, amount)
     return ()
@@ -290,16 +421,71 @@ end
 # Internal
 #
 
+func _approve{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, spender: felt, amount: Uint256):
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        uint256_check(amount)
+    end
+
+    with_attr error_message("ERC20: zero address cannot approve"):
+        assert_not_zero(owner)
+    end
+
+    with_attr error_message("ERC20: cannot approve to the zero address"):
+        assert_not_zero(spender)
+    end
+
+    ERC20_allowances.write(owner, spender, amount)
+    Approval.emit(owner, spender, amount)
+    return ()
+end
+
+# Hash of the permit message, bound to this token on this chain
+func _permit_hash{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*
+    }(
+        owner: felt,
+        spender: felt,
+        amount: Uint256,
+        deadline: felt,
+        nonce: felt
+    ) -> (hash: felt):
+    alloc_locals
+    let (tx_info) = get_tx_info()
+    let (self) = get_contract_address()
+
+    let (local elements: felt*) = alloc()
+    assert elements[0] = ERC20_PERMIT_PREFIX
+    assert elements[1] = tx_info.chain_id
+    assert elements[2] = self
+    assert elements[3] = owner
+    assert elements[4] = spender
+    assert elements[5] = amount.low
+    assert elements[6] = amount.high
+    assert elements[7] = deadline
+    assert elements[8] = nonce
+
+    let hash_ptr = pedersen_ptr
+    with hash_ptr:
+        let (hash_state_ptr) = hash_init()
+        let (hash_state_ptr) = hash_update(hash_state_ptr, elements, 9)
+        let (hash) = hash_finalize(hash_state_ptr)
+    end
+    let pedersen_ptr = hash_ptr
+    return (hash)
+end
+
+# Amounts are validated by the callers, and balances are valid as stored.
 func _transfer{
         syscall_ptr : felt*, 
         pedersen_ptr : HashBuiltin*,
         range_check_ptr
     }(sender: felt, recipient: felt, amount: Uint256):
     alloc_locals
-    with_attr error_message("ERC20: amount is not a valid Uint256"):
-        uint256_check(amount) # almost surely not needed, might remove after confirmation
-    end
-
     with_attr error_message("ERC20: cannot transfer from the zero address"):
         assert_not_zero(sender)
     end
@@ -310,15 +496,85 @@ func _transfer{
 
     let (sender_balance: Uint256) = ERC20_balances.read(account=sender)
     with_attr error_message("ERC20: transfer amount exceeds balance"):
-        let (new_sender_balance: Uint256) = uint256_checked_sub_le(sender_balance, amount)
+        let (new_sender_balance: Uint256) = uint256_sub_le_nocheck_inputs(sender_balance, amount)
     end
     ERC20_balances.write(sender, new_sender_balance)
 
     # add to recipient
     let (recipient_balance: Uint256) = ERC20_balances.read(account=recipient)
     # overflow is not possible because sum is guaranteed by mint to be less than total supply
-    let (new_recipient_balance: Uint256) = uint256_checked_add(recipient_balance, amount)
+    let (new_recipient_balance: Uint256) = uint256_add_nocheck_inputs(recipient_balance, amount)
     ERC20_balances.write(recipient, new_recipient_balance)
     Transfer.emit(sender, recipient, amount)
     return ()
 end
+
+func _batch_total{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(amounts_len: felt, amounts: Uint256*, total: Uint256) -> (total: Uint256):
+    alloc_locals
+    if amounts_len == 0:
+        return (total)
+    end
+
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        uint256_check([amounts])
+    end
+
+    # a total above 2^256 can't be covered by any balance
+    with_attr error_message("ERC20: transfer amount exceeds balance"):
+        let (new_total: Uint256) = uint256_add_nocheck_inputs(total, [amounts])
+    end
+    return _batch_total(amounts_len - 1, amounts + Uint256.SIZE, new_total)
+end
+
+func _batch_credit{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(sender: felt, recipients_len: felt, recipients: felt*, amounts: Uint256*):
+    if recipients_len == 0:
+        return ()
+    end
+
+    with_attr error_message("ERC20: cannot transfer to the zero address"):
+        assert_not_zero([recipients])
+    end
+
+    let (recipient_balance: Uint256) = ERC20_balances.read(account=[recipients])
+    # overflow is not possible because sum is guaranteed by mint to be less than total supply
+    let (new_recipient_balance: Uint256) = uint256_add_nocheck_inputs(recipient_balance, [amounts])
+    ERC20_balances.write([recipients], new_recipient_balance)
+    Transfer.emit(sender, [recipients], [amounts])
+    return _batch_credit(sender, recipients_len - 1, recipients + 1, amounts + Uint256.SIZE)
+end
+
+func _balances_of{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*, balances: Uint256*):
+    if accounts_len == 0:
+        return ()
+    end
+
+    let (balance: Uint256) = ERC20_balances.read(account=[accounts])
+    assert [balances] = balance
+    return _balances_of(accounts_len - 1, accounts + 1, balances + Uint256.SIZE)
+end
+
+func _allowances_of{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owners_len: felt, owners: felt*, spenders: felt*, remaining: Uint256*):
+    if owners_len == 0:
+        return ()
+    end
+
+    let (allowance: Uint256) = ERC20_allowances.read(owner=[owners], spender=[spenders])
+    assert [remaining] = allowance
+    return _allowances_of(owners_len - 1, owners + 1, spenders + 1, remaining + Uint256.SIZE)
+end
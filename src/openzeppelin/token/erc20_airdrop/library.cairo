@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc20_airdrop/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.hash import hash2
+from starkware.cairo.common.hash_state import hash_init, hash_update, hash_finalize
+from starkware.cairo.common.math_cmp import is_le_felt
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.token.erc20.library import ERC20_mint
+from openzeppelin.utils.bitmap import Bitmap_get, Bitmap_set
+
+# Bitmap of the claimed indices
+const ERC20_AIRDROP_CLAIMED = 'ERC20_Airdrop: claimed'
+
+#
+# Events
+#
+
+@event
+func Claimed(index: felt, account: felt, amount: Uint256):
+end
+
+#
+# Storage
+#
+
+@storage_var
+func ERC20_Airdrop_merkle_root() -> (root: felt):
+end
+
+#
+# Constructor
+#
+
+func ERC20_Airdrop_initializer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(merkle_root: felt):
+    ERC20_Airdrop_merkle_root.write(merkle_root)
+    return ()
+end
+
+#
+# Getters
+#
+
+func ERC20_Airdrop_merkleRoot{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (root: felt):
+    let (root) = ERC20_Airdrop_merkle_root.read()
+    return (root)
+end
+
+func ERC20_Airdrop_isClaimed{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(index: felt) -> (claimed: felt):
+    let (claimed) = Bitmap_get(ERC20_AIRDROP_CLAIMED, index)
+    return (claimed)
+end
+
+#
+# Externals
+#
+
+func ERC20_Airdrop_claim{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(
+        index: felt,
+        account: felt,
+        amount: Uint256,
+        proof_len: felt,
+        proof: felt*
+    ):
+    alloc_locals
+    let (claimed) = Bitmap_get(ERC20_AIRDROP_CLAIMED, index)
+    with_attr error_message("ERC20_Airdrop: already claimed"):
+        assert claimed = FALSE
+    end
+
+    let (leaf) = _leaf_hash(index, account, amount)
+    let (local root) = _merkle_root(leaf, proof_len, proof)
+    let (expected_root) = ERC20_Airdrop_merkle_root.read()
+    with_attr error_message("ERC20_Airdrop: invalid proof"):
+        assert root = expected_root
+    end
+
+    Bitmap_set(ERC20_AIRDROP_CLAIMED, index)
+    ERC20_mint(account, amount)
+    Claimed.emit(index, account, amount)
+    return ()
+end
+
+#
+# Internals
+#
+
+func _leaf_hash{
+        pedersen_ptr : HashBuiltin*
+    }(index: felt, account: felt, amount: Uint256) -> (leaf: felt):
+    alloc_locals
+    let (local elements: felt*) = alloc()
+    assert elements[0] = index
+    assert elements[1] = account
+    assert elements[2] = amount.low
+    assert elements[3] = amount.high
+
+    let hash_ptr = pedersen_ptr
+    with hash_ptr:
+        let (hash_state_ptr) = hash_init()
+        let (hash_state_ptr) = hash_update(hash_state_ptr, elements, 4)
+        let (leaf) = hash_finalize(hash_state_ptr)
+    end
+    let pedersen_ptr = hash_ptr
+    return (leaf)
+end
+
+# Folds `proof` into `node`, hashing every pair in ascending order
+func _merkle_root{
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(node: felt, proof_len: felt, proof: felt*) -> (root: felt):
+    alloc_locals
+    if proof_len == 0:
+        return (node)
+    end
+
+    let (node_first) = is_le_felt(node, [proof])
+    if node_first == TRUE:
+        tempvar left = node
+        tempvar right = [proof]
+    else:
+        tempvar left = [proof]
+        tempvar right = node
+    end
+    let (parent) = hash2{hash_ptr=pedersen_ptr}(left, right)
+    return _merkle_root(parent, proof_len - 1, proof + 1)
+end
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc20_compact/ERC20_Compact_Mintable.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.uint256 import Uint256
+from starkware.cairo.common.bool import TRUE
+
+from openzeppelin.token.erc20.library import (
+    ERC20_name,
+    ERC20_symbol,
+    ERC20_decimals,
+    ERC20_initializer
+)
+
+from openzeppelin.token.erc20_compact.library import (
+    ERC20_Compact_cap,
+    ERC20_Compact_totalSupply,
+    ERC20_Compact_balanceOf,
+    ERC20_Compact_allowance,
+
+    ERC20_Compact_initializer,
+    ERC20_Compact_approve,
+    ERC20_Compact_increaseAllowance,
+    ERC20_Compact_decreaseAllowance,
+    ERC20_Compact_transfer,
+    ERC20_Compact_transferFrom,
+    ERC20_Compact_mint
+)
+
+from openzeppelin.access.ownable import (
+    Ownable_initializer,
+    Ownable_only_owner
+)
+
+@constructor
+func constructor{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        name: felt,
+        symbol: felt,
+        decimals: felt,
+        cap: Uint256,
+        initial_supply: Uint256,
+        recipient: felt,
+        owner: felt
+    ):
+    ERC20_initializer(name, symbol, decimals)
+    ERC20_Compact_initializer(cap)
+    ERC20_Compact_mint(recipient, initial_supply)
+    Ownable_initializer(owner)
+    return ()
+end
+
+#
+# Getters
+#
+
+@view
+func name{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (name: felt):
+    let (name) = ERC20_name()
+    return (name)
+end
+
+@view
+func symbol{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (symbol: felt):
+    let (symbol) = ERC20_symbol()
+    return (symbol)
+end
+
+@view
+func totalSupply{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (totalSupply: Uint256):
+    let (totalSupply: Uint256) = ERC20_Compact_totalSupply()
+    return (totalSupply)
+end
+
+@view
+func cap{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (cap: Uint256):
+    let (cap: Uint256) = ERC20_Compact_cap()
+    return (cap)
+end
+
+@view
+func decimals{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (decimals: felt):
+    let (decimals) = ERC20_decimals()
+    return (decimals)
+end
+
+@view
+func balanceOf{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt) -> (balance: Uint256):
+    let (balance: Uint256) = ERC20_Compact_balanceOf(account)
+    return (balance)
+end
+
+@view
+func allowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, spender: felt) -> (remaining: Uint256):
+    let (remaining: Uint256) = ERC20_Compact_allowance(owner, spender)
+    return (remaining)
+end
+
+#
+# Externals
+#
+
+@external
+func transfer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(recipient: felt, amount: Uint256) -> (success: felt):
+    ERC20_Compact_transfer(recipient, amount)
+    return (TRUE)
+end
+
+@external
+func transferFrom{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        sender: felt,
+        recipient: felt,
+        amount: Uint256
+    ) -> (success: felt):
+    ERC20_Compact_transferFrom(sender, recipient, amount)
+    return (TRUE)
+end
+
+@external
+func approve{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, amount: Uint256) -> (success: felt):
+    ERC20_Compact_approve(spender, amount)
+    return (TRUE)
+end
+
+@external
+func increaseAllowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, added_value: Uint256) -> (success: felt):
+    ERC20_Compact_increaseAllowance(spender, added_value)
+    return (TRUE)
+end
+
+@external
+func decreaseAllowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, subtracted_value: Uint256) -> (success: felt):
+    ERC20_Compact_decreaseAllowance(spender, subtracted_value)
+    return (TRUE)
+end
+
+@external
+func mint{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(to: felt, amount: Uint256):
+    Ownable_only_owner()
+    ERC20_Compact_mint(to, amount)
+    return ()
+end
@@ -0,0 +1,347 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc20_compact/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.math import assert_not_zero, assert_not_equal, assert_le
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.uint256 import Uint256, uint256_check
+
+from openzeppelin.token.erc20.library import Transfer, Approval
+
+# Balances, the total supply and the cap are stored as a single felt, the cap
+# keeping all of them below this bound. Amounts of 2^128 or more can't be moved
+# anyway, so they are all saturated to the bound when converted from Uint256.
+# An allowance equal to the bound is unlimited and reported as 2^256 - 1.
+const ERC20_COMPACT_BOUND = 2 ** 128
+
+#
+# Storage
+#
+
+@storage_var
+func ERC20_Compact_cap_() -> (cap: felt):
+end
+
+@storage_var
+func ERC20_Compact_total_supply() -> (total_supply: felt):
+end
+
+@storage_var
+func ERC20_Compact_balances(account: felt) -> (balance: felt):
+end
+
+@storage_var
+func ERC20_Compact_allowances(owner: felt, spender: felt) -> (allowance: felt):
+end
+
+#
+# Constructor
+#
+
+func ERC20_Compact_initializer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(cap: Uint256):
+    with_attr error_message("ERC20: cap is not a valid Uint256"):
+        uint256_check(cap)
+    end
+
+    with_attr error_message("ERC20: cap exceeds 2^128"):
+        assert cap.high = 0
+    end
+    ERC20_Compact_cap_.write(cap.low)
+    return ()
+end
+
+#
+# Getters
+#
+
+func ERC20_Compact_cap{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (cap: Uint256):
+    let (cap) = ERC20_Compact_cap_.read()
+    return (Uint256(cap, 0))
+end
+
+func ERC20_Compact_totalSupply{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (totalSupply: Uint256):
+    let (totalSupply) = ERC20_Compact_total_supply.read()
+    return (Uint256(totalSupply, 0))
+end
+
+func ERC20_Compact_balanceOf{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt) -> (balance: Uint256):
+    let (balance) = ERC20_Compact_balances.read(account)
+    return (Uint256(balance, 0))
+end
+
+func ERC20_Compact_allowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, spender: felt) -> (remaining: Uint256):
+    alloc_locals
+    let (remaining) = ERC20_Compact_allowances.read(owner, spender)
+    let (remaining_uint: Uint256) = _allowance_to_uint(remaining)
+    return (remaining_uint)
+end
+
+#
+# Externals
+#
+
+func ERC20_Compact_transfer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(recipient: felt, amount: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        let (local value) = _to_felt(amount)
+    end
+
+    let (sender) = get_caller_address()
+    _transfer(sender, recipient, value)
+    return ()
+end
+
+func ERC20_Compact_transferFrom{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        sender: felt,
+        recipient: felt,
+        amount: Uint256
+    ):
+    alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        let (local value) = _to_felt(amount)
+    end
+
+    let (caller) = get_caller_address()
+    let (local caller_allowance) = ERC20_Compact_allowances.read(owner=sender, spender=caller)
+
+    # unlimited allowances are never decreased
+    if caller_allowance != ERC20_COMPACT_BOUND:
+        with_attr error_message("ERC20: transfer amount exceeds allowance"):
+            assert_le(value, caller_allowance)
+        end
+        ERC20_Compact_allowances.write(sender, caller, caller_allowance - value)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
+
+    _transfer(sender, recipient, value)
+    return ()
+end
+
+func ERC20_Compact_approve{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, amount: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        let (local value) = _to_felt(amount)
+    end
+
+    let (caller) = get_caller_address()
+    _approve(caller, spender, value)
+    return ()
+end
+
+func ERC20_Compact_increaseAllowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, added_value: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: added_value is not a valid Uint256"):
+        let (local added) = _to_felt(added_value)
+    end
+
+    let (caller) = get_caller_address()
+    let (current_allowance) = ERC20_Compact_allowances.read(caller, spender)
+
+    # both terms are at most 2^128, so the sum can't wrap around
+    local new_allowance = current_allowance + added
+    let (is_below_bound) = is_le(new_allowance, ERC20_COMPACT_BOUND)
+    if is_below_bound == TRUE:
+        _approve(caller, spender, new_allowance)
+        return ()
+    end
+
+    _approve(caller, spender, ERC20_COMPACT_BOUND)
+    return ()
+end
+
+func ERC20_Compact_decreaseAllowance{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(spender: felt, subtracted_value: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: subtracted_value is not a valid Uint256"):
+        let (local subtracted) = _to_felt(subtracted_value)
+    end
+
+    let (caller) = get_caller_address()
+    let (local current_allowance) = ERC20_Compact_allowances.read(caller, spender)
+
+    # an unlimited allowance has no finite value to decrease from, it must be
+    # replaced with approve
+    with_attr error_message("ERC20: cannot decrease an unlimited allowance"):
+        assert_not_equal(current_allowance, ERC20_COMPACT_BOUND)
+    end
+
+    with_attr error_message("ERC20: allowance below zero"):
+        assert_le(subtracted, current_allowance)
+    end
+
+    _approve(caller, spender, current_allowance - subtracted)
+    return ()
+end
+
+func ERC20_Compact_mint{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(recipient: felt, amount: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        let (local value) = _to_felt(amount)
+    end
+
+    with_attr error_message("ERC20: cannot mint to the zero address"):
+        assert_not_zero(recipient)
+    end
+
+    let (supply) = ERC20_Compact_total_supply.read()
+    let (cap) = ERC20_Compact_cap_.read()
+    local new_supply = supply + value
+    with_attr error_message("ERC20: cap exceeded"):
+        assert_le(new_supply, cap)
+    end
+    ERC20_Compact_total_supply.write(new_supply)
+
+    let (balance) = ERC20_Compact_balances.read(account=recipient)
+    # overflow is not possible because the balance is bounded by the capped total supply
+    ERC20_Compact_balances.write(recipient, balance + value)
+
+    Transfer.emit(0, recipient, Uint256(value, 0))
+    return ()
+end
+
+func ERC20_Compact_burn{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt, amount: Uint256):
+    alloc_locals
+    with_attr error_message("ERC20: amount is not a valid Uint256"):
+        let (local value) = _to_felt(amount)
+    end
+
+    with_attr error_message("ERC20: cannot burn from the zero address"):
+        assert_not_zero(account)
+    end
+
+    let (local balance) = ERC20_Compact_balances.read(account)
+    with_attr error_message("ERC20: burn amount exceeds balance"):
+        assert_le(value, balance)
+    end
+    ERC20_Compact_balances.write(account, balance - value)
+
+    let (supply) = ERC20_Compact_total_supply.read()
+    ERC20_Compact_total_supply.write(supply - value)
+    Transfer.emit(account, 0, Uint256(value, 0))
+    return ()
+end
+
+#
+# Internal
+#
+
+func _transfer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(sender: felt, recipient: felt, value: felt):
+    alloc_locals
+    with_attr error_message("ERC20: cannot transfer from the zero address"):
+        assert_not_zero(sender)
+    end
+
+    with_attr error_message("ERC20: cannot transfer to the zero address"):
+        assert_not_zero(recipient)
+    end
+
+    let (local sender_balance) = ERC20_Compact_balances.read(account=sender)
+    with_attr error_message("ERC20: transfer amount exceeds balance"):
+        assert_le(value, sender_balance)
+    end
+    ERC20_Compact_balances.write(sender, sender_balance - value)
+
+    # add to recipient
+    let (recipient_balance) = ERC20_Compact_balances.read(account=recipient)
+    # overflow is not possible because the balance is bounded by the capped total supply
+    ERC20_Compact_balances.write(recipient, recipient_balance + value)
+    Transfer.emit(sender, recipient, Uint256(value, 0))
+    return ()
+end
+
+func _approve{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, spender: felt, value: felt):
+    alloc_locals
+    with_attr error_message("ERC20: zero address cannot approve"):
+        assert_not_zero(owner)
+    end
+
+    with_attr error_message("ERC20: cannot approve to the zero address"):
+        assert_not_zero(spender)
+    end
+
+    ERC20_Compact_allowances.write(owner, spender, value)
+    let (amount: Uint256) = _allowance_to_uint(value)
+    Approval.emit(owner, spender, amount)
+    return ()
+end
+
+# Converts a Uint256 to a felt, saturating values of 2^128 or more to ERC20_COMPACT_BOUND.
+func _to_felt{range_check_ptr}(amount: Uint256) -> (value: felt):
+    uint256_check(amount)
+    if amount.high == 0:
+        return (amount.low)
+    end
+    return (ERC20_COMPACT_BOUND)
+end
+
+func _allowance_to_uint(allowance: felt) -> (amount: Uint256):
+    if allowance == ERC20_COMPACT_BOUND:
+        return (Uint256(ERC20_COMPACT_BOUND - 1, ERC20_COMPACT_BOUND - 1))
+    end
+    return (Uint256(allowance, 0))
+end
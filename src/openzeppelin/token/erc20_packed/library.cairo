@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc20_packed/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.bool import TRUE, FALSE
+
+from openzeppelin.token.erc20.library import ERC20_name_, ERC20_symbol_
+from openzeppelin.utils.packing import Packing_get, Packing_set
+
+# Layout of the packed config: 8 bits of decimals, then the paused flag
+const ERC20_PACKED_DECIMALS_OFFSET = 0
+const ERC20_PACKED_DECIMALS_SIZE = 8
+const ERC20_PACKED_PAUSED_OFFSET = 8
+const ERC20_PACKED_PAUSED_SIZE = 1
+
+#
+# Storage
+#
+
+# Replaces the `ERC20_decimals_` and `Pausable_paused` slots
+@storage_var
+func ERC20_Packed_config() -> (config: felt):
+end
+
+#
+# Constructor
+#
+
+func ERC20_Packed_initializer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(
+        name: felt,
+        symbol: felt,
+        decimals: felt
+    ):
+    ERC20_name_.write(name)
+    ERC20_symbol_.write(symbol)
+    with_attr error_message("ERC20: decimals exceed 2^8"):
+        let (config) = Packing_set(
+            0, decimals, ERC20_PACKED_DECIMALS_OFFSET, ERC20_PACKED_DECIMALS_SIZE
+        )
+    end
+    ERC20_Packed_config.write(config)
+    return ()
+end
+
+#
+# Getters
+#
+
+func ERC20_Packed_decimals{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }() -> (decimals: felt):
+    let (config) = ERC20_Packed_config.read()
+    let (decimals) = Packing_get(config, ERC20_PACKED_DECIMALS_OFFSET, ERC20_PACKED_DECIMALS_SIZE)
+    return (decimals)
+end
+
+func ERC20_Packed_paused{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }() -> (paused: felt):
+    let (config) = ERC20_Packed_config.read()
+    let (paused) = Packing_get(config, ERC20_PACKED_PAUSED_OFFSET, ERC20_PACKED_PAUSED_SIZE)
+    return (paused)
+end
+
+func ERC20_Packed_when_not_paused{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }():
+    let (is_paused) = ERC20_Packed_paused()
+    with_attr error_message("Pausable: contract is paused"):
+        assert is_paused = FALSE
+    end
+    return ()
+end
+
+func ERC20_Packed_when_paused{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }():
+    let (is_paused) = ERC20_Packed_paused()
+    with_attr error_message("Pausable: contract is not paused"):
+        assert is_paused = TRUE
+    end
+    return ()
+end
+
+#
+# Externals
+#
+
+func ERC20_Packed_pause{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }():
+    ERC20_Packed_when_not_paused()
+    _set_paused(TRUE)
+    return ()
+end
+
+func ERC20_Packed_unpause{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }():
+    ERC20_Packed_when_paused()
+    _set_paused(FALSE)
+    return ()
+end
+
+#
+# Internals
+#
+
+func _set_paused{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(paused: felt):
+    let (config) = ERC20_Packed_config.read()
+    let (new_config) = Packing_set(
+        config, paused, ERC20_PACKED_PAUSED_OFFSET, ERC20_PACKED_PAUSED_SIZE
+    )
+    ERC20_Packed_config.write(new_config)
+    return ()
+end
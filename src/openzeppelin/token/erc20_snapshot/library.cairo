@@ -0,0 +1,275 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc20_snapshot/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address, get_block_number
+from starkware.cairo.common.math import assert_lt, unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.token.erc20.library import (
+    ERC20_balanceOf,
+    ERC20_totalSupply,
+
+    ERC20_transfer,
+    ERC20_transferBatch,
+    ERC20_transferFrom,
+    ERC20_mint,
+    ERC20_burn
+)
+
+# Value of a balance or of the total supply from `block` onwards
+struct Checkpoint:
+    member block: felt
+    member value: Uint256
+end
+
+#
+# Storage
+#
+
+@storage_var
+func ERC20_Snapshot_account_checkpoints_len(account: felt) -> (len: felt):
+end
+
+@storage_var
+func ERC20_Snapshot_account_checkpoints(account: felt, index: felt) -> (checkpoint: Checkpoint):
+end
+
+@storage_var
+func ERC20_Snapshot_supply_checkpoints_len() -> (len: felt):
+end
+
+@storage_var
+func ERC20_Snapshot_supply_checkpoints(index: felt) -> (checkpoint: Checkpoint):
+end
+
+#
+# Getters
+#
+
+func ERC20_Snapshot_balanceOfAt{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt, block: felt) -> (balance: Uint256):
+    alloc_locals
+    _assert_past_block(block)
+    let (local len) = ERC20_Snapshot_account_checkpoints_len.read(account)
+    # index of the first checkpoint after `block`, the one before holds the balance
+    let (upper) = _account_upper_bound(account, block, 0, len)
+    if upper == 0:
+        return (Uint256(0, 0))
+    end
+
+    let (checkpoint: Checkpoint) = ERC20_Snapshot_account_checkpoints.read(account, upper - 1)
+    return (checkpoint.value)
+end
+
+func ERC20_Snapshot_totalSupplyAt{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(block: felt) -> (totalSupply: Uint256):
+    alloc_locals
+    _assert_past_block(block)
+    let (local len) = ERC20_Snapshot_supply_checkpoints_len.read()
+    let (upper) = _supply_upper_bound(block, 0, len)
+    if upper == 0:
+        return (Uint256(0, 0))
+    end
+
+    let (checkpoint: Checkpoint) = ERC20_Snapshot_supply_checkpoints.read(upper - 1)
+    return (checkpoint.value)
+end
+
+#
+# Externals
+#
+
+func ERC20_Snapshot_transfer{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(recipient: felt, amount: Uint256):
+    ERC20_transfer(recipient, amount)
+    let (sender) = get_caller_address()
+    _checkpoint_account(sender)
+    _checkpoint_account(recipient)
+    return ()
+end
+
+func ERC20_Snapshot_transferFrom{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(sender: felt, recipient: felt, amount: Uint256):
+    ERC20_transferFrom(sender, recipient, amount)
+    _checkpoint_account(sender)
+    _checkpoint_account(recipient)
+    return ()
+end
+
+func ERC20_Snapshot_transferBatch{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        amounts_len: felt,
+        amounts: Uint256*
+    ):
+    ERC20_transferBatch(recipients_len, recipients, amounts_len, amounts)
+    let (sender) = get_caller_address()
+    _checkpoint_account(sender)
+    _checkpoint_accounts(recipients_len, recipients)
+    return ()
+end
+
+func ERC20_Snapshot_mint{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(recipient: felt, amount: Uint256):
+    ERC20_mint(recipient, amount)
+    _checkpoint_account(recipient)
+    _checkpoint_supply()
+    return ()
+end
+
+func ERC20_Snapshot_burn{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt, amount: Uint256):
+    ERC20_burn(account, amount)
+    _checkpoint_account(account)
+    _checkpoint_supply()
+    return ()
+end
+
+#
+# Internals
+#
+
+func _assert_past_block{
+        syscall_ptr : felt*,
+        range_check_ptr
+    }(block: felt):
+    let (current_block) = get_block_number()
+    # balances of the current block can still change
+    with_attr error_message("ERC20_Snapshot: block not yet mined"):
+        assert_lt(block, current_block)
+    end
+    return ()
+end
+
+func _checkpoint_account{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt):
+    alloc_locals
+    let (local balance: Uint256) = ERC20_balanceOf(account)
+    let (local block) = get_block_number()
+    let (local len) = ERC20_Snapshot_account_checkpoints_len.read(account)
+    if len == 0:
+        ERC20_Snapshot_account_checkpoints.write(account, 0, Checkpoint(block, balance))
+        ERC20_Snapshot_account_checkpoints_len.write(account, 1)
+        return ()
+    end
+
+    # a block keeps a single checkpoint holding its final balance
+    let (last: Checkpoint) = ERC20_Snapshot_account_checkpoints.read(account, len - 1)
+    if last.block == block:
+        ERC20_Snapshot_account_checkpoints.write(account, len - 1, Checkpoint(block, balance))
+        return ()
+    end
+
+    ERC20_Snapshot_account_checkpoints.write(account, len, Checkpoint(block, balance))
+    ERC20_Snapshot_account_checkpoints_len.write(account, len + 1)
+    return ()
+end
+
+func _checkpoint_accounts{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(accounts_len: felt, accounts: felt*):
+    if accounts_len == 0:
+        return ()
+    end
+
+    _checkpoint_account([accounts])
+    return _checkpoint_accounts(accounts_len - 1, accounts + 1)
+end
+
+func _checkpoint_supply{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }():
+    alloc_locals
+    let (local supply: Uint256) = ERC20_totalSupply()
+    let (local block) = get_block_number()
+    let (local len) = ERC20_Snapshot_supply_checkpoints_len.read()
+    if len == 0:
+        ERC20_Snapshot_supply_checkpoints.write(0, Checkpoint(block, supply))
+        ERC20_Snapshot_supply_checkpoints_len.write(1)
+        return ()
+    end
+
+    let (last: Checkpoint) = ERC20_Snapshot_supply_checkpoints.read(len - 1)
+    if last.block == block:
+        ERC20_Snapshot_supply_checkpoints.write(len - 1, Checkpoint(block, supply))
+        return ()
+    end
+
+    ERC20_Snapshot_supply_checkpoints.write(len, Checkpoint(block, supply))
+    ERC20_Snapshot_supply_checkpoints_len.write(len + 1)
+    return ()
+end
+
+# Binary search for the first checkpoint in [low, high) written after `block`,
+# returns `high` if there is none
+func _account_upper_bound{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(account: felt, block: felt, low: felt, high: felt) -> (index: felt):
+    alloc_locals
+    if low == high:
+        return (low)
+    end
+
+    let (local mid, _) = unsigned_div_rem(low + high, 2)
+    let (checkpoint: Checkpoint) = ERC20_Snapshot_account_checkpoints.read(account, mid)
+    let (is_before) = is_le(checkpoint.block, block)
+    if is_before == TRUE:
+        return _account_upper_bound(account, block, mid + 1, high)
+    end
+    return _account_upper_bound(account, block, low, mid)
+end
+
+func _supply_upper_bound{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(block: felt, low: felt, high: felt) -> (index: felt):
+    alloc_locals
+    if low == high:
+        return (low)
+    end
+
+    let (local mid, _) = unsigned_div_rem(low + high, 2)
+    let (checkpoint: Checkpoint) = ERC20_Snapshot_supply_checkpoints.read(mid)
+    let (is_before) = is_le(checkpoint.block, block)
+    if is_before == TRUE:
+        return _supply_upper_bound(block, mid + 1, high)
+    end
+    return _supply_upper_bound(block, low, mid)
+end
@@ -13,17 +13,26 @@ from openzeppelin.token.erc721.library import (
     ERC721_ownerOf,
     ERC721_getApproved,
     ERC721_isApprovedForAll,
+    ERC721_ownerOfBatch,
+    ERC721_getApprovedBatch,
+    ERC721_isApprovedForAllBatch,
     ERC721_tokenURI,
+    ERC721_tokenURIFromBase,
+    ERC721_baseURI,
 
     ERC721_initializer,
     ERC721_approve, 
     ERC721_setApprovalForAll, 
     ERC721_transferFrom,
     ERC721_safeTransferFrom,
+    ERC721_transferFromBatch,
+    ERC721_safeTransferFromBatch,
     ERC721_mint,
     ERC721_burn,
+    ERC721_refreshReceiverCapability,
     ERC721_only_token_owner,
-    ERC721_setTokenURI
+    ERC721_setTokenURI,
+    ERC721_setBaseURI
 )
 
 from openzeppelin.introspection.ERC165 import ERC165_supports_interface
@@ -126,6 +135,43 @@ func isApprovedForAll{
     return (isApproved)
 end
 
+@view
+func ownerOfBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (owners_len: felt, owners: felt*):
+    let (owners_len, owners: felt*) = ERC721_ownerOfBatch(tokenIds_len, tokenIds)
+    return (owners_len, owners)
+end
+
+@view
+func getApprovedBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (approved_len: felt, approved: felt*):
+    let (approved_len, approved: felt*) = ERC721_getApprovedBatch(tokenIds_len, tokenIds)
+    return (approved_len, approved)
+end
+
+@view
+func isApprovedForAllBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        operators_len: felt,
+        operators: felt*
+    ) -> (isApproved_len: felt, isApproved: felt*):
+    let (isApproved_len, isApproved: felt*) = ERC721_isApprovedForAllBatch(
+        owners_len, owners, operators_len, operators
+    )
+    return (isApproved_len, isApproved)
+end
+
 @view
 func tokenURI{
         syscall_ptr: felt*, 
@@ -136,6 +182,26 @@ func tokenURI{
     return (tokenURI)
 end
 
+@view
+func tokenURIFromBase{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(tokenId: Uint256) -> (tokenURI_len: felt, tokenURI: felt*):
+    let (tokenURI_len, tokenURI) = ERC721_tokenURIFromBase(tokenId)
+    return (tokenURI_len, tokenURI)
+end
+
+@view
+func baseURI{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }() -> (baseURI_len: felt, baseURI: felt*):
+    let (baseURI_len, baseURI) = ERC721_baseURI()
+    return (baseURI_len, baseURI)
+end
+
 
 #
 # Externals
@@ -191,6 +257,48 @@ func safeTransferFrom{
     return ()
 end
 
+@external
+func transferFromBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenIds_len: felt,
+        tokenIds: Uint256*
+    ):
+    ERC721_transferFromBatch(from_, to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func safeTransferFromBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        data_len: felt, 
+        data: felt*
+    ):
+    ERC721_safeTransferFromBatch(from_, to, tokenIds_len, tokenIds, data_len, data)
+    return ()
+end
+
+@external
+func refreshReceiverCapability{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(account: felt):
+    ERC721_refreshReceiverCapability(account)
+    return ()
+end
+
 @external
 func setTokenURI{
         pedersen_ptr: HashBuiltin*, 
@@ -202,6 +310,17 @@ func setTokenURI{
     return ()
 end
 
+@external
+func setBaseURI{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(baseURI_len: felt, baseURI: felt*):
+    Ownable_only_owner()
+    ERC721_setBaseURI(baseURI_len, baseURI)
+    return ()
+end
+
 @external
 func mint{
         pedersen_ptr: HashBuiltin*, 
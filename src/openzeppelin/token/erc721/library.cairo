@@ -5,14 +5,17 @@
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin
 from starkware.starknet.common.syscalls import get_caller_address
-from starkware.cairo.common.math import assert_not_zero, assert_not_equal
+from starkware.cairo.common.math import (
+    assert_not_zero, assert_not_equal, unsigned_div_rem
+)
+from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE, FALSE
-from starkware.cairo.common.uint256 import Uint256, uint256_check
+from starkware.cairo.common.uint256 import Uint256, uint256_check, uint256_unsigned_div_rem
 
 from openzeppelin.security.safemath import (
-    uint256_checked_add,
-    uint256_checked_sub_le
+    uint256_add_nocheck_inputs,
+    uint256_sub_le_nocheck_inputs
 )
 
 from openzeppelin.introspection.ERC165 import ERC165_register_interface
@@ -25,6 +28,14 @@ from openzeppelin.utils.constants import (
     IERC721_ID, IERC721_METADATA_ID, IERC721_RECEIVER_ID, IACCOUNT_ID
 )
 
+# Cached ways a safe transfer recipient can accept tokens
+const ERC721_RECEIVER_UNKNOWN = 0
+const ERC721_RECEIVER_IMPLEMENTER = 1
+const ERC721_RECEIVER_ACCOUNT = 2
+
+# Decimal digits of a token id held by each short string of a token URI
+const ERC721_URI_DIGITS_PER_FELT = 31
+
 #
 # Events
 #
@@ -73,6 +84,18 @@ end
 func ERC721_token_uri(token_id: Uint256) -> (token_uri: felt):
 end
 
+@storage_var
+func ERC721_base_uri_len() -> (len: felt):
+end
+
+@storage_var
+func ERC721_base_uri(index: felt) -> (res: felt):
+end
+
+@storage_var
+func ERC721_receiver_capability(account: felt) -> (capability: felt):
+end
+
 #
 # Constructor
 #
@@ -167,6 +190,53 @@ func ERC721_isApprovedForAll{
     return (is_approved)
 end
 
+# Owner of each of `token_ids`, in the same order, reverting like
+# ERC721_ownerOf if one doesn't exist
+func ERC721_ownerOfBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*) -> (owners_len: felt, owners: felt*):
+    alloc_locals
+    let (local owners: felt*) = alloc()
+    _owners_of(token_ids_len, token_ids, owners)
+    return (token_ids_len, owners)
+end
+
+# Approved address of each of `token_ids`, in the same order, reverting like
+# ERC721_getApproved if one doesn't exist
+func ERC721_getApprovedBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*) -> (approved_len: felt, approved: felt*):
+    alloc_locals
+    let (local approved: felt*) = alloc()
+    _approved_of(token_ids_len, token_ids, approved)
+    return (token_ids_len, approved)
+end
+
+# Whether `operators[i]` is an operator of `owners[i]`, for every `i`
+func ERC721_isApprovedForAllBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        operators_len: felt,
+        operators: felt*
+    ) -> (is_approved_len: felt, is_approved: felt*):
+    alloc_locals
+    with_attr error_message("ERC721: owners and operators lengths differ"):
+        assert owners_len = operators_len
+    end
+
+    let (local is_approved: felt*) = alloc()
+    _operator_approvals_of(owners_len, owners, operators, is_approved)
+    return (owners_len, is_approved)
+end
+
 func ERC721_tokenURI{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
@@ -182,6 +252,62 @@ func ERC721_tokenURI{
     return (token_uri)
 end
 
+func ERC721_baseURI{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }() -> (base_uri_len: felt, base_uri: felt*):
+    alloc_locals
+    let (local base_uri) = alloc()
+    let (base_uri_len) = ERC721_base_uri_len.read()
+    _read_base_uri(0, base_uri_len, base_uri)
+    return (base_uri_len, base_uri)
+end
+
+# Token URI as an array of short strings: the URI set for `token_id` if any,
+# else the base URI followed by the decimal `token_id`, else an empty array
+func ERC721_tokenURIFromBase{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (token_uri_len: felt, token_uri: felt*):
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (exists) = _exists(token_id)
+    with_attr error_message("ERC721_Metadata: URI query for nonexistent token"):
+        assert exists = TRUE
+    end
+
+    let (token_uri_len, token_uri: felt*) = ERC721_existingTokenURIFromBase(token_id)
+    return (token_uri_len, token_uri)
+end
+
+# Same as `ERC721_tokenURIFromBase`, for extensions that already checked that
+# `token_id` is a valid Uint256 which exists
+func ERC721_existingTokenURIFromBase{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (token_uri_len: felt, token_uri: felt*):
+    alloc_locals
+    let (local token_uri) = alloc()
+    let (stored_uri) = ERC721_token_uri.read(token_id)
+    if stored_uri != 0:
+        assert token_uri[0] = stored_uri
+        return (1, token_uri)
+    end
+
+    let (local base_uri_len) = ERC721_base_uri_len.read()
+    if base_uri_len == 0:
+        return (0, token_uri)
+    end
+
+    _read_base_uri(0, base_uri_len, token_uri)
+    let (digits_len) = _write_decimal(token_id, token_uri + base_uri_len)
+    return (base_uri_len + digits_len, token_uri)
+end
+
 #
 # Externals
 #
@@ -203,6 +329,9 @@ func ERC721_approve{
 
     # Ensures 'owner' does not equal 'to'
     let (owner) = ERC721_owners.read(token_id)
+    with_attr error_message("ERC721: owner query for nonexistent token"):
+        assert_not_zero(owner)
+    end
     with_attr error_message("ERC721: approval to current owner"):
         assert_not_equal(owner, to)
     end
@@ -210,14 +339,14 @@ func ERC721_approve{
     # Checks that either caller equals owner or
     # caller isApprovedForAll on behalf of owner
     if caller == owner:
-        _approve(to, token_id)
+        _approve(owner, to, token_id)
         return ()
     else:
         let (is_approved) = ERC721_operator_approvals.read(owner, caller)
         with_attr error_message("ERC721: approve caller is not owner nor approved for all"):
             assert_not_zero(is_approved)
         end
-        _approve(to, token_id)
+        _approve(owner, to, token_id)
         return ()
     end
 end
@@ -258,21 +387,9 @@ func ERC721_transferFrom{
         range_check_ptr
     }(from_: felt, to: felt, token_id: Uint256):
     alloc_locals
-    with_attr error_message("ERC721: token_id is not a valid Uint256"):
-        uint256_check(token_id)
-    end
-    let (caller) = get_caller_address()
-    let (is_approved) = _is_approved_or_owner(caller, token_id)
-    with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
-        assert_not_zero(caller * is_approved)
-    end
-    # Note that if either `is_approved` or `caller` equals `0`,
-    # then this method should fail.
-    # The `caller` address and `is_approved` boolean are both field elements
-    # meaning that a*0==0 for all a in the field,
-    # therefore a*b==0 implies that at least one of a,b is zero in the field
-
-    _transfer(from_, to, token_id)
+    let (local from_balance: Uint256) = ERC721_balances.read(from_)
+    let (to_balance: Uint256) = ERC721_balances.read(to)
+    ERC721_transferFromWithBalances(from_, to, token_id, from_balance, to_balance)
     return ()
 end
 
@@ -288,21 +405,116 @@ func ERC721_safeTransferFrom{
         data: felt*
     ):
     alloc_locals
-    with_attr error_message("ERC721: token_id is not a valid Uint256"):
-        uint256_check(token_id)
-    end
-    let (caller) = get_caller_address()
-    let (is_approved) = _is_approved_or_owner(caller, token_id)
+    let (local from_balance: Uint256) = ERC721_balances.read(from_)
+    let (to_balance: Uint256) = ERC721_balances.read(to)
+    ERC721_safeTransferFromWithBalances(
+        from_, to, token_id, data_len, data, from_balance, to_balance
+    )
+    return ()
+end
+
+# Same as `ERC721_transferFrom`, for extensions that already read the balances
+# of `from_` and `to`. They must be passed as read, before any change.
+func ERC721_transferFromWithBalances{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_id: Uint256,
+        from_balance: Uint256,
+        to_balance: Uint256
+    ):
+    alloc_locals
+    let (local owner, local approved) = _approved_owner(token_id)
+    _transfer(owner, approved, from_, to, token_id, from_balance, to_balance)
+    return ()
+end
+
+# Same as `ERC721_safeTransferFrom`, for extensions that already read the
+# balances of `from_` and `to`. They must be passed as read, before any change.
+func ERC721_safeTransferFromWithBalances{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_id: Uint256,
+        data_len: felt,
+        data: felt*,
+        from_balance: Uint256,
+        to_balance: Uint256
+    ):
+    alloc_locals
+    let (local owner, local approved) = _approved_owner(token_id)
+    _safe_transfer(owner, approved, from_, to, token_id, data_len, data, from_balance, to_balance)
+    return ()
+end
+
+# Transfers every token of `token_ids` from `from_` to `to`, adjusting
+# both balances once for the whole batch
+func ERC721_transferFromBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    alloc_locals
+    let (local caller) = get_caller_address()
     with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
-        assert_not_zero(caller * is_approved)
+        assert_not_zero(caller)
+    end
+    with_attr error_message("ERC721: cannot transfer to the zero address"):
+        assert_not_zero(to)
     end
-    # Note that if either `is_approved` or `caller` equals `0`,
-    # then this method should fail.
-    # The `caller` address and `is_approved` boolean are both field elements
-    # meaning that a*0==0 for all a in the field,
-    # therefore a*b==0 implies that at least one of a,b is zero in the field
 
-    _safe_transfer(from_, to, token_id, data_len, data)
+    # owners and operators are approved for every token, others are checked per token
+    let (is_operator) = _is_owner_or_operator(caller, from_)
+    _transfer_batch(caller, is_operator, from_, to, token_ids_len, token_ids)
+
+    if from_ == to:
+        return ()
+    end
+
+    let (from_balance: Uint256) = ERC721_balances.read(from_)
+    let (new_balance: Uint256) = uint256_sub_le_nocheck_inputs(from_balance, Uint256(token_ids_len, 0))
+    ERC721_balances.write(from_, new_balance)
+
+    let (to_balance: Uint256) = ERC721_balances.read(to)
+    let (new_balance: Uint256) = uint256_add_nocheck_inputs(to_balance, Uint256(token_ids_len, 0))
+    ERC721_balances.write(to, new_balance)
+    return ()
+end
+
+# Same as `ERC721_transferFromBatch`, but `to` must accept the tokens. The
+# receiver is called once for the batch, with its first token id.
+func ERC721_safeTransferFromBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    ERC721_transferFromBatch(from_, to, token_ids_len, token_ids)
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (success) = _check_onERC721Received(from_, to, [token_ids], data_len, data)
+    with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
+        assert_not_zero(success)
+    end
     return ()
 end
 
@@ -325,7 +537,7 @@ func ERC721_mint{
     end
 
     let (balance: Uint256) = ERC721_balances.read(to)
-    let (new_balance: Uint256) = uint256_checked_add(balance, Uint256(1, 0))
+    let (new_balance: Uint256) = uint256_add_nocheck_inputs(balance, Uint256(1, 0))
     ERC721_balances.write(to, new_balance)
     ERC721_owners.write(token_id, to)
     Transfer.emit(0, to, token_id)
@@ -338,22 +550,56 @@ func ERC721_burn{
         range_check_ptr
     }(token_id: Uint256):
     alloc_locals
-    with_attr error_message("ERC721: token_id is not a valid Uint256"):
-        uint256_check(token_id)
+    let (local owner) = ERC721_ownerOf(token_id)
+    let (balance: Uint256) = ERC721_balances.read(owner)
+    ERC721_burnWithBalance(owner, balance, token_id)
+    return ()
+end
+
+# Same as `ERC721_burn`, for extensions that already read the owner of
+# `token_id` and its balance
+func ERC721_burnWithBalance{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(owner: felt, balance: Uint256, token_id: Uint256):
+    # Decrease owner balance
+    let (new_balance: Uint256) = uint256_sub_le_nocheck_inputs(balance, Uint256(1, 0))
+    ERC721_balances.write(owner, new_balance)
+
+    _burn(owner, token_id)
+    return ()
+end
+
+# Mints every token of `token_ids` to `to`, increasing its balance once
+func ERC721_mintBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+    with_attr error_message("ERC721: cannot mint to the zero address"):
+        assert_not_zero(to)
     end
-    let (owner) = ERC721_ownerOf(token_id)
+    _mint_batch(to, token_ids_len, token_ids)
 
-    # Clear approvals
-    _approve(0, token_id)
+    let (balance: Uint256) = ERC721_balances.read(to)
+    let (new_balance: Uint256) = uint256_add_nocheck_inputs(balance, Uint256(token_ids_len, 0))
+    ERC721_balances.write(to, new_balance)
+    return ()
+end
+
+# Burns every token of `token_ids`, which must all belong to `owner`,
+# decreasing its balance once
+func ERC721_burnBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+    _burn_batch(owner, token_ids_len, token_ids)
 
-    # Decrease owner balance
     let (balance: Uint256) = ERC721_balances.read(owner)
-    let (new_balance: Uint256) = uint256_checked_sub_le(balance, Uint256(1, 0))
+    let (new_balance: Uint256) = uint256_sub_le_nocheck_inputs(balance, Uint256(token_ids_len, 0))
     ERC721_balances.write(owner, new_balance)
-
-    # Delete owner
-    ERC721_owners.write(token_id, 0)
-    Transfer.emit(owner, 0, token_id)
     return ()
 end
 
@@ -385,6 +631,28 @@ func ERC721_safeMint{
     return ()
 end
 
+func ERC721_setBaseURI{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(base_uri_len: felt, base_uri: felt*):
+    ERC721_base_uri_len.write(base_uri_len)
+    _write_base_uri(0, base_uri_len, base_uri)
+    return ()
+end
+
+# Introspects `account` again and caches how it can accept safe transfers,
+# e.g. after it was upgraded
+func ERC721_refreshReceiverCapability{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(account: felt):
+    let (capability) = _introspect_receiver(account)
+    ERC721_receiver_capability.write(account, capability)
+    return ()
+end
+
 func ERC721_only_token_owner{
         pedersen_ptr: HashBuiltin*,
         syscall_ptr: felt*,
@@ -423,36 +691,83 @@ func _approve{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr
-    }(to: felt, token_id: Uint256):
+    }(owner: felt, to: felt, token_id: Uint256):
     ERC721_token_approvals.write(token_id, to)
-    let (owner) = ERC721_ownerOf(token_id)
     Approval.emit(owner, to, token_id)
     return ()
 end
 
-func _is_approved_or_owner{
-        pedersen_ptr: HashBuiltin*,
+# Same as `_approve(owner, 0, token_id)`, but skips both the write and the
+# Approval event if nothing is approved. `approved` is the current approval
+# of `token_id`, as read by the caller.
+func _clear_approval{
         syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
         range_check_ptr
-    }(spender: felt, token_id: Uint256) -> (res: felt):
-    alloc_locals
+    }(owner: felt, token_id: Uint256, approved: felt):
+    if approved == 0:
+        return ()
+    end
 
-    let (exists) = _exists(token_id)
+    ERC721_token_approvals.write(token_id, 0)
+    Approval.emit(owner, 0, token_id)
+    return ()
+end
+
+# Owner of `token_id`, reverting if it doesn't exist
+func _existing_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    let (owner) = ERC721_owners.read(token_id)
     with_attr error_message("ERC721: token id does not exist"):
-        assert exists = TRUE
+        assert_not_zero(owner)
     end
+    return (owner)
+end
 
-    let (owner) = ERC721_ownerOf(token_id)
+# Owner and approval of `token_id`, reverting unless the caller may transfer it
+func _approved_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt, approved: felt):
+    alloc_locals
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (caller) = get_caller_address()
+    # the owner and approval are read once here and passed down
+    let (local owner) = _existing_owner(token_id)
+    let (local approved) = ERC721_token_approvals.read(token_id)
+    let (is_approved) = _is_approved_or_owner(caller, owner, approved)
+    with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
+        assert_not_zero(caller * is_approved)
+    end
+    # Note that if either `is_approved` or `caller` equals `0`,
+    # then this method should fail.
+    # The `caller` address and `is_approved` boolean are both field elements
+    # meaning that a*0==0 for all a in the field,
+    # therefore a*b==0 implies that at least one of a,b is zero in the field
+    return (owner, approved)
+end
+
+# `approved` is the current approval of the token
+func _is_approved_or_owner{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(spender: felt, owner: felt, approved: felt) -> (res: felt):
     if owner == spender:
         return (TRUE)
     end
 
-    let (approved_addr) = ERC721_getApproved(token_id)
-    if approved_addr == spender:
+    if approved == spender:
         return (TRUE)
     end
 
-    let (is_operator) = ERC721_isApprovedForAll(owner, spender)
+    let (is_operator) = ERC721_operator_approvals.read(owner, spender)
     if is_operator == TRUE:
         return (TRUE)
     end
@@ -460,6 +775,19 @@ func _is_approved_or_owner{
     return (FALSE)
 end
 
+func _is_owner_or_operator{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(spender: felt, owner: felt) -> (res: felt):
+    if owner == spender:
+        return (TRUE)
+    end
+
+    let (is_operator) = ERC721_operator_approvals.read(owner, spender)
+    return (is_operator)
+end
+
 func _exists{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
@@ -474,15 +802,125 @@ func _exists{
     end
 end
 
+func _owners_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, owners: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (owner) = ERC721_ownerOf([token_ids])
+    assert [owners] = owner
+    return _owners_of(token_ids_len - 1, token_ids + Uint256.SIZE, owners + 1)
+end
+
+func _approved_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, approved: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_approved) = ERC721_getApproved([token_ids])
+    assert [approved] = token_approved
+    return _approved_of(token_ids_len - 1, token_ids + Uint256.SIZE, approved + 1)
+end
+
+func _operator_approvals_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owners_len: felt, owners: felt*, operators: felt*, is_approved: felt*):
+    if owners_len == 0:
+        return ()
+    end
+
+    let (res) = ERC721_operator_approvals.read(owner=[owners], operator=[operators])
+    assert [is_approved] = res
+    return _operator_approvals_of(owners_len - 1, owners + 1, operators + 1, is_approved + 1)
+end
+
+func _mint_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (exists) = _exists(token_id)
+    with_attr error_message("ERC721: token already minted"):
+        assert exists = FALSE
+    end
+
+    ERC721_owners.write(token_id, to)
+    Transfer.emit(0, to, token_id)
+    return _mint_batch(to, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _burn_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (token_owner) = _existing_owner(token_id)
+    with_attr error_message("ERC721: burn from incorrect owner"):
+        assert token_owner = owner
+    end
+
+    _burn(owner, token_id)
+    return _burn_batch(owner, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+# Deletes `token_id` and its approval, leaving the balance of `owner` to the caller
+func _burn{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, token_id: Uint256):
+    let (approved) = ERC721_token_approvals.read(token_id)
+    _clear_approval(owner, token_id, approved)
+
+    # Delete owner
+    ERC721_owners.write(token_id, 0)
+    Transfer.emit(owner, 0, token_id)
+    return ()
+end
+
+# Moves `token_id` given the balances of `from_` and `to` before the transfer
 func _transfer{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr
-    }(from_: felt, to: felt, token_id: Uint256):
-    # ownerOf ensures 'from_' is not the zero address
-    let (_ownerOf) = ERC721_ownerOf(token_id)
+    }(
+        owner: felt,
+        approved: felt,
+        from_: felt,
+        to: felt,
+        token_id: Uint256,
+        from_balance: Uint256,
+        to_balance: Uint256
+    ):
+    # callers ensure 'owner' is not the zero address
     with_attr error_message("ERC721: transfer from incorrect owner"):
-        assert _ownerOf = from_
+        assert owner = from_
     end
 
     with_attr error_message("ERC721: cannot transfer to the zero address"):
@@ -490,17 +928,25 @@ func _transfer{
     end
 
     # Clear approvals
-    _approve(0, token_id)
-
-    # Decrease owner balance
-    let (owner_bal) = ERC721_balances.read(from_)
-    let (new_balance: Uint256) = uint256_checked_sub_le(owner_bal, Uint256(1, 0))
-    ERC721_balances.write(from_, new_balance)
-
-    # Increase receiver balance
-    let (receiver_bal) = ERC721_balances.read(to)
-    let (new_balance: Uint256) = uint256_checked_add(receiver_bal, Uint256(1, 0))
-    ERC721_balances.write(to, new_balance)
+    _clear_approval(owner, token_id, approved)
+
+    # A self-transfer leaves the balance unchanged
+    if from_ != to:
+        # Decrease owner balance
+        let (new_balance: Uint256) = uint256_sub_le_nocheck_inputs(from_balance, Uint256(1, 0))
+        ERC721_balances.write(from_, new_balance)
+
+        # Increase receiver balance
+        let (new_balance: Uint256) = uint256_add_nocheck_inputs(to_balance, Uint256(1, 0))
+        ERC721_balances.write(to, new_balance)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
 
     # Update token_id owner
     ERC721_owners.write(token_id, to)
@@ -508,18 +954,62 @@ func _transfer{
     return ()
 end
 
+# Moves each token of `token_ids` to `to`, leaving balances to the caller
+func _transfer_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        caller: felt,
+        is_operator: felt,
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    alloc_locals
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let token_id = [token_ids]
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (local owner) = _existing_owner(token_id)
+    with_attr error_message("ERC721: transfer from incorrect owner"):
+        assert owner = from_
+    end
+
+    let (local approved) = ERC721_token_approvals.read(token_id)
+    if is_operator == FALSE:
+        with_attr error_message("ERC721: either is not approved or the caller is the zero address"):
+            assert approved = caller
+        end
+    end
+
+    _clear_approval(owner, token_id, approved)
+    ERC721_owners.write(token_id, to)
+    Transfer.emit(from_, to, token_id)
+    return _transfer_batch(caller, is_operator, from_, to, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
 func _safe_transfer{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr
     }(
+        owner: felt,
+        approved: felt,
         from_: felt,
         to: felt,
         token_id: Uint256,
         data_len: felt,
-        data: felt*
+        data: felt*,
+        from_balance: Uint256,
+        to_balance: Uint256
     ):
-    _transfer(from_, to, token_id)
+    _transfer(owner, approved, from_, to, token_id, from_balance, to_balance)
 
     let (success) = _check_onERC721Received(from_, to, token_id, data_len, data)
     with_attr error_message("ERC721: transfer to non ERC721Receiver implementer"):
@@ -539,9 +1029,10 @@ func _check_onERC721Received{
         data_len: felt,
         data: felt*
     ) -> (success: felt):
+    alloc_locals
     let (caller) = get_caller_address()
-    let (is_supported) = IERC165.supportsInterface(to, IERC721_RECEIVER_ID)
-    if is_supported == TRUE:
+    let (capability) = _receiver_capability(to)
+    if capability == ERC721_RECEIVER_IMPLEMENTER:
         let (selector) = IERC721_Receiver.onERC721Received(
             to,
             caller,
@@ -557,6 +1048,113 @@ func _check_onERC721Received{
         return (TRUE)
     end
 
-    let (is_account) = IERC165.supportsInterface(to, IACCOUNT_ID)
-    return (is_account)
+    if capability == ERC721_RECEIVER_ACCOUNT:
+        return (TRUE)
+    end
+    return (FALSE)
+end
+
+# Cached capability of `account`, introspected on the first safe transfer to it
+func _receiver_capability{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(account: felt) -> (capability: felt):
+    alloc_locals
+    let (cached) = ERC721_receiver_capability.read(account)
+    if cached != ERC721_RECEIVER_UNKNOWN:
+        return (cached)
+    end
+
+    let (local capability) = _introspect_receiver(account)
+    # unsupported recipients make the transfer revert, so there is nothing to cache
+    if capability != ERC721_RECEIVER_UNKNOWN:
+        ERC721_receiver_capability.write(account, capability)
+        return (capability)
+    end
+    return (capability)
+end
+
+func _introspect_receiver{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(account: felt) -> (capability: felt):
+    let (is_receiver) = IERC165.supportsInterface(account, IERC721_RECEIVER_ID)
+    if is_receiver == TRUE:
+        return (ERC721_RECEIVER_IMPLEMENTER)
+    end
+
+    let (is_account) = IERC165.supportsInterface(account, IACCOUNT_ID)
+    if is_account == TRUE:
+        return (ERC721_RECEIVER_ACCOUNT)
+    end
+    return (ERC721_RECEIVER_UNKNOWN)
+end
+
+func _read_base_uri{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: felt, base_uri_len: felt, base_uri: felt*):
+    if index == base_uri_len:
+        return ()
+    end
+
+    let (res) = ERC721_base_uri.read(index)
+    assert base_uri[index] = res
+    return _read_base_uri(index + 1, base_uri_len, base_uri)
+end
+
+func _write_base_uri{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(index: felt, base_uri_len: felt, base_uri: felt*):
+    if index == base_uri_len:
+        return ()
+    end
+
+    ERC721_base_uri.write(index, base_uri[index])
+    return _write_base_uri(index + 1, base_uri_len, base_uri)
+end
+
+# Writes `value` in decimal to `res`, most significant digits first, as short
+# strings of ERC721_URI_DIGITS_PER_FELT digits (fewer for the first one)
+func _write_decimal{
+        range_check_ptr
+    }(value: Uint256, res: felt*) -> (res_len: felt):
+    alloc_locals
+    let (local quotient: Uint256, local remainder: Uint256) = uint256_unsigned_div_rem(
+        value, Uint256(10 ** ERC721_URI_DIGITS_PER_FELT, 0)
+    )
+    if quotient.low + quotient.high == 0:
+        let (chunk) = _ascii_digits(remainder.low, 1, 1)
+        assert res[0] = chunk
+        return (1)
+    end
+
+    let (local res_len) = _write_decimal(quotient, res)
+    let (chunk) = _ascii_digits(remainder.low, ERC721_URI_DIGITS_PER_FELT, 1)
+    assert res[res_len] = chunk
+    return (res_len + 1)
+end
+
+# Short string of the decimal `value`, left padded with zeros to `min_digits`.
+# `shift` is the weight of the last character.
+func _ascii_digits{
+        range_check_ptr
+    }(value: felt, min_digits: felt, shift: felt) -> (ascii: felt):
+    alloc_locals
+    let (local quotient, digit) = unsigned_div_rem(value, 10)
+    local char = ('0' + digit) * shift
+    let (min_reached) = is_le(min_digits, 1)
+    if quotient == 0:
+        if min_reached == TRUE:
+            return (char)
+        end
+    end
+
+    let (ascii) = _ascii_digits(quotient, min_digits - 1, shift * 256)
+    return (ascii + char)
 end
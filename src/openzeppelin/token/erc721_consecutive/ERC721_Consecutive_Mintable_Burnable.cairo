@@ -0,0 +1,354 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc721_consecutive/ERC721_Consecutive_Mintable_Burnable.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.token.erc721.library import (
+    ERC721_name,
+    ERC721_symbol,
+    ERC721_balanceOf,
+    ERC721_isApprovedForAll,
+    ERC721_isApprovedForAllBatch,
+    ERC721_baseURI,
+
+    ERC721_initializer,
+    ERC721_setApprovalForAll, 
+    ERC721_refreshReceiverCapability,
+    ERC721_setBaseURI
+)
+
+from openzeppelin.token.erc721_consecutive.library import (
+    ERC721_Consecutive_ownerOf,
+    ERC721_Consecutive_getApproved,
+    ERC721_Consecutive_ownerOfBatch,
+    ERC721_Consecutive_getApprovedBatch,
+    ERC721_Consecutive_tokenURI,
+    ERC721_Consecutive_tokenURIFromBase,
+
+    ERC721_Consecutive_initializer,
+    ERC721_Consecutive_approve,
+    ERC721_Consecutive_transferFrom,
+    ERC721_Consecutive_safeTransferFrom,
+    ERC721_Consecutive_transferFromBatch,
+    ERC721_Consecutive_safeTransferFromBatch,
+    ERC721_Consecutive_mint,
+    ERC721_Consecutive_burn,
+    ERC721_Consecutive_only_token_owner,
+    ERC721_Consecutive_setTokenURI
+)
+
+from openzeppelin.introspection.ERC165 import ERC165_supports_interface
+
+from openzeppelin.access.ownable import (
+    Ownable_initializer,
+    Ownable_only_owner
+)
+
+#
+# Constructor
+#
+
+@constructor
+func constructor{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        name: felt,
+        symbol: felt,
+        owner: felt,
+        recipients_len: felt,
+        recipients: felt*,
+        quantities_len: felt,
+        quantities: felt*
+    ):
+    ERC721_initializer(name, symbol)
+    Ownable_initializer(owner)
+    ERC721_Consecutive_initializer(recipients_len, recipients, quantities_len, quantities)
+    return ()
+end
+
+#
+# Getters
+#
+
+@view
+func supportsInterface{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(interfaceId: felt) -> (success: felt):
+    let (success) = ERC165_supports_interface(interfaceId)
+    return (success)
+end
+
+@view
+func name{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (name: felt):
+    let (name) = ERC721_name()
+    return (name)
+end
+
+@view
+func symbol{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }() -> (symbol: felt):
+    let (symbol) = ERC721_symbol()
+    return (symbol)
+end
+
+@view
+func balanceOf{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt) -> (balance: Uint256):
+    let (balance: Uint256) = ERC721_balanceOf(owner)
+    return (balance)
+end
+
+@view
+func ownerOf{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenId: Uint256) -> (owner: felt):
+    let (owner: felt) = ERC721_Consecutive_ownerOf(tokenId)
+    return (owner)
+end
+
+@view
+func getApproved{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenId: Uint256) -> (approved: felt):
+    let (approved: felt) = ERC721_Consecutive_getApproved(tokenId)
+    return (approved)
+end
+
+@view
+func isApprovedForAll{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, operator: felt) -> (isApproved: felt):
+    let (isApproved: felt) = ERC721_isApprovedForAll(owner, operator)
+    return (isApproved)
+end
+
+@view
+func ownerOfBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (owners_len: felt, owners: felt*):
+    let (owners_len, owners: felt*) = ERC721_Consecutive_ownerOfBatch(tokenIds_len, tokenIds)
+    return (owners_len, owners)
+end
+
+@view
+func getApprovedBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (approved_len: felt, approved: felt*):
+    let (approved_len, approved: felt*) = ERC721_Consecutive_getApprovedBatch(tokenIds_len, tokenIds)
+    return (approved_len, approved)
+end
+
+@view
+func isApprovedForAllBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        operators_len: felt,
+        operators: felt*
+    ) -> (isApproved_len: felt, isApproved: felt*):
+    let (isApproved_len, isApproved: felt*) = ERC721_isApprovedForAllBatch(
+        owners_len, owners, operators_len, operators
+    )
+    return (isApproved_len, isApproved)
+end
+
+@view
+func tokenURI{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(tokenId: Uint256) -> (tokenURI: felt):
+    let (tokenURI: felt) = ERC721_Consecutive_tokenURI(tokenId)
+    return (tokenURI)
+end
+
+@view
+func tokenURIFromBase{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(tokenId: Uint256) -> (tokenURI_len: felt, tokenURI: felt*):
+    let (tokenURI_len, tokenURI) = ERC721_Consecutive_tokenURIFromBase(tokenId)
+    return (tokenURI_len, tokenURI)
+end
+
+@view
+func baseURI{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }() -> (baseURI_len: felt, baseURI: felt*):
+    let (baseURI_len, baseURI) = ERC721_baseURI()
+    return (baseURI_len, baseURI)
+end
+
+
+#
+# Externals
+#
+
+@external
+func approve{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, tokenId: Uint256):
+    ERC721_Consecutive_approve(to, tokenId)
+    return ()
+end
+
+@external
+func setApprovalForAll{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(operator: felt, approved: felt):
+    ERC721_setApprovalForAll(operator, approved)
+    return ()
+end
+
+@external
+func transferFrom{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenId: Uint256
+    ):
+    ERC721_Consecutive_transferFrom(from_, to, tokenId)
+    return ()
+end
+
+@external
+func safeTransferFrom{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenId: Uint256,
+        data_len: felt, 
+        data: felt*
+    ):
+    ERC721_Consecutive_safeTransferFrom(from_, to, tokenId, data_len, data)
+    return ()
+end
+
+@external
+func transferFromBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenIds_len: felt,
+        tokenIds: Uint256*
+    ):
+    ERC721_Consecutive_transferFromBatch(from_, to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func safeTransferFromBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        from_: felt, 
+        to: felt, 
+        tokenIds_len: felt,
+        tokenIds: Uint256*,
+        data_len: felt, 
+        data: felt*
+    ):
+    ERC721_Consecutive_safeTransferFromBatch(from_, to, tokenIds_len, tokenIds, data_len, data)
+    return ()
+end
+
+@external
+func refreshReceiverCapability{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(account: felt):
+    ERC721_refreshReceiverCapability(account)
+    return ()
+end
+
+@external
+func setTokenURI{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(tokenId: Uint256, tokenURI: felt):
+    Ownable_only_owner()
+    ERC721_Consecutive_setTokenURI(tokenId, tokenURI)
+    return ()
+end
+
+@external
+func setBaseURI{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(baseURI_len: felt, baseURI: felt*):
+    Ownable_only_owner()
+    ERC721_setBaseURI(baseURI_len, baseURI)
+    return ()
+end
+
+@external
+func mint{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, tokenId: Uint256):
+    Ownable_only_owner()
+    ERC721_Consecutive_mint(to, tokenId)
+    return ()
+end
+
+@external
+func burn{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(tokenId: Uint256):
+    ERC721_Consecutive_only_token_owner(tokenId)
+    ERC721_Consecutive_burn(tokenId)
+    return ()
+end
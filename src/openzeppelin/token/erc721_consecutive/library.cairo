@@ -0,0 +1,526 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (token/erc721_consecutive/library.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
+from starkware.cairo.common.math import assert_not_zero, assert_le
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.uint256 import Uint256, uint256_check
+
+from openzeppelin.security.safemath import uint256_add_nocheck_inputs
+
+from openzeppelin.token.erc721.library import (
+    ERC721_owners,
+    ERC721_balances,
+    ERC721_token_approvals,
+    ERC721_token_uri,
+
+    ERC721_existingTokenURIFromBase,
+    ERC721_approve,
+    ERC721_transferFrom,
+    ERC721_safeTransferFrom,
+    ERC721_transferFromBatch,
+    ERC721_safeTransferFromBatch,
+    ERC721_mint,
+    ERC721_burn,
+    ERC721_setTokenURI
+)
+
+# Largest batch of the initializer, which bounds the backwards scan of ownerOf
+# to ERC721_CONSECUTIVE_MAX_BATCH - 1 storage reads
+const ERC721_CONSECUTIVE_MAX_BATCH = 500
+
+#
+# Events
+#
+
+# EIP-2309
+@event
+func ConsecutiveTransfer(fromTokenId: Uint256, toTokenId: Uint256, fromAddress: felt, toAddress: felt):
+end
+
+#
+# Storage
+#
+
+# Consecutive token ids are [0, ERC721_Consecutive_next_id)
+@storage_var
+func ERC721_Consecutive_next_id() -> (token_id: felt):
+end
+
+@storage_var
+func ERC721_Consecutive_burned(token_id: felt) -> (burned: felt):
+end
+
+@storage_var
+func ERC721_Consecutive_initialized() -> (initialized: felt):
+end
+
+#
+# Constructor
+#
+
+# Mints `quantities[i]` consecutive token ids to `recipients[i]` for every `i`,
+# starting from token id zero. Only the owner of the first token of each batch
+# is written, the others are resolved by ownerOf.
+# Can only be called once, and ERC721_Consecutive_mint only afterwards, so that
+# batches never cover an id minted individually.
+func ERC721_Consecutive_initializer{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        quantities_len: felt,
+        quantities: felt*
+    ):
+    let (initialized) = ERC721_Consecutive_initialized.read()
+    with_attr error_message("ERC721_Consecutive: already initialized"):
+        assert initialized = FALSE
+    end
+
+    with_attr error_message("ERC721_Consecutive: recipients and quantities lengths differ"):
+        assert recipients_len = quantities_len
+    end
+
+    _mint_consecutive(0, recipients_len, recipients, quantities)
+    ERC721_Consecutive_initialized.write(TRUE)
+    return ()
+end
+
+#
+# Getters
+#
+
+func ERC721_Consecutive_ownerOf{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (owner) = _owner_of(token_id)
+    with_attr error_message("ERC721: owner query for nonexistent token"):
+        assert_not_zero(owner)
+    end
+    return (owner)
+end
+
+func ERC721_Consecutive_getApproved{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (approved: felt):
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (owner) = _owner_of(token_id)
+    with_attr error_message("ERC721: approved query for nonexistent token"):
+        assert_not_zero(owner)
+    end
+
+    # a token without an owner of its own was never approved
+    let (approved) = ERC721_token_approvals.read(token_id)
+    return (approved)
+end
+
+func ERC721_Consecutive_ownerOfBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*) -> (owners_len: felt, owners: felt*):
+    alloc_locals
+    let (local owners: felt*) = alloc()
+    _owners_of(token_ids_len, token_ids, owners)
+    return (token_ids_len, owners)
+end
+
+func ERC721_Consecutive_getApprovedBatch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*) -> (approved_len: felt, approved: felt*):
+    alloc_locals
+    let (local approved: felt*) = alloc()
+    _approved_of(token_ids_len, token_ids, approved)
+    return (token_ids_len, approved)
+end
+
+func ERC721_Consecutive_tokenURI{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (token_uri: felt):
+    let (owner) = _owner_of(token_id)
+    with_attr error_message("ERC721_Metadata: URI query for nonexistent token"):
+        assert_not_zero(owner)
+    end
+
+    # if tokenURI is not set, it will return 0
+    let (token_uri) = ERC721_token_uri.read(token_id)
+    return (token_uri)
+end
+
+func ERC721_Consecutive_tokenURIFromBase{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (token_uri_len: felt, token_uri: felt*):
+    with_attr error_message("ERC721: token_id is not a valid Uint256"):
+        uint256_check(token_id)
+    end
+    let (owner) = _owner_of(token_id)
+    with_attr error_message("ERC721_Metadata: URI query for nonexistent token"):
+        assert_not_zero(owner)
+    end
+
+    let (token_uri_len, token_uri: felt*) = ERC721_existingTokenURIFromBase(token_id)
+    return (token_uri_len, token_uri)
+end
+
+#
+# Externals
+#
+
+# The externals below write the owner a consecutive token resolves to, and the
+# one of the next token when it changes hands, then defer to ERC721
+
+func ERC721_Consecutive_approve{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256):
+    _materialize_owner(token_id)
+    ERC721_approve(to, token_id)
+    return ()
+end
+
+func ERC721_Consecutive_transferFrom{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(from_: felt, to: felt, token_id: Uint256):
+    _materialize(token_id)
+    ERC721_transferFrom(from_, to, token_id)
+    return ()
+end
+
+func ERC721_Consecutive_safeTransferFrom{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_id: Uint256,
+        data_len: felt,
+        data: felt*
+    ):
+    _materialize(token_id)
+    ERC721_safeTransferFrom(from_, to, token_id, data_len, data)
+    return ()
+end
+
+func ERC721_Consecutive_transferFromBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(from_: felt, to: felt, token_ids_len: felt, token_ids: Uint256*):
+    _materialize_batch(token_ids_len, token_ids)
+    ERC721_transferFromBatch(from_, to, token_ids_len, token_ids)
+    return ()
+end
+
+func ERC721_Consecutive_safeTransferFromBatch{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(
+        from_: felt,
+        to: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*,
+        data_len: felt,
+        data: felt*
+    ):
+    _materialize_batch(token_ids_len, token_ids)
+    ERC721_safeTransferFromBatch(from_, to, token_ids_len, token_ids, data_len, data)
+    return ()
+end
+
+func ERC721_Consecutive_mint{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(to: felt, token_id: Uint256):
+    let (initialized) = ERC721_Consecutive_initialized.read()
+    with_attr error_message("ERC721_Consecutive: not initialized"):
+        assert initialized = TRUE
+    end
+
+    # ERC721 only knows about the consecutive tokens with an owner of their own
+    let (owner) = _owner_of(token_id)
+    with_attr error_message("ERC721: token already minted"):
+        assert owner = 0
+    end
+
+    ERC721_mint(to, token_id)
+    return ()
+end
+
+func ERC721_Consecutive_burn{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256):
+    _materialize(token_id)
+
+    # make sure ownerOf doesn't resolve it from a previous token
+    let (is_consecutive) = _is_consecutive(token_id)
+    if is_consecutive == TRUE:
+        ERC721_Consecutive_burned.write(token_id.low, TRUE)
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    else:
+        tempvar syscall_ptr = syscall_ptr
+        tempvar pedersen_ptr = pedersen_ptr
+        tempvar range_check_ptr = range_check_ptr
+    end
+
+    ERC721_burn(token_id)
+    return ()
+end
+
+func ERC721_Consecutive_only_token_owner{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256):
+    let (caller) = get_caller_address()
+    let (owner) = ERC721_Consecutive_ownerOf(token_id)
+    # Note `ERC721_Consecutive_ownerOf` checks that the owner is not the zero address
+    with_attr error_message("ERC721: caller is not the token owner"):
+        assert caller = owner
+    end
+    return ()
+end
+
+func ERC721_Consecutive_setTokenURI{
+        pedersen_ptr: HashBuiltin*,
+        syscall_ptr: felt*,
+        range_check_ptr
+    }(token_id: Uint256, token_uri: felt):
+    _materialize_owner(token_id)
+    ERC721_setTokenURI(token_id, token_uri)
+    return ()
+end
+
+#
+# Internals
+#
+
+func _mint_consecutive{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(first: felt, recipients_len: felt, recipients: felt*, quantities: felt*):
+    if recipients_len == 0:
+        ERC721_Consecutive_next_id.write(first)
+        return ()
+    end
+
+    let to = [recipients]
+    let quantity = [quantities]
+    with_attr error_message("ERC721: cannot mint to the zero address"):
+        assert_not_zero(to)
+    end
+    with_attr error_message("ERC721_Consecutive: invalid batch size"):
+        assert_le(1, quantity)
+        assert_le(quantity, ERC721_CONSECUTIVE_MAX_BATCH)
+    end
+
+    ERC721_owners.write(Uint256(first, 0), to)
+    let (balance: Uint256) = ERC721_balances.read(to)
+    let (new_balance: Uint256) = uint256_add_nocheck_inputs(balance, Uint256(quantity, 0))
+    ERC721_balances.write(to, new_balance)
+    ConsecutiveTransfer.emit(Uint256(first, 0), Uint256(first + quantity - 1, 0), 0, to)
+    return _mint_consecutive(first + quantity, recipients_len - 1, recipients + 1, quantities + 1)
+end
+
+# Owner of `token_id`, or zero if it doesn't exist. Consecutive tokens without
+# an owner of their own belong to the nearest previous token with one.
+func _owner_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    let (owner) = ERC721_owners.read(token_id)
+    if owner != 0:
+        return (owner)
+    end
+
+    let (owner) = _consecutive_owner_of(token_id)
+    return (owner)
+end
+
+# Owner of a token without an owner of its own, or zero if it isn't a
+# consecutive token or was burned
+func _consecutive_owner_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    let (is_consecutive) = _is_consecutive(token_id)
+    if is_consecutive == FALSE:
+        return (0)
+    end
+
+    let (burned) = ERC721_Consecutive_burned.read(token_id.low)
+    if burned == TRUE:
+        return (0)
+    end
+
+    # the first token of a batch always has an owner, so the scan stops within the batch
+    let (owner) = _scan_owner(token_id.low - 1)
+    return (owner)
+end
+
+func _scan_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: felt) -> (owner: felt):
+    let (owner) = ERC721_owners.read(Uint256(token_id, 0))
+    if owner != 0:
+        return (owner)
+    end
+    return _scan_owner(token_id - 1)
+end
+
+func _is_consecutive{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (res: felt):
+    if token_id.high != 0:
+        return (FALSE)
+    end
+
+    let (next_id) = ERC721_Consecutive_next_id.read()
+    let (res) = is_le(token_id.low + 1, next_id)
+    return (res)
+end
+
+# Writes the owner `token_id` resolves to, if it has none of its own, so that
+# ERC721 finds it. Returns zero if `token_id` doesn't exist.
+func _materialize_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256) -> (owner: felt):
+    alloc_locals
+    let (owner) = ERC721_owners.read(token_id)
+    if owner != 0:
+        return (owner)
+    end
+
+    let (local resolved) = _consecutive_owner_of(token_id)
+    if resolved == 0:
+        return (0)
+    end
+
+    ERC721_owners.write(token_id, resolved)
+    return (resolved)
+end
+
+# Same as `_materialize_owner`, also before `token_id` changes hands
+func _materialize{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_id: Uint256):
+    let (owner) = _materialize_owner(token_id)
+    # ERC721 reverts on nonexistent tokens
+    if owner == 0:
+        return ()
+    end
+
+    _materialize_next_owner(owner, token_id)
+    return ()
+end
+
+# Gives the next token the owner it resolved to through `token_id`, unless it
+# already has one or was burned
+func _materialize_next_owner{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(owner: felt, token_id: Uint256):
+    alloc_locals
+    local next_token_id: Uint256 = Uint256(token_id.low + 1, token_id.high)
+    let (is_consecutive) = _is_consecutive(next_token_id)
+    if is_consecutive == FALSE:
+        return ()
+    end
+
+    let (next_owner) = ERC721_owners.read(next_token_id)
+    if next_owner != 0:
+        return ()
+    end
+
+    let (burned) = ERC721_Consecutive_burned.read(next_token_id.low)
+    if burned == TRUE:
+        return ()
+    end
+
+    ERC721_owners.write(next_token_id, owner)
+    return ()
+end
+
+func _materialize_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    _materialize([token_ids])
+    return _materialize_batch(token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _owners_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, owners: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (owner) = ERC721_Consecutive_ownerOf([token_ids])
+    assert [owners] = owner
+    return _owners_of(token_ids_len - 1, token_ids + Uint256.SIZE, owners + 1)
+end
+
+func _approved_of{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(token_ids_len: felt, token_ids: Uint256*, approved: felt*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_approved) = ERC721_Consecutive_getApproved([token_ids])
+    assert [approved] = token_approved
+    return _approved_of(token_ids_len - 1, token_ids + Uint256.SIZE, approved + 1)
+end
@@ -5,6 +5,7 @@
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin
 from starkware.cairo.common.uint256 import Uint256
+from starkware.starknet.common.syscalls import get_caller_address
 
 from openzeppelin.token.erc721.library import (
     ERC721_name,
@@ -13,13 +14,20 @@ from openzeppelin.token.erc721.library import (
     ERC721_ownerOf,
     ERC721_getApproved,
     ERC721_isApprovedForAll,
+    ERC721_ownerOfBatch,
+    ERC721_getApprovedBatch,
+    ERC721_isApprovedForAllBatch,
     ERC721_tokenURI,
+    ERC721_tokenURIFromBase,
+    ERC721_baseURI,
 
     ERC721_initializer,
     ERC721_approve, 
     ERC721_setApprovalForAll,
+    ERC721_refreshReceiverCapability,
     ERC721_only_token_owner,
-    ERC721_setTokenURI
+    ERC721_setTokenURI,
+    ERC721_setBaseURI
 )
 
 from openzeppelin.token.erc721_enumerable.library import (
@@ -27,8 +35,12 @@ from openzeppelin.token.erc721_enumerable.library import (
     ERC721_Enumerable_totalSupply,
     ERC721_Enumerable_tokenByIndex,
     ERC721_Enumerable_tokenOfOwnerByIndex,
+    ERC721_Enumerable_tokensOfOwner,
+    ERC721_Enumerable_tokensByRange,
     ERC721_Enumerable_mint,
     ERC721_Enumerable_burn,
+    ERC721_Enumerable_mintBatch,
+    ERC721_Enumerable_burnBatch,
     ERC721_Enumerable_transferFrom,
     ERC721_Enumerable_safeTransferFrom
 )
@@ -94,6 +106,26 @@ func tokenOfOwnerByIndex{
     return (tokenId)
 end
 
+@view
+func tokensOfOwner{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(owner: felt, offset: Uint256, limit: felt) -> (tokenIds_len: felt, tokenIds: Uint256*):
+    let (tokenIds_len, tokenIds: Uint256*) = ERC721_Enumerable_tokensOfOwner(owner, offset, limit)
+    return (tokenIds_len, tokenIds)
+end
+
+@view
+func tokensByRange{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(offset: Uint256, limit: felt) -> (tokenIds_len: felt, tokenIds: Uint256*):
+    let (tokenIds_len, tokenIds: Uint256*) = ERC721_Enumerable_tokensByRange(offset, limit)
+    return (tokenIds_len, tokenIds)
+end
+
 @view
 func supportsInterface{
         syscall_ptr : felt*,
@@ -164,6 +196,43 @@ func isApprovedForAll{
     return (isApproved)
 end
 
+@view
+func ownerOfBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (owners_len: felt, owners: felt*):
+    let (owners_len, owners: felt*) = ERC721_ownerOfBatch(tokenIds_len, tokenIds)
+    return (owners_len, owners)
+end
+
+@view
+func getApprovedBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*) -> (approved_len: felt, approved: felt*):
+    let (approved_len, approved: felt*) = ERC721_getApprovedBatch(tokenIds_len, tokenIds)
+    return (approved_len, approved)
+end
+
+@view
+func isApprovedForAllBatch{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        owners_len: felt,
+        owners: felt*,
+        operators_len: felt,
+        operators: felt*
+    ) -> (isApproved_len: felt, isApproved: felt*):
+    let (isApproved_len, isApproved: felt*) = ERC721_isApprovedForAllBatch(
+        owners_len, owners, operators_len, operators
+    )
+    return (isApproved_len, isApproved)
+end
+
 @view
 func tokenURI{
         syscall_ptr: felt*, 
@@ -174,6 +243,26 @@ func tokenURI{
     return (tokenURI)
 end
 
+@view
+func tokenURIFromBase{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(tokenId: Uint256) -> (tokenURI_len: felt, tokenURI: felt*):
+    let (tokenURI_len, tokenURI) = ERC721_tokenURIFromBase(tokenId)
+    return (tokenURI_len, tokenURI)
+end
+
+@view
+func baseURI{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }() -> (baseURI_len: felt, baseURI: felt*):
+    let (baseURI_len, baseURI) = ERC721_baseURI()
+    return (baseURI_len, baseURI)
+end
+
 #
 # Externals
 #
@@ -228,6 +317,16 @@ func safeTransferFrom{
     return ()
 end
 
+@external
+func refreshReceiverCapability{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(account: felt):
+    ERC721_refreshReceiverCapability(account)
+    return ()
+end
+
 @external
 func mint{
         pedersen_ptr: HashBuiltin*, 
@@ -250,6 +349,29 @@ func burn{
     return ()
 end
 
+@external
+func mintBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, tokenIds_len: felt, tokenIds: Uint256*):
+    Ownable_only_owner()
+    ERC721_Enumerable_mintBatch(to, tokenIds_len, tokenIds)
+    return ()
+end
+
+@external
+func burnBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(tokenIds_len: felt, tokenIds: Uint256*):
+    # tokens that the caller doesn't own make the batch revert
+    let (caller) = get_caller_address()
+    ERC721_Enumerable_burnBatch(caller, tokenIds_len, tokenIds)
+    return ()
+end
+
 @external
 func setTokenURI{
         pedersen_ptr: HashBuiltin*, 
@@ -260,3 +382,14 @@ func setTokenURI{
     ERC721_setTokenURI(tokenId, tokenURI)
     return ()
 end
+
+@external
+func setBaseURI{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(baseURI_len: felt, baseURI: felt*):
+    Ownable_only_owner()
+    ERC721_setBaseURI(baseURI_len, baseURI)
+    return ()
+end
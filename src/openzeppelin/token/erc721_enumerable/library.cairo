@@ -5,52 +5,54 @@
 
 from starkware.cairo.common.cairo_builtins import HashBuiltin, SignatureBuiltin
 from starkware.starknet.common.syscalls import get_caller_address
-from starkware.cairo.common.math import assert_not_equal
-from starkware.cairo.common.bool import TRUE
-from starkware.cairo.common.uint256 import (
-    Uint256, uint256_lt, uint256_eq, uint256_check
-)
+from starkware.cairo.common.math import assert_not_equal, assert_nn
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.uint256 import Uint256, uint256_check
 
 from openzeppelin.introspection.ERC165 import ERC165_register_interface
 from openzeppelin.utils.constants import IERC721_ENUMERABLE_ID
 
-from openzeppelin.security.safemath import (
-    uint256_checked_add,
-    uint256_checked_sub_le
-)
-
 from openzeppelin.token.erc721.library import (
     ERC721_balanceOf,
     ERC721_ownerOf,
 
-    ERC721_transferFrom,
-    ERC721_safeTransferFrom,
+    ERC721_transferFromWithBalances,
+    ERC721_safeTransferFromWithBalances,
     ERC721_mint,
-    ERC721_burn
+    ERC721_burnWithBalance,
+    ERC721_mintBatch,
+    ERC721_burnBatch
 )
 
 #
 # Storage
 #
 
+# Indices are stored as felts, as no collection holds 2^128 tokens.
+# They are still exposed as Uint256. The `_felt` suffix keeps these
+# layouts apart from the Uint256-indexed ones of previous versions, which
+# contracts upgrading onto this library don't carry over.
+
 @storage_var
-func ERC721_Enumerable_all_tokens_len() -> (res: Uint256):
+func ERC721_Enumerable_all_tokens_len_felt() -> (res: felt):
 end
 
 @storage_var
-func ERC721_Enumerable_all_tokens(index: Uint256) -> (token_id: Uint256):
+func ERC721_Enumerable_all_tokens_felt(index: felt) -> (token_id: Uint256):
 end
 
 @storage_var
-func ERC721_Enumerable_all_tokens_index(token_id: Uint256) -> (index: Uint256):
+func ERC721_Enumerable_all_tokens_index_felt(token_id: Uint256) -> (index: felt):
 end
 
 @storage_var
-func ERC721_Enumerable_owned_tokens(owner: felt, index: Uint256) -> (token_id: Uint256):
+func ERC721_Enumerable_owned_tokens_felt(owner: felt, index: felt) -> (token_id: Uint256):
 end
 
 @storage_var
-func ERC721_Enumerable_owned_tokens_index(token_id: Uint256) -> (index: Uint256):
+func ERC721_Enumerable_owned_tokens_index_felt(token_id: Uint256) -> (index: felt):
 end
 
 #
@@ -75,8 +77,8 @@ func ERC721_Enumerable_totalSupply{
         pedersen_ptr: HashBuiltin*, 
         range_check_ptr
     }() -> (totalSupply: Uint256):
-    let (totalSupply) = ERC721_Enumerable_all_tokens_len.read()
-    return (totalSupply)
+    let (len) = ERC721_Enumerable_all_tokens_len_felt.read()
+    return (Uint256(len, 0))
 end
 
 
@@ -88,13 +90,13 @@ func ERC721_Enumerable_tokenByIndex{
     alloc_locals
     uint256_check(index)
     # Ensures index argument is less than total_supply 
-    let (len: Uint256) = ERC721_Enumerable_totalSupply()
-    let (is_lt) = uint256_lt(index, len)
+    let (len) = ERC721_Enumerable_all_tokens_len_felt.read()
+    let (is_lt) = _index_lt(index, len)
     with_attr error_message("ERC721_Enumerable: global index out of bounds"):
         assert is_lt = TRUE
     end
 
-    let (token_id: Uint256) = ERC721_Enumerable_all_tokens.read(index)
+    let (token_id: Uint256) = ERC721_Enumerable_all_tokens_felt.read(index.low)
     return (token_id)
 end
 
@@ -107,15 +109,57 @@ func ERC721_Enumerable_tokenOfOwnerByIndex{
     uint256_check(index)
     # Ensures index argument is less than owner's balance 
     let (len: Uint256) = ERC721_balanceOf(owner)
-    let (is_lt) = uint256_lt(index, len)
+    let (is_lt) = _index_lt(index, len.low)
     with_attr error_message("ERC721_Enumerable: owner index out of bounds"):
         assert is_lt = TRUE
     end
     
-    let (token_id: Uint256) = ERC721_Enumerable_owned_tokens.read(owner, index)
+    let (token_id: Uint256) = ERC721_Enumerable_owned_tokens_felt.read(owner, index.low)
     return (token_id)
 end
 
+# Up to `limit` tokens of `owner`, from index `offset`
+func ERC721_Enumerable_tokensOfOwner{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(owner: felt, offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    uint256_check(offset)
+    # Ensures offset is at most the owner's balance, so that the last page can be empty
+    let (local len: Uint256) = ERC721_balanceOf(owner)
+    let (is_le_len) = _index_lt(offset, len.low + 1)
+    with_attr error_message("ERC721_Enumerable: owner index out of bounds"):
+        assert is_le_len = TRUE
+    end
+
+    let (local token_ids_len) = _page_len(offset.low, limit, len.low)
+    let (local token_ids: Uint256*) = alloc()
+    _owned_tokens_from(owner, offset.low, token_ids_len, token_ids)
+    return (token_ids_len, token_ids)
+end
+
+# Up to `limit` tokens of the contract, from index `offset`
+func ERC721_Enumerable_tokensByRange{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(offset: Uint256, limit: felt) -> (token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    uint256_check(offset)
+    # Ensures offset is at most total_supply, so that the last page can be empty
+    let (local len) = ERC721_Enumerable_all_tokens_len_felt.read()
+    let (is_le_len) = _index_lt(offset, len + 1)
+    with_attr error_message("ERC721_Enumerable: global index out of bounds"):
+        assert is_le_len = TRUE
+    end
+
+    let (local token_ids_len) = _page_len(offset.low, limit, len)
+    let (local token_ids: Uint256*) = alloc()
+    _all_tokens_from(offset.low, token_ids_len, token_ids)
+    return (token_ids_len, token_ids)
+end
+
 #
 # Externals
 #
@@ -136,10 +180,45 @@ func ERC721_Enumerable_burn{
         syscall_ptr: felt*, 
         range_check_ptr
     }(token_id: Uint256):
-    let (from_) = ERC721_ownerOf(token_id)
-    _remove_token_from_owner_enumeration(from_, token_id)
+    alloc_locals
+    # the owner and its balance are read once, here, for both the enumeration and ERC721
+    let (local from_) = ERC721_ownerOf(token_id)
+    let (local balance: Uint256) = ERC721_balanceOf(from_)
+    # the index starts at zero therefore the user's last token index is their balance minus one
+    _swap_and_pop_owned_tokens(from_, token_id, balance.low - 1)
     _remove_token_from_all_tokens_enumeration(token_id)
-    ERC721_burn(token_id)
+    ERC721_burnWithBalance(from_, balance, token_id)
+    return ()
+end
+
+# Mints every token of `token_ids` to `to`, writing the enumeration lengths once
+func ERC721_Enumerable_mintBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    let (local supply) = ERC721_Enumerable_all_tokens_len_felt.read()
+    let (balance: Uint256) = ERC721_balanceOf(to)
+    _append_batch(to, supply, balance.low, token_ids_len, token_ids)
+    ERC721_Enumerable_all_tokens_len_felt.write(supply + token_ids_len)
+    ERC721_mintBatch(to, token_ids_len, token_ids)
+    return ()
+end
+
+# Burns every token of `token_ids`, which must all belong to `owner`,
+# writing the enumeration lengths once
+func ERC721_Enumerable_burnBatch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(owner: felt, token_ids_len: felt, token_ids: Uint256*):
+    alloc_locals
+    let (local supply) = ERC721_Enumerable_all_tokens_len_felt.read()
+    let (balance: Uint256) = ERC721_balanceOf(owner)
+    _swap_and_pop_batch(owner, supply - 1, balance.low - 1, token_ids_len, token_ids)
+    ERC721_Enumerable_all_tokens_len_felt.write(supply - token_ids_len)
+    ERC721_burnBatch(owner, token_ids_len, token_ids)
     return ()
 end
 
@@ -148,9 +227,10 @@ func ERC721_Enumerable_transferFrom{
         syscall_ptr: felt*, 
         range_check_ptr
     }(from_: felt, to: felt, token_id: Uint256):
-    _remove_token_from_owner_enumeration(from_, token_id)
-    _add_token_to_owner_enumeration(to, token_id)
-    ERC721_transferFrom(from_, to, token_id)
+    alloc_locals
+    let (local from_balance: Uint256, local to_balance: Uint256) = _balances_of(from_, to)
+    _transfer_token_owner_enumeration(from_, to, token_id, from_balance.low, to_balance.low)
+    ERC721_transferFromWithBalances(from_, to, token_id, from_balance, to_balance)
     return ()
 end
 
@@ -165,9 +245,12 @@ func ERC721_Enumerable_safeTransferFrom{
         data_len: felt,
         data: felt*
     ):
-    _remove_token_from_owner_enumeration(from_, token_id)
-    _add_token_to_owner_enumeration(to, token_id)
-    ERC721_safeTransferFrom(from_, to, token_id, data_len, data)
+    alloc_locals
+    let (local from_balance: Uint256, local to_balance: Uint256) = _balances_of(from_, to)
+    _transfer_token_owner_enumeration(from_, to, token_id, from_balance.low, to_balance.low)
+    ERC721_safeTransferFromWithBalances(
+        from_, to, token_id, data_len, data, from_balance, to_balance
+    )
     return ()
 end
 
@@ -175,80 +258,231 @@ end
 # Internals
 #
 
+# Whether the Uint256 `index` is less than the felt `len`
+func _index_lt{
+        range_check_ptr
+    }(index: Uint256, len: felt) -> (res: felt):
+    if index.high != 0:
+        return (FALSE)
+    end
+    let (res) = is_le(index.low + 1, len)
+    return (res)
+end
+
+# Number of indices from `offset` to `len`, capped to `limit`
+func _page_len{
+        range_check_ptr
+    }(offset: felt, limit: felt, len: felt) -> (page_len: felt):
+    alloc_locals
+    with_attr error_message("ERC721_Enumerable: limit is negative"):
+        assert_nn(limit)
+    end
+
+    let (is_limited) = is_le(limit, len - offset)
+    if is_limited == TRUE:
+        return (limit)
+    end
+    return (len - offset)
+end
+
+func _owned_tokens_from{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(owner: felt, index: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721_Enumerable_owned_tokens_felt.read(owner, index)
+    assert token_ids[0] = token_id
+    return _owned_tokens_from(owner, index + 1, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _all_tokens_from{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    }(index: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    let (token_id: Uint256) = ERC721_Enumerable_all_tokens_felt.read(index)
+    assert token_ids[0] = token_id
+    return _all_tokens_from(index + 1, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
 func _add_token_to_all_tokens_enumeration{
         pedersen_ptr: HashBuiltin*, 
         syscall_ptr: felt*, 
         range_check_ptr
     }(token_id: Uint256):
-    let (supply: Uint256) = ERC721_Enumerable_all_tokens_len.read()
-    ERC721_Enumerable_all_tokens.write(supply, token_id)
-    ERC721_Enumerable_all_tokens_index.write(token_id, supply)
-    
-    let (new_supply: Uint256) = uint256_checked_add(supply, Uint256(1, 0))
-    ERC721_Enumerable_all_tokens_len.write(new_supply)
+    let (supply) = ERC721_Enumerable_all_tokens_len_felt.read()
+    _append_to_all_tokens(supply, token_id)
+    ERC721_Enumerable_all_tokens_len_felt.write(supply + 1)
     return ()
 end
 
-
 func _remove_token_from_all_tokens_enumeration{
         pedersen_ptr: HashBuiltin*, 
         syscall_ptr: felt*, 
         range_check_ptr
     }(token_id: Uint256):
     alloc_locals
-    let (supply: Uint256) = ERC721_Enumerable_all_tokens_len.read()
-    let (last_token_index: Uint256) = uint256_checked_sub_le(supply, Uint256(1, 0))
-    let (token_index: Uint256) = ERC721_Enumerable_all_tokens_index.read(token_id)
+    let (supply) = ERC721_Enumerable_all_tokens_len_felt.read()
+    local last_token_index = supply - 1
+    _swap_and_pop_all_tokens(token_id, last_token_index)
+    ERC721_Enumerable_all_tokens_len_felt.write(last_token_index)
+    return ()
+end
+
+func _add_token_to_owner_enumeration{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, token_id: Uint256):
+    let (length: Uint256) = ERC721_balanceOf(to) 
+    _append_to_owned_tokens(to, length.low, token_id)
+    return ()
+end
+
+# Balances of `from_` and `to`, read once if they are the same account
+func _balances_of{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(from_: felt, to: felt) -> (from_balance: Uint256, to_balance: Uint256):
+    alloc_locals
+    let (local from_balance: Uint256) = ERC721_balanceOf(from_)
+    if from_ == to:
+        return (from_balance, from_balance)
+    end
+
+    let (to_balance: Uint256) = ERC721_balanceOf(to)
+    return (from_balance, to_balance)
+end
+
+# Moves `token_id` between the enumerations of `from_` and `to`, given their
+# balances before the transfer
+func _transfer_token_owner_enumeration{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(from_: felt, to: felt, token_id: Uint256, from_balance: felt, to_balance: felt):
+    # A self-transfer leaves the owner's enumeration untouched. Removing then adding the
+    # token would append it past the (unchanged) balance and leave a hole at its old index
+    if from_ == to:
+        return ()
+    end
+
+    # the index starts at zero therefore the user's last token index is their balance minus one
+    _swap_and_pop_owned_tokens(from_, token_id, from_balance - 1)
+    _append_to_owned_tokens(to, to_balance, token_id)
+    return ()
+end
+
+func _append_to_all_tokens{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(index: felt, token_id: Uint256):
+    ERC721_Enumerable_all_tokens_felt.write(index, token_id)
+    ERC721_Enumerable_all_tokens_index_felt.write(token_id, index)
+    return ()
+end
+
+# Moves the token at `last_token_index` to the index of `token_id`
+func _swap_and_pop_all_tokens{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(token_id: Uint256, last_token_index: felt):
+    alloc_locals
+    let (local token_index) = ERC721_Enumerable_all_tokens_index_felt.read(token_id)
 
     # When the token to delete is the last token, the swap operation is unnecessary. However,
     # since this occurs so rarely (when the last minted token is burnt), we still do the swap
-    # here to avoid the gas cost of adding an 'if' statement (like in _remove_token_from_owner_enumeration)
-    let (last_token_id: Uint256) = ERC721_Enumerable_all_tokens.read(last_token_index)
+    # here to avoid the gas cost of adding an 'if' statement (like in _swap_and_pop_owned_tokens)
+    let (last_token_id: Uint256) = ERC721_Enumerable_all_tokens_felt.read(last_token_index)
 
-    ERC721_Enumerable_all_tokens.write(last_token_index, Uint256(0, 0))
-    ERC721_Enumerable_all_tokens.write(token_index, last_token_id)
+    ERC721_Enumerable_all_tokens_felt.write(last_token_index, Uint256(0, 0))
+    ERC721_Enumerable_all_tokens_felt.write(token_index, last_token_id)
 
-    ERC721_Enumerable_all_tokens_index.write(last_token_id, token_index)
-    ERC721_Enumerable_all_tokens_index.write(token_id, Uint256(0, 0))
-
-    let (new_supply: Uint256) = uint256_checked_sub_le(supply, Uint256(1, 0))
-    ERC721_Enumerable_all_tokens_len.write(new_supply)
+    ERC721_Enumerable_all_tokens_index_felt.write(last_token_id, token_index)
+    ERC721_Enumerable_all_tokens_index_felt.write(token_id, 0)
     return ()
 end
 
-func _add_token_to_owner_enumeration{
+func _append_to_owned_tokens{
         pedersen_ptr: HashBuiltin*, 
         syscall_ptr: felt*, 
         range_check_ptr
-    }(to: felt, token_id: Uint256):
-    let (length: Uint256) = ERC721_balanceOf(to) 
-    ERC721_Enumerable_owned_tokens.write(to, length, token_id)
-    ERC721_Enumerable_owned_tokens_index.write(token_id, length)
+    }(to: felt, index: felt, token_id: Uint256):
+    ERC721_Enumerable_owned_tokens_felt.write(to, index, token_id)
+    ERC721_Enumerable_owned_tokens_index_felt.write(token_id, index)
     return ()
 end
 
-func _remove_token_from_owner_enumeration{
+# Moves the last token of `from_` to the index of `token_id`
+func _swap_and_pop_owned_tokens{
         pedersen_ptr: HashBuiltin*, 
         syscall_ptr: felt*, 
         range_check_ptr
-    }(from_: felt, token_id: Uint256):
+    }(from_: felt, token_id: Uint256, last_token_index: felt):
     alloc_locals
-    let (last_token_index: Uint256) = ERC721_balanceOf(from_)
-    # the index starts at zero therefore the user's last token index is their balance minus one
-    let (last_token_index) = uint256_checked_sub_le(last_token_index, Uint256(1, 0))
-    let (token_index: Uint256) = ERC721_Enumerable_owned_tokens_index.read(token_id)
+    let (local token_index) = ERC721_Enumerable_owned_tokens_index_felt.read(token_id)
 
     # If index is last, we can just set the return values to zero
-    let (is_equal) = uint256_eq(token_index, last_token_index)
-    if is_equal == TRUE:
-        ERC721_Enumerable_owned_tokens_index.write(token_id, Uint256(0, 0))
-        ERC721_Enumerable_owned_tokens.write(from_, last_token_index, Uint256(0, 0))
+    if token_index == last_token_index:
+        ERC721_Enumerable_owned_tokens_index_felt.write(token_id, 0)
+        ERC721_Enumerable_owned_tokens_felt.write(from_, last_token_index, Uint256(0, 0))
         return ()
     end
 
     # If index is not last, reposition owner's last token to the removed token's index
-    let (last_token_id: Uint256) = ERC721_Enumerable_owned_tokens.read(from_, last_token_index)
-    ERC721_Enumerable_owned_tokens.write(from_, token_index, last_token_id)
-    ERC721_Enumerable_owned_tokens_index.write(last_token_id, token_index)
+    let (last_token_id: Uint256) = ERC721_Enumerable_owned_tokens_felt.read(from_, last_token_index)
+    ERC721_Enumerable_owned_tokens_felt.write(from_, token_index, last_token_id)
+    ERC721_Enumerable_owned_tokens_index_felt.write(last_token_id, token_index)
+
+    # Clear the vacated slot and the removed token's index, as in the branch above
+    ERC721_Enumerable_owned_tokens_index_felt.write(token_id, 0)
+    ERC721_Enumerable_owned_tokens_felt.write(from_, last_token_index, Uint256(0, 0))
     return ()
 end
+
+func _append_batch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, all_index: felt, owned_index: felt, token_ids_len: felt, token_ids: Uint256*):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    _append_to_all_tokens(all_index, [token_ids])
+    _append_to_owned_tokens(to, owned_index, [token_ids])
+    return _append_batch(to, all_index + 1, owned_index + 1, token_ids_len - 1, token_ids + Uint256.SIZE)
+end
+
+func _swap_and_pop_batch{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        owner: felt,
+        last_all_index: felt,
+        last_owned_index: felt,
+        token_ids_len: felt,
+        token_ids: Uint256*
+    ):
+    if token_ids_len == 0:
+        return ()
+    end
+
+    _swap_and_pop_owned_tokens(owner, [token_ids], last_owned_index)
+    _swap_and_pop_all_tokens([token_ids], last_all_index)
+    return _swap_and_pop_batch(
+        owner, last_all_index - 1, last_owned_index - 1, token_ids_len - 1, token_ids + Uint256.SIZE
+    )
+end
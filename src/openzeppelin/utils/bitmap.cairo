@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (utils/bitmap.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.bitwise import bitwise_and, bitwise_or
+from starkware.cairo.common.math import assert_le, unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.pow import pow
+from starkware.cairo.common.bool import TRUE, FALSE
+
+# Flags packed in each felt, the largest power of two below the field prime is 2^251
+const BITMAP_BITS_PER_WORD = 251
+
+#
+# Storage
+#
+
+# Any number of bitmaps can live in the same contract, told apart by `bitmap`
+@storage_var
+func Bitmap_words(bitmap: felt, word: felt) -> (bits: felt):
+end
+
+#
+# Getters
+#
+
+func Bitmap_get{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt) -> (value: felt):
+    alloc_locals
+    let (word, local mask) = _bit_position(index)
+    let (bits) = Bitmap_words.read(bitmap, word)
+    let (bit) = bitwise_and(bits, mask)
+    if bit == 0:
+        return (FALSE)
+    end
+    return (TRUE)
+end
+
+#
+# Externals
+#
+
+func Bitmap_set{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt):
+    alloc_locals
+    let (local word, local mask) = _bit_position(index)
+    let (bits) = Bitmap_words.read(bitmap, word)
+    let (new_bits) = bitwise_or(bits, mask)
+    Bitmap_words.write(bitmap, word, new_bits)
+    return ()
+end
+
+func Bitmap_clear{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt):
+    alloc_locals
+    let (local word, local mask) = _bit_position(index)
+    let (bits) = Bitmap_words.read(bitmap, word)
+    let (bit) = bitwise_and(bits, mask)
+    Bitmap_words.write(bitmap, word, bits - bit)
+    return ()
+end
+
+# Sets the `len` flags starting at `start`, with one write per word
+func Bitmap_set_range{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, len: felt):
+    with_attr error_message("Bitmap: invalid range"):
+        assert_le(start, start + len)
+    end
+    _set_range(bitmap, start, start + len)
+    return ()
+end
+
+# Clears the `len` flags starting at `start`, with one write per word
+func Bitmap_clear_range{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, len: felt):
+    with_attr error_message("Bitmap: invalid range"):
+        assert_le(start, start + len)
+    end
+    _clear_range(bitmap, start, start + len)
+    return ()
+end
+
+#
+# Internals
+#
+
+# Word holding the flag at `index`, and the mask of its bit
+func _bit_position{
+        range_check_ptr
+    }(index: felt) -> (word: felt, mask: felt):
+    alloc_locals
+    let (local word, bit) = unsigned_div_rem(index, BITMAP_BITS_PER_WORD)
+    let (mask) = pow(2, bit)
+    return (word, mask)
+end
+
+# Word holding the flag at `start`, the mask of the flags in [start, end) within
+# that word, and the first index after them
+func _range_position{
+        range_check_ptr
+    }(start: felt, end_: felt) -> (word: felt, mask: felt, next: felt):
+    alloc_locals
+    let (local word, local first_bit) = unsigned_div_rem(start, BITMAP_BITS_PER_WORD)
+    let word_end = (word + 1) * BITMAP_BITS_PER_WORD
+    let (ends_in_word) = is_le(end_, word_end)
+    if ends_in_word == TRUE:
+        tempvar range_end = end_
+    else:
+        tempvar range_end = word_end
+    end
+    local next = range_end
+
+    let (local low) = pow(2, first_bit)
+    let (local high) = pow(2, next - word * BITMAP_BITS_PER_WORD)
+    return (word, high - low, next)
+end
+
+func _set_range{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, end_: felt):
+    alloc_locals
+    if start == end_:
+        return ()
+    end
+
+    let (local word, local mask, local next) = _range_position(start, end_)
+    let (bits) = Bitmap_words.read(bitmap, word)
+    let (new_bits) = bitwise_or(bits, mask)
+    Bitmap_words.write(bitmap, word, new_bits)
+    return _set_range(bitmap, next, end_)
+end
+
+func _clear_range{
+        syscall_ptr : felt*,
+        pedersen_ptr : HashBuiltin*,
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, end_: felt):
+    alloc_locals
+    if start == end_:
+        return ()
+    end
+
+    let (local word, local mask, local next) = _range_position(start, end_)
+    let (bits) = Bitmap_words.read(bitmap, word)
+    let (cleared) = bitwise_and(bits, mask)
+    Bitmap_words.write(bitmap, word, bits - cleared)
+    return _clear_range(bitmap, next, end_)
+end
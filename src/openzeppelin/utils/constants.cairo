@@ -8,6 +8,7 @@
 #
 
 const UINT8_MAX = 256
+const UINT128_MAX = 2 ** 128 - 1
 
 #
 # Interface Ids
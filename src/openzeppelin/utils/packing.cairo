@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MIT
+# OpenZeppelin Contracts for Cairo v0.1.0 (utils/packing.cairo)
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
+from starkware.cairo.common.bitwise import bitwise_and
+from starkware.cairo.common.math import assert_le, assert_le_felt
+from starkware.cairo.common.pow import pow
+
+# Bits of a felt that can hold packed fields, 2^251 is below the field prime
+const PACKING_BITS_PER_WORD = 251
+
+#
+# A packed word holds several bounded fields side by side. A field is given by
+# its `offset`, the position of its lowest bit, and its `size` in bits, e.g. an
+# 8-bit field at offset 0 followed by a 1-bit flag at offset 8.
+#
+
+# Returns the field of `word` at `offset` with `size` bits.
+func Packing_get{
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(word: felt, offset: felt, size: felt) -> (value: felt):
+    alloc_locals
+    let (local shift, mask) = _field_mask(offset, size)
+    let (shifted_value) = bitwise_and(word, mask)
+    # exact, as the masked bits are a multiple of the shift
+    let value = shifted_value / shift
+    return (value)
+end
+
+# Returns `word` with the field at `offset` with `size` bits replaced by `value`.
+# Reverts if `value` doesn't fit in `size` bits.
+func Packing_set{
+        bitwise_ptr : BitwiseBuiltin*,
+        range_check_ptr
+    }(word: felt, value: felt, offset: felt, size: felt) -> (new_word: felt):
+    alloc_locals
+    let (local shift, local mask) = _field_mask(offset, size)
+    let (local bound) = pow(2, size)
+    with_attr error_message("Packing: value out of range"):
+        assert_le_felt(value, bound - 1)
+    end
+
+    let (shifted_value) = bitwise_and(word, mask)
+    return (word - shifted_value + value * shift)
+end
+
+#
+# Internals
+#
+
+# Returns 2^offset, and the mask of the bits of the field
+func _field_mask{
+        range_check_ptr
+    }(offset: felt, size: felt) -> (shift: felt, mask: felt):
+    alloc_locals
+    with_attr error_message("Packing: field out of bounds"):
+        assert_le(1, size)
+        assert_le(offset + size, PACKING_BITS_PER_WORD)
+    end
+
+    let (local shift) = pow(2, offset)
+    let (end_) = pow(2, offset + size)
+    return (shift, end_ - shift)
+end
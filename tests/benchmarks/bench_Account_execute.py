@@ -0,0 +1,159 @@
+"""
+Multicall throughput benchmark for `Account.__execute__`.
+
+Sweeps the number of calls in a single `__execute__` transaction, the calldata
+size of each call and the response size of each call, and records the Cairo
+steps, memory holes, builtin usage and wall time of every combination.
+
+Usage:
+
+    python tests/benchmarks/bench_Account_execute.py
+    python tests/benchmarks/bench_Account_execute.py --calls 1 10 100 --calldata 0 --response 0 8
+    python tests/benchmarks/bench_Account_execute.py --output bench_output.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starknet.definitions.general_config import StarknetGeneralConfig
+from starkware.starkware_utils.error_handling import StarkException
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils import Signer, get_contract_def  # noqa: E402
+
+
+signer = Signer(123456789987654321)
+
+DEFAULT_CALLS = [1, 2, 5, 10, 25, 50, 100, 250, 500]
+DEFAULT_CALLDATA_SIZES = [0, 8, 32]
+DEFAULT_RESPONSE_SIZES = [0, 8, 32]
+
+# the knee is the first batch size whose marginal cost per call
+# exceeds the cheapest marginal cost observed by this ratio
+KNEE_THRESHOLD = 1.1
+
+
+async def setup(max_steps):
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    target_def = get_contract_def('tests/mocks/multicall_target_mock.cairo')
+
+    config = StarknetGeneralConfig(invoke_tx_max_n_steps=max_steps)
+    starknet = await Starknet.empty(general_config=config)
+    account = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    target = await starknet.deploy(contract_def=target_def)
+    return account, target
+
+
+def build_calls(target, n_calls, calldata_size, response_size):
+    # `echo(data_len, data, response_size)`
+    calldata = [calldata_size, *range(calldata_size), response_size]
+    return [(target.contract_address, 'echo', calldata)] * n_calls
+
+
+async def measure(account, target, n_calls, calldata_size, response_size):
+    calls = build_calls(target, n_calls, calldata_size, response_size)
+    row = {
+        'calls': n_calls,
+        'calldata_size': calldata_size,
+        'response_size': response_size,
+    }
+
+    start = time.perf_counter()
+    try:
+        tx_exec_info = await signer.send_transactions(account, calls)
+    except StarkException as err:
+        _, error = err.args
+        row.update(error=error['code'].name, wall_time=time.perf_counter() - start)
+        return row
+    wall_time = time.perf_counter() - start
+
+    resources = tx_exec_info.call_info.execution_resources
+    row.update(
+        steps=resources.n_steps,
+        memory_holes=resources.n_memory_holes,
+        builtins=dict(resources.builtin_instance_counter),
+        response_len=len(tx_exec_info.result.response),
+        wall_time=wall_time,
+        steps_per_call=resources.n_steps / n_calls,
+    )
+    return row
+
+
+def find_knee(rows):
+    """Returns the batch size where the marginal cost per call starts growing."""
+    rows = sorted((row for row in rows if 'steps' in row), key=lambda row: row['calls'])
+    marginals = []
+    for prev, curr in zip(rows, rows[1:]):
+        marginal = (curr['steps'] - prev['steps']) / (curr['calls'] - prev['calls'])
+        marginals.append((curr['calls'], marginal))
+
+    if not marginals:
+        return None
+
+    cheapest = min(marginal for _, marginal in marginals)
+    for calls, marginal in marginals:
+        if marginal > cheapest * KNEE_THRESHOLD:
+            return calls
+    return None
+
+
+async def run(args):
+    account, target = await setup(args.max_steps)
+    results = []
+    for calldata_size, response_size in itertools.product(args.calldata, args.response):
+        series = []
+        for n_calls in sorted(args.calls):
+            row = await measure(account, target, n_calls, calldata_size, response_size)
+            series.append(row)
+            print(format_row(row), flush=True)
+
+        failed = [row['calls'] for row in series if 'error' in row]
+        results.append({
+            'calldata_size': calldata_size,
+            'response_size': response_size,
+            'knee': find_knee(series),
+            'max_calls': min(failed) if failed else None,
+            'runs': series,
+        })
+    return results
+
+
+def format_row(row):
+    if 'error' in row:
+        return "calls={calls:>4} calldata={calldata_size:>3} response={response_size:>3} {error}".format(**row)
+    return (
+        "calls={calls:>4} calldata={calldata_size:>3} response={response_size:>3} "
+        "steps={steps:>8} steps/call={steps_per_call:>8.1f} holes={memory_holes:>6} "
+        "time={wall_time:>7.3f}s"
+    ).format(**row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, nargs='+', default=DEFAULT_CALLS)
+    parser.add_argument('--calldata', type=int, nargs='+', default=DEFAULT_CALLDATA_SIZES)
+    parser.add_argument('--response', type=int, nargs='+', default=DEFAULT_RESPONSE_SIZES)
+    parser.add_argument('--max-steps', type=int, default=StarknetGeneralConfig().invoke_tx_max_n_steps)
+    parser.add_argument('--output', type=str, default=None, help="path of the JSON report")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    for series in results:
+        print("calldata={calldata_size} response={response_size}: knee={knee} max_calls={max_calls}".format(**series))
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
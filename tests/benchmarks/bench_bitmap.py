@@ -0,0 +1,99 @@
+"""
+Step benchmark of the packed bitmap in `utils/bitmap.cairo`.
+
+Sets a growing number of consecutive flags, both through the bitmap (251
+flags per storage felt) and through a naive storage variable holding one flag
+per slot, and records the Cairo steps, builtin usage and storage keys touched
+by each.
+
+Usage:
+
+    python tests/benchmarks/bench_bitmap.py
+    python tests/benchmarks/bench_bitmap.py --flags 1 251 1000 --output bench_output.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from starkware.starknet.testing.starknet import Starknet
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils import get_contract_def  # noqa: E402
+
+
+DEFAULT_FLAGS = [1, 10, 100, 251, 502, 1000]
+
+# (name, entry point) pairs being compared
+VARIANTS = [
+    ('bitmap', 'setRange'),
+    ('naive', 'naiveSetRange'),
+]
+
+
+async def setup():
+    bitmap_def = get_contract_def('tests/mocks/bitmap_mock.cairo')
+    starknet = await Starknet.empty()
+    return await starknet.deploy(contract_def=bitmap_def)
+
+
+async def measure(mock, bitmap_id, entry_point, n_flags):
+    # every run writes to its own bitmap, so all its flags start unset
+    execution_info = await getattr(mock, entry_point)(bitmap_id, 0, n_flags).invoke()
+    call_info = execution_info.call_info
+    resources = call_info.execution_resources
+    return {
+        'steps': resources.n_steps,
+        'builtins': dict(resources.builtin_instance_counter),
+        'storage_keys': len(call_info.accessed_storage_keys),
+    }
+
+
+async def run(args):
+    mock = await setup()
+    results = []
+    bitmap_id = 0
+    for n_flags in sorted(args.flags):
+        row = {'flags': n_flags}
+        for name, entry_point in VARIANTS:
+            bitmap_id += 1
+            row[name] = await measure(mock, bitmap_id, entry_point, n_flags)
+        row['steps_ratio'] = row['naive']['steps'] / row['bitmap']['steps']
+        results.append(row)
+        print(format_row(row), flush=True)
+    return results
+
+
+def format_row(row):
+    return (
+        "flags={flags:>5} "
+        "bitmap: steps={bitmap_steps:>7} keys={bitmap_keys:>4} "
+        "naive: steps={naive_steps:>7} keys={naive_keys:>5} "
+        "naive/bitmap={steps_ratio:>6.2f}"
+    ).format(
+        flags=row['flags'],
+        bitmap_steps=row['bitmap']['steps'],
+        bitmap_keys=row['bitmap']['storage_keys'],
+        naive_steps=row['naive']['steps'],
+        naive_keys=row['naive']['storage_keys'],
+        steps_ratio=row['steps_ratio'],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--flags', type=int, nargs='+', default=DEFAULT_FLAGS)
+    parser.add_argument('--output', type=str, default=None, help="path of the JSON report")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
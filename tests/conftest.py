@@ -1,6 +1,8 @@
 import pytest
 import asyncio
 
+pytest_plugins = ['timing', 'sharding']
+
 @pytest.fixture(scope='module')
 def event_loop():
     return asyncio.new_event_loop()
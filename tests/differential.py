@@ -0,0 +1,290 @@
+"""
+Differential testing of the token contracts against their Python models.
+
+Random operation sequences are generated and run against a model from
+`models.py` at native speed, checking invariants after every step. Only a
+sampled subset of the sequences, plus the prefixes that broke an invariant,
+are then replayed against the deployed contract, comparing every outcome,
+error message, event and the final observable state with the model.
+
+Operations are generated over placeholder addresses (small integers), which
+are translated to deployed account addresses when replaying.
+"""
+
+import random
+from collections import namedtuple
+
+from starkware.starknet.public.abi import get_selector_from_name
+from starkware.starkware_utils.error_handling import StarkException
+
+from models import ModelRevert
+from utils import ZERO_ADDRESS, TRUE, FALSE, MAX_UINT256, INVALID_UINT256, to_uint
+
+
+# `caller` is an index into the actors, `args` follow the method's spec
+Operation = namedtuple('Operation', ['caller', 'method', 'args'])
+
+# reverted is False on success, message is None when the revert has no message
+Outcome = namedtuple('Outcome', ['reverted', 'message', 'events'])
+
+# Argument kinds of the operations of every preset. All of them are called
+# with the caller first on the model, and through the caller's account on
+# the contract.
+ERC20_MINTABLE_SPEC = {
+    'transfer': ('address', 'uint'),
+    'transferFrom': ('address', 'address', 'uint'),
+    'approve': ('address', 'uint'),
+    'increaseAllowance': ('address', 'uint'),
+    'decreaseAllowance': ('address', 'uint'),
+    'mint': ('address', 'uint'),
+}
+
+ERC20_PAUSABLE_SPEC = {
+    'transfer': ('address', 'uint'),
+    'transferFrom': ('address', 'address', 'uint'),
+    'approve': ('address', 'uint'),
+    'increaseAllowance': ('address', 'uint'),
+    'decreaseAllowance': ('address', 'uint'),
+    'pause': (),
+    'unpause': (),
+}
+
+ERC721_ENUMERABLE_SPEC = {
+    'mint': ('address', 'token'),
+    'burn': ('token',),
+    'approve': ('address', 'token'),
+    'setApprovalForAll': ('address', 'bool'),
+    'transferFrom': ('address', 'address', 'token'),
+}
+
+
+class Generator:
+    """
+    Draws random operations for a spec.
+
+    Parameters
+    ----------
+
+    spec : dict
+        Method name to argument kinds.
+
+    n_actors : int
+        Number of accounts sending transactions. Actor `i` has placeholder
+        address `i + 1`.
+
+    n_tokens : int
+        Size of the pool token ids are drawn from.
+
+    """
+
+    def __init__(self, spec, n_actors=3, n_tokens=5, max_amount=1000):
+        self.spec = spec
+        self.methods = sorted(spec)
+        self.n_actors = n_actors
+        self.n_tokens = n_tokens
+        self.max_amount = max_amount
+
+    @property
+    def addresses(self):
+        return [actor + 1 for actor in range(self.n_actors)]
+
+    @property
+    def tokens(self):
+        return [to_uint(token + 1) for token in range(self.n_tokens)]
+
+    def address(self, rng):
+        if rng.random() < 0.05:
+            return ZERO_ADDRESS
+        return rng.choice(self.addresses)
+
+    def uint(self, rng):
+        roll = rng.random()
+        if roll < 0.02:
+            return INVALID_UINT256
+        if roll < 0.05:
+            return MAX_UINT256
+        return to_uint(rng.randint(0, self.max_amount))
+
+    def token(self, rng):
+        if rng.random() < 0.02:
+            return INVALID_UINT256
+        return rng.choice(self.tokens)
+
+    def bool(self, rng):
+        if rng.random() < 0.02:
+            return 2
+        return rng.choice((TRUE, FALSE))
+
+    def operation(self, rng):
+        method = rng.choice(self.methods)
+        args = tuple(getattr(self, kind)(rng) for kind in self.spec[method])
+        return Operation(rng.randrange(self.n_actors), method, args)
+
+    def sequence(self, rng, length):
+        return [self.operation(rng) for _ in range(length)]
+
+
+def apply(model, op):
+    """Runs `op` on `model` and returns its `Outcome`."""
+    n_events = len(model.events)
+    try:
+        getattr(model, op.method)(op.caller + 1, *op.args)
+    except ModelRevert as err:
+        return Outcome(True, err.message, [])
+    return Outcome(False, None, model.events[n_events:])
+
+
+def run_model(model_factory, ops, invariant=None):
+    """
+    Runs `ops` on a fresh model. Returns the model, the outcomes and the
+    length of the shortest prefix breaking `invariant` (or `None`).
+    """
+    model = model_factory()
+    outcomes = []
+    for i, op in enumerate(ops):
+        outcomes.append(apply(model, op))
+        if invariant is not None and not invariant(model):
+            return model, outcomes, i + 1
+    return model, outcomes, None
+
+
+def explore(generator, model_factory, invariant, n_sequences, length, sample_size, seed=0):
+    """
+    Runs `n_sequences` random sequences on the model only.
+
+    Returns the sequences worth replaying on the contract: the failing
+    prefixes first, then `sample_size` randomly sampled sequences.
+    """
+    rng = random.Random(seed)
+    failing = []
+    sequences = []
+    for _ in range(n_sequences):
+        ops = generator.sequence(rng, length)
+        _, _, failed_at = run_model(model_factory, ops, invariant)
+        if failed_at is not None:
+            failing.append(ops[:failed_at])
+        else:
+            sequences.append(ops)
+
+    sampled = rng.sample(sequences, min(sample_size, len(sequences)))
+    return failing, sampled
+
+
+#
+# Replay
+#
+
+def to_calldata(spec, op, translate):
+    calldata = []
+    for kind, arg in zip(spec[op.method], op.args):
+        if kind == 'address':
+            calldata.append(translate(arg))
+        elif kind in ('uint', 'token'):
+            calldata.extend(arg)
+        else:
+            calldata.append(arg)
+    return calldata
+
+
+class Replayer:
+    """
+    Replays operations on a deployed contract and compares them with a model.
+
+    Parameters
+    ----------
+
+    contract : StarknetContract
+
+    accounts : list of StarknetContract
+        Account of every actor, all controlled by `signer`.
+
+    signer : Signer
+
+    spec : dict
+
+    """
+
+    def __init__(self, contract, accounts, signer, spec):
+        self.contract = contract
+        self.accounts = accounts
+        self.signer = signer
+        self.spec = spec
+        self.placeholders = {i + 1: account.contract_address for i, account in enumerate(accounts)}
+        self.event_names = {}
+        self.nonces = {}
+
+    def translate(self, address):
+        return self.placeholders.get(address, address)
+
+    def translate_event(self, event, addresses):
+        name, data = event
+        return name, [self.translate(value) if i in addresses else value for i, value in enumerate(data)]
+
+    async def replay(self, model, ops):
+        """Runs `ops` on both the contract and `model`, asserting they agree step by step."""
+        for i, op in enumerate(ops):
+            expected = apply(model, op)
+            reverted, message, events = await self.execute(op)
+            context = "step {} {}: model {}, contract {}".format(i, op, expected, (reverted, message))
+
+            assert reverted == expected.reverted, context
+            if reverted and expected.message is not None:
+                assert expected.message in message, context
+            if not reverted:
+                assert events == [self.translate_event(event, {0, 1}) for event in expected.events], context
+
+    async def compare_views(self, model, views, address_views=()):
+        """
+        Asserts the contract and `model` agree on every `(name, args)` view.
+        Integer arguments are addresses, tuples are Uint256. Results are
+        translated only for the views listed in `address_views`.
+        """
+        for name, args in views:
+            try:
+                expected = getattr(model, name)(*args)
+            except ModelRevert:
+                expected = None
+            if name in address_views:
+                expected = self.translate(expected)
+
+            calldata = [self.translate(arg) if isinstance(arg, int) else arg for arg in args]
+            try:
+                # views don't write to storage, and `.invoke()` spares the state copy of `.call()`
+                execution_info = await getattr(self.contract, name)(*calldata).invoke()
+                (result,) = execution_info.result
+            except StarkException:
+                result = None
+
+            assert result == expected, "{}{}: model {}, contract {}".format(name, args, expected, result)
+
+    async def execute(self, op):
+        account = self.accounts[op.caller]
+        if op.caller not in self.nonces:
+            execution_info = await account.get_nonce().invoke()
+            self.nonces[op.caller], = execution_info.result
+        nonce = self.nonces[op.caller]
+        try:
+            tx_exec_info = await self.signer.send_transaction(
+                account,
+                self.contract.contract_address,
+                op.method,
+                to_calldata(self.spec, op, self.translate),
+                nonce=nonce
+            )
+        except StarkException as err:
+            _, error = err.args
+            return True, error['message'], []
+
+        self.nonces[op.caller] = nonce + 1
+        events = [
+            (self.event_name(event.keys[0]), list(event.data))
+            for event in tx_exec_info.raw_events
+            if event.from_address == self.contract.contract_address
+        ]
+        return False, None, events
+
+    def event_name(self, key):
+        if not self.event_names:
+            for name in ('Transfer', 'Approval', 'ApprovalForAll'):
+                self.event_names[get_selector_from_name(name)] = name
+        return self.event_names[key]
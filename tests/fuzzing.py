@@ -0,0 +1,189 @@
+"""
+Stateful fuzzing of the token contracts.
+
+Random operation sequences (see `differential.Generator`) are sent to the
+deployed contract, and a set of invariants is checked against its views
+after every step. When an invariant breaks, the failing sequence is shrunk
+by deleting operations until no smaller sequence fails anymore.
+
+The state is snapshotted every `snapshot_interval` steps. A shrinking
+candidate shares its prefix with the sequence it was derived from, so it
+is re-executed from the nearest snapshot instead of from genesis.
+Deletions are tried from the end of the sequence first, where the nearest
+snapshot is the closest.
+"""
+
+import random
+from collections import namedtuple
+
+from starkware.starkware_utils.error_handling import StarkException
+
+from differential import Replayer
+from utils import to_uint, from_uint
+
+
+# state and account nonces after the first `step` operations
+Snapshot = namedtuple('Snapshot', ['step', 'state', 'nonces'])
+
+# shrunk operation sequence and the message of the invariant it breaks
+Failure = namedtuple('Failure', ['ops', 'message'])
+
+
+class Fuzzer:
+    """
+    Runs random operation sequences on a contract and checks invariants.
+
+    Parameters
+    ----------
+
+    state : StarknetState
+        State right after deployment. It is never modified.
+
+    bind : callable
+        Takes a state and returns the contract and the accounts of the
+        actors, bound to that state (see `utils.cached_contract`).
+
+    signer : Signer
+        Signer of every account.
+
+    generator : differential.Generator
+
+    invariants : list of async callables
+        Each takes the contract and the `Replayer` (to translate
+        placeholder addresses) and returns an error message, or `None`
+        when the invariant holds.
+
+    snapshot_interval : int
+        Number of steps between two snapshots.
+
+    """
+
+    def __init__(self, state, bind, signer, generator, invariants, snapshot_interval=5):
+        self.genesis = Snapshot(0, state, {})
+        self.bind = bind
+        self.signer = signer
+        self.generator = generator
+        self.invariants = invariants
+        self.snapshot_interval = snapshot_interval
+
+    async def fuzz(self, n_sequences, length, seed=0):
+        """Returns the shrunk `Failure` of the first failing sequence, or `None`."""
+        rng = random.Random(seed)
+        for _ in range(n_sequences):
+            ops = self.generator.sequence(rng, length)
+            failed_at, message, snapshots = await self.run(ops)
+            if failed_at is not None:
+                return await self.shrink(ops[:failed_at], message, snapshots)
+        return None
+
+    async def run(self, ops, start=None):
+        """
+        Runs `ops` from the `start` snapshot (genesis by default). Returns the
+        length of the failing prefix, the invariant message and the
+        snapshots taken, or `None` for both when every invariant holds.
+        """
+        start = start or self.genesis
+        state = start.state.copy()
+        contract, accounts = self.bind(state)
+        replayer = Replayer(contract, accounts, self.signer, self.generator.spec)
+        replayer.nonces = dict(start.nonces)
+
+        snapshots = [start]
+        for step in range(start.step, len(ops)):
+            await replayer.execute(ops[step])
+            message = await self.check(contract, replayer)
+            if message is not None:
+                return step + 1, message, snapshots
+            if (step + 1) % self.snapshot_interval == 0:
+                snapshots.append(Snapshot(step + 1, state.copy(), dict(replayer.nonces)))
+        return None, None, snapshots
+
+    async def check(self, contract, replayer):
+        for invariant in self.invariants:
+            message = await invariant(contract, replayer)
+            if message is not None:
+                return message
+        return None
+
+    async def shrink(self, ops, message, snapshots):
+        """Deletes chunks of `ops`, halving the chunk size, as long as the sequence still fails."""
+        chunk = max(len(ops) // 2, 1)
+        while True:
+            index = len(ops) - chunk
+            while index >= 0:
+                candidate = ops[:index] + ops[index + chunk:]
+                # snapshots up to `index` are shared with the candidate
+                kept = [snapshot for snapshot in snapshots if snapshot.step <= index]
+                failed_at, candidate_message, new_snapshots = await self.run(candidate, kept[-1])
+                if failed_at is not None:
+                    ops = candidate[:failed_at]
+                    message = candidate_message
+                    snapshots = kept + new_snapshots[1:]
+                    index = min(index, len(ops)) - chunk
+                else:
+                    index -= chunk
+            if chunk == 1:
+                return Failure(ops, message)
+            chunk //= 2
+
+
+#
+# Invariants
+#
+
+async def view(contract, name, *args):
+    """Calls a view, returning `None` if it reverts."""
+    try:
+        # views don't write to storage, and `.invoke()` spares the state copy of `.call()`
+        execution_info = await getattr(contract, name)(*args).invoke()
+    except StarkException:
+        return None
+    (result,) = execution_info.result
+    return result
+
+
+def erc20_supply_invariant(holders):
+    """The balances of `holders` (placeholders) add up to the total supply."""
+    async def invariant(contract, replayer):
+        total_supply = from_uint(await view(contract, 'totalSupply'))
+        balances = [
+            from_uint(await view(contract, 'balanceOf', replayer.translate(holder)))
+            for holder in holders
+        ]
+        if sum(balances) != total_supply:
+            return "balances {} don't add up to the total supply {}".format(balances, total_supply)
+        return None
+    return invariant
+
+
+def erc721_enumeration_invariant(holders):
+    """
+    The global and per owner enumerations of the tokens held by `holders`
+    (placeholders) are consistent with `ownerOf` and `balanceOf`.
+    """
+    async def invariant(contract, replayer):
+        total_supply = from_uint(await view(contract, 'totalSupply'))
+        all_tokens = [
+            await view(contract, 'tokenByIndex', to_uint(index))
+            for index in range(total_supply)
+        ]
+        if len(set(all_tokens)) != total_supply:
+            return "tokenByIndex lists {} for a total supply of {}".format(all_tokens, total_supply)
+
+        owned_tokens = []
+        for holder in holders:
+            address = replayer.translate(holder)
+            balance = from_uint(await view(contract, 'balanceOf', address))
+            for index in range(balance):
+                token_id = await view(contract, 'tokenOfOwnerByIndex', address, to_uint(index))
+                owner = await view(contract, 'ownerOf', token_id) if token_id is not None else None
+                if owner != address:
+                    return "token {} at index {} of {} is owned by {}".format(
+                        token_id, index, holder, owner
+                    )
+                owned_tokens.append(token_id)
+
+        if sorted(owned_tokens) != sorted(all_tokens):
+            return "owners enumerate {}, tokenByIndex lists {}".format(owned_tokens, all_tokens)
+        return None
+    return invariant
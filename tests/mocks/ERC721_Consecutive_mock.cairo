@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.token.erc721.library import ERC721_initializer
+
+from openzeppelin.token.erc721_consecutive.library import (
+    ERC721_Consecutive_ownerOf,
+
+    ERC721_Consecutive_initializer,
+    ERC721_Consecutive_mint
+)
+
+#
+# Constructor
+#
+
+@constructor
+func constructor{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(
+        name: felt,
+        symbol: felt
+    ):
+    ERC721_initializer(name, symbol)
+    return ()
+end
+
+#
+# Getters
+#
+
+@view
+func ownerOf{
+        syscall_ptr : felt*, 
+        pedersen_ptr : HashBuiltin*,
+        range_check_ptr
+    }(tokenId: Uint256) -> (owner: felt):
+    let (owner: felt) = ERC721_Consecutive_ownerOf(tokenId)
+    return (owner)
+end
+
+#
+# Externals
+#
+
+@external
+func initialize{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(
+        recipients_len: felt,
+        recipients: felt*,
+        quantities_len: felt,
+        quantities: felt*
+    ):
+    ERC721_Consecutive_initializer(recipients_len, recipients, quantities_len, quantities)
+    return ()
+end
+
+@external
+func mint{
+        pedersen_ptr: HashBuiltin*, 
+        syscall_ptr: felt*, 
+        range_check_ptr
+    }(to: felt, tokenId: Uint256):
+    ERC721_Consecutive_mint(to, tokenId)
+    return ()
+end
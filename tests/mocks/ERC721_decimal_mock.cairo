@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.uint256 import Uint256
+
+from openzeppelin.token.erc721.library import (
+    _write_decimal,
+    _ascii_digits
+)
+
+#
+# Note the follow exposed functions are meant for testing.
+# Contracts should use `ERC721_tokenURIFromBase` from the ERC721 library.
+#
+
+@view
+func test_write_decimal{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (value: Uint256) -> (res_len: felt, res: felt*):
+    alloc_locals
+    let (local res: felt*) = alloc()
+    let (res_len) = _write_decimal(value, res)
+    return (res_len, res)
+end
+
+@view
+func test_ascii_digits{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (value: felt, min_digits: felt) -> (ascii: felt):
+    let (ascii) = _ascii_digits(value, min_digits, 1)
+    return (ascii)
+end
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.bool import TRUE, FALSE
+
+from openzeppelin.utils.bitmap import (
+    Bitmap_get,
+    Bitmap_set,
+    Bitmap_clear,
+    Bitmap_set_range,
+    Bitmap_clear_range
+)
+
+#
+# Note the follow exposed functions are meant for testing.
+# Contracts should import from the `bitmap.cairo` library.
+#
+
+@view
+func get{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt) -> (value: felt):
+    let (value) = Bitmap_get(bitmap, index)
+    return (value)
+end
+
+@external
+func set{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt):
+    Bitmap_set(bitmap, index)
+    return ()
+end
+
+@external
+func clear{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt):
+    Bitmap_clear(bitmap, index)
+    return ()
+end
+
+@external
+func setRange{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, len: felt):
+    Bitmap_set_range(bitmap, start, len)
+    return ()
+end
+
+@external
+func clearRange{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, len: felt):
+    Bitmap_clear_range(bitmap, start, len)
+    return ()
+end
+
+#
+# One storage slot per flag, the baseline of the benchmarks
+#
+
+@storage_var
+func naive_flags(bitmap: felt, index: felt) -> (value: felt):
+end
+
+@view
+func naiveGet{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt) -> (value: felt):
+    let (value) = naive_flags.read(bitmap, index)
+    return (value)
+end
+
+@external
+func naiveSet{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, index: felt):
+    naive_flags.write(bitmap, index, TRUE)
+    return ()
+end
+
+@external
+func naiveSetRange{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr
+    }(bitmap: felt, start: felt, len: felt):
+    if len == 0:
+        return ()
+    end
+
+    naive_flags.write(bitmap, start, TRUE)
+    return naiveSetRange(bitmap, start + 1, len - 1)
+end
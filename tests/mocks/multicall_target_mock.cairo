@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.alloc import alloc
+
+# Accepts an arbitrary calldata payload and returns `response_size` felts,
+# so the cost of routing calls through `Account.__execute__` can be measured
+# independently of any real contract logic.
+@external
+func echo(
+        data_len: felt,
+        data: felt*,
+        response_size: felt
+    ) -> (response_len: felt, response: felt*):
+    alloc_locals
+    let (local response: felt*) = alloc()
+    _fill(response_size, response)
+    return (response_len=response_size, response=response)
+end
+
+func _fill(len: felt, arr: felt*):
+    if len == 0:
+        return ()
+    end
+
+    assert [arr] = len
+    _fill(len - 1, arr + 1)
+    return ()
+end
@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MIT
+
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
+
+from openzeppelin.utils.packing import Packing_get, Packing_set
+
+#
+# Note the follow exposed functions are meant for testing.
+# Contracts should import from the `packing.cairo` library.
+#
+
+@view
+func get{
+        syscall_ptr: felt*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(word: felt, offset: felt, size: felt) -> (value: felt):
+    let (value) = Packing_get(word, offset, size)
+    return (value)
+end
+
+@view
+func set{
+        syscall_ptr: felt*,
+        bitwise_ptr: BitwiseBuiltin*,
+        range_check_ptr
+    }(word: felt, value: felt, offset: felt, size: felt) -> (new_word: felt):
+    let (new_word) = Packing_set(word, value, offset, size)
+    return (new_word)
+end
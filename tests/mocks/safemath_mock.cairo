@@ -10,7 +10,9 @@ from openzeppelin.security.safemath import (
     uint256_checked_sub_le,
     uint256_checked_sub_lt,
     uint256_checked_mul,
-    uint256_checked_div_rem
+    uint256_checked_div_rem,
+    uint256_add_nocheck_inputs,
+    uint256_sub_le_nocheck_inputs
 )
 
 #
@@ -48,6 +50,26 @@ func test_sub_lt{
     return (c)
 end
 
+@view
+func test_add_nocheck_inputs{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (a: Uint256, b: Uint256) -> (c: Uint256):
+    let (c: Uint256) = uint256_add_nocheck_inputs(a, b)
+    return (c)
+end
+
+@view
+func test_sub_le_nocheck_inputs{
+        syscall_ptr: felt*, 
+        pedersen_ptr: HashBuiltin*, 
+        range_check_ptr
+    } (a: Uint256, b: Uint256) -> (c: Uint256):
+    let (c: Uint256) = uint256_sub_le_nocheck_inputs(a, b)
+    return (c)
+end
+
 @view
 func test_mul{
         syscall_ptr: felt*, 
@@ -0,0 +1,652 @@
+"""
+Pure-Python reference models of the token libraries.
+
+Each model mirrors the storage layout, check order, error messages and
+events of its Cairo counterpart, so random operation sequences can be run
+at native speed and only a sample of them replayed against the contracts.
+
+A failed operation raises `ModelRevert` with the message the contract
+reverts with (`None` when the contract fails without an error message),
+and leaves the model unchanged, just like a reverted transaction.
+
+Amounts and token ids are uint256-ish tuples, as in the rest of the tests.
+Events are recorded as `(name, data)` pairs, with `data` laid out like the
+raw event data emitted by the contract.
+"""
+
+import copy
+import functools
+
+from utils import ZERO_ADDRESS, TRUE, FALSE, to_uint, from_uint
+
+
+MAX_UINT256_VALUE = 2**256 - 1
+
+
+class ModelRevert(Exception):
+    """Raised when the modeled contract call would revert."""
+
+    def __init__(self, message=None):
+        super().__init__(message)
+        self.message = message
+
+
+def revert_if(condition, message=None):
+    if condition:
+        raise ModelRevert(message)
+
+
+def is_valid_uint(value):
+    low, high = value
+    return 0 <= low < 2**128 and 0 <= high < 2**128
+
+
+def transaction(func):
+    """Rolls the model back if the call reverts, like StarkNet does."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # storage is made of flat containers of immutable values,
+        # so shallow copies are enough to restore it
+        snapshot = {key: copy.copy(value) for key, value in self.__dict__.items() if key != 'events'}
+        n_events = len(self.events)
+        try:
+            return func(self, *args, **kwargs)
+        except ModelRevert:
+            events = self.events[:n_events]
+            self.__dict__ = snapshot
+            self.events = events
+            raise
+    return wrapper
+
+
+class Model:
+    """Base class of all models, holding the emitted events."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, name, *data):
+        self.events.append((name, list(data)))
+
+    def snapshot(self):
+        return copy.deepcopy(self)
+
+
+#
+# Access and security
+#
+
+class OwnableMixin:
+    """Mirrors `access/ownable.cairo`."""
+
+    def _ownable_init(self, owner):
+        self.owner = owner
+
+    def _only_owner(self, caller):
+        revert_if(caller != self.owner, "Ownable: caller is not the owner")
+
+
+class PausableMixin:
+    """Mirrors `security/pausable.cairo`."""
+
+    def _pausable_init(self):
+        self.is_paused = FALSE
+
+    def paused(self):
+        return self.is_paused
+
+    def _when_not_paused(self):
+        revert_if(self.is_paused != FALSE, "Pausable: contract is paused")
+
+    def _when_paused(self):
+        revert_if(self.is_paused != TRUE, "Pausable: contract is not paused")
+
+    @transaction
+    def pause(self, caller):
+        self._only_owner(caller)
+        self._when_not_paused()
+        self.is_paused = TRUE
+
+    @transaction
+    def unpause(self, caller):
+        self._only_owner(caller)
+        self._when_paused()
+        self.is_paused = FALSE
+
+
+#
+# ERC20
+#
+
+class ERC20Model(Model):
+    """Mirrors `token/erc20/library.cairo`."""
+
+    def __init__(self, name, symbol, decimals):
+        super().__init__()
+        revert_if(decimals >= 256, "ERC20: decimals exceed 2^8")
+        self.name_ = name
+        self.symbol_ = symbol
+        self.decimals_ = decimals
+        self.total_supply = 0
+        self.balances = {}
+        self.allowances = {}
+
+    #
+    # Getters
+    #
+
+    def name(self):
+        return self.name_
+
+    def symbol(self):
+        return self.symbol_
+
+    def decimals(self):
+        return self.decimals_
+
+    def totalSupply(self):
+        return to_uint(self.total_supply)
+
+    def balanceOf(self, account):
+        return to_uint(self.balances.get(account, 0))
+
+    def allowance(self, owner, spender):
+        return to_uint(self.allowances.get((owner, spender), 0))
+
+    #
+    # Externals
+    #
+
+    @transaction
+    def transfer(self, caller, recipient, amount):
+        self._transfer(caller, recipient, amount)
+
+    @transaction
+    def transferFrom(self, caller, sender, recipient, amount):
+        revert_if(not is_valid_uint(amount), "ERC20: amount is not a valid Uint256")
+        current = self.allowances.get((sender, caller), 0)
+        # the maximum allowance is unlimited
+        if current != MAX_UINT256_VALUE:
+            revert_if(from_uint(amount) > current, "ERC20: transfer amount exceeds allowance")
+            self.allowances[(sender, caller)] = current - from_uint(amount)
+        self._transfer(sender, recipient, amount)
+
+    @transaction
+    def approve(self, caller, spender, amount):
+        self._approve(caller, spender, amount)
+
+    @transaction
+    def increaseAllowance(self, caller, spender, added_value):
+        # the library uses `with_attr error` here, so no message is surfaced
+        revert_if(not is_valid_uint(added_value))
+        new_allowance = self.allowances.get((caller, spender), 0) + from_uint(added_value)
+        revert_if(new_allowance > MAX_UINT256_VALUE, "ERC20: allowance overflow")
+        self._approve(caller, spender, to_uint(new_allowance))
+
+    @transaction
+    def decreaseAllowance(self, caller, spender, subtracted_value):
+        revert_if(not is_valid_uint(subtracted_value), "ERC20: subtracted_value is not a valid Uint256")
+        current = self.allowances.get((caller, spender), 0)
+        revert_if(from_uint(subtracted_value) > current, "ERC20: allowance below zero")
+        self._approve(caller, spender, to_uint(current - from_uint(subtracted_value)))
+
+    @transaction
+    def mint(self, recipient, amount):
+        revert_if(not is_valid_uint(amount), "ERC20: amount is not a valid Uint256")
+        revert_if(recipient == ZERO_ADDRESS, "ERC20: cannot mint to the zero address")
+        new_supply = self.total_supply + from_uint(amount)
+        revert_if(new_supply > MAX_UINT256_VALUE, "ERC20: mint overflow")
+        self.total_supply = new_supply
+        self.balances[recipient] = self.balances.get(recipient, 0) + from_uint(amount)
+        self.emit('Transfer', ZERO_ADDRESS, recipient, *amount)
+
+    @transaction
+    def burn(self, account, amount):
+        revert_if(not is_valid_uint(amount), "ERC20: amount is not a valid Uint256")
+        revert_if(account == ZERO_ADDRESS, "ERC20: cannot burn from the zero address")
+        balance = self.balances.get(account, 0)
+        revert_if(from_uint(amount) > balance, "ERC20: burn amount exceeds balance")
+        self.balances[account] = balance - from_uint(amount)
+        self.total_supply -= from_uint(amount)
+        self.emit('Transfer', account, ZERO_ADDRESS, *amount)
+
+    #
+    # Internals
+    #
+
+    def _approve(self, caller, spender, amount):
+        revert_if(not is_valid_uint(amount), "ERC20: amount is not a valid Uint256")
+        revert_if(caller == ZERO_ADDRESS, "ERC20: zero address cannot approve")
+        revert_if(spender == ZERO_ADDRESS, "ERC20: cannot approve to the zero address")
+        self.allowances[(caller, spender)] = from_uint(amount)
+        self.emit('Approval', caller, spender, *amount)
+
+    def _transfer(self, sender, recipient, amount):
+        revert_if(not is_valid_uint(amount), "ERC20: amount is not a valid Uint256")
+        revert_if(sender == ZERO_ADDRESS, "ERC20: cannot transfer from the zero address")
+        revert_if(recipient == ZERO_ADDRESS, "ERC20: cannot transfer to the zero address")
+        sender_balance = self.balances.get(sender, 0)
+        revert_if(from_uint(amount) > sender_balance, "ERC20: transfer amount exceeds balance")
+        self.balances[sender] = sender_balance - from_uint(amount)
+        self.balances[recipient] = self.balances.get(recipient, 0) + from_uint(amount)
+        self.emit('Transfer', sender, recipient, *amount)
+
+
+class ERC20MintableModel(OwnableMixin, ERC20Model):
+    """Mirrors the `ERC20_Mintable` preset."""
+
+    def __init__(self, name, symbol, decimals, initial_supply, recipient, owner):
+        super().__init__(name, symbol, decimals)
+        ERC20Model.mint(self, recipient, initial_supply)
+        self._ownable_init(owner)
+
+    @transaction
+    def mint(self, caller, to, amount):
+        self._only_owner(caller)
+        ERC20Model.mint(self, to, amount)
+
+
+class ERC20PausableModel(PausableMixin, OwnableMixin, ERC20Model):
+    """Mirrors the `ERC20_Pausable` preset."""
+
+    def __init__(self, name, symbol, decimals, initial_supply, recipient, owner):
+        super().__init__(name, symbol, decimals)
+        ERC20Model.mint(self, recipient, initial_supply)
+        self._ownable_init(owner)
+        self._pausable_init()
+
+    @transaction
+    def transfer(self, caller, recipient, amount):
+        self._when_not_paused()
+        ERC20Model.transfer(self, caller, recipient, amount)
+
+    @transaction
+    def transferFrom(self, caller, sender, recipient, amount):
+        self._when_not_paused()
+        ERC20Model.transferFrom(self, caller, sender, recipient, amount)
+
+    @transaction
+    def approve(self, caller, spender, amount):
+        self._when_not_paused()
+        ERC20Model.approve(self, caller, spender, amount)
+
+    @transaction
+    def increaseAllowance(self, caller, spender, added_value):
+        self._when_not_paused()
+        ERC20Model.increaseAllowance(self, caller, spender, added_value)
+
+    @transaction
+    def decreaseAllowance(self, caller, spender, subtracted_value):
+        self._when_not_paused()
+        ERC20Model.decreaseAllowance(self, caller, spender, subtracted_value)
+
+
+#
+# ERC721
+#
+
+class ERC721Model(Model):
+    """
+    Mirrors `token/erc721/library.cairo`.
+
+    `receivers` is the set of addresses accepted by `safeTransferFrom`,
+    i.e. ERC721 receivers and accounts.
+    """
+
+    def __init__(self, name, symbol, receivers=()):
+        super().__init__()
+        self.name_ = name
+        self.symbol_ = symbol
+        self.receivers = set(receivers)
+        self.owners = {}
+        self.balances = {}
+        self.token_approvals = {}
+        self.operator_approvals = {}
+        self.token_uri = {}
+
+    #
+    # Getters
+    #
+
+    def name(self):
+        return self.name_
+
+    def symbol(self):
+        return self.symbol_
+
+    def balanceOf(self, owner):
+        revert_if(owner == ZERO_ADDRESS, "ERC721: balance query for the zero address")
+        return to_uint(self.balances.get(owner, 0))
+
+    def ownerOf(self, token_id):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        owner = self.owners.get(token_id, ZERO_ADDRESS)
+        revert_if(owner == ZERO_ADDRESS, "ERC721: owner query for nonexistent token")
+        return owner
+
+    def getApproved(self, token_id):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        revert_if(not self._exists(token_id), "ERC721: approved query for nonexistent token")
+        return self.token_approvals.get(token_id, ZERO_ADDRESS)
+
+    def isApprovedForAll(self, owner, operator):
+        return self.operator_approvals.get((owner, operator), FALSE)
+
+    def tokenURI(self, token_id):
+        revert_if(not self._exists(token_id), "ERC721_Metadata: URI query for nonexistent token")
+        return self.token_uri.get(token_id, 0)
+
+    #
+    # Externals
+    #
+
+    @transaction
+    def approve(self, caller, to, token_id):
+        # the library misspells `error_message` here, so no message is surfaced
+        revert_if(not is_valid_uint(token_id))
+        revert_if(caller == ZERO_ADDRESS, "ERC721: cannot approve from the zero address")
+        owner = self.owners.get(token_id, ZERO_ADDRESS)
+        revert_if(owner == ZERO_ADDRESS, "ERC721: owner query for nonexistent token")
+        revert_if(owner == to, "ERC721: approval to current owner")
+        if caller != owner:
+            revert_if(
+                self.operator_approvals.get((owner, caller), FALSE) == FALSE,
+                "ERC721: approve caller is not owner nor approved for all"
+            )
+        self._approve(to, token_id)
+
+    @transaction
+    def setApprovalForAll(self, caller, operator, approved):
+        revert_if(caller * operator == 0, "ERC721: either the caller or operator is the zero address")
+        revert_if(caller == operator, "ERC721: approve to caller")
+        revert_if(approved * (1 - approved) != 0, "ERC721: approved is not a Cairo boolean")
+        self.operator_approvals[(caller, operator)] = approved
+        self.emit('ApprovalForAll', caller, operator, approved)
+
+    @transaction
+    def transferFrom(self, caller, from_, to, token_id):
+        self._check_approved(caller, token_id)
+        self._transfer(from_, to, token_id)
+
+    @transaction
+    def safeTransferFrom(self, caller, from_, to, token_id, data=()):
+        self._check_approved(caller, token_id)
+        self._transfer(from_, to, token_id)
+        self._check_receiver(to)
+
+    @transaction
+    def mint(self, to, token_id):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        revert_if(to == ZERO_ADDRESS, "ERC721: cannot mint to the zero address")
+        revert_if(self._exists(token_id), "ERC721: token already minted")
+        self.balances[to] = self.balances.get(to, 0) + 1
+        self.owners[token_id] = to
+        self.emit('Transfer', ZERO_ADDRESS, to, *token_id)
+
+    @transaction
+    def safeMint(self, to, token_id, data=()):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        ERC721Model.mint(self, to, token_id)
+        self._check_receiver(to)
+
+    @transaction
+    def burn(self, token_id):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        owner = self.ownerOf(token_id)
+        self._clear_approval(token_id)
+        self.balances[owner] -= 1
+        self.owners[token_id] = ZERO_ADDRESS
+        self.emit('Transfer', owner, ZERO_ADDRESS, *token_id)
+
+    @transaction
+    def setTokenURI(self, token_id, token_uri):
+        revert_if(not is_valid_uint(token_id))
+        revert_if(not self._exists(token_id), "ERC721_Metadata: set token URI for nonexistent token")
+        self.token_uri[token_id] = token_uri
+
+    #
+    # Internals
+    #
+
+    def _only_token_owner(self, caller, token_id):
+        revert_if(not is_valid_uint(token_id))
+        owner = self.ownerOf(token_id)
+        revert_if(caller != owner, "ERC721: caller is not the token owner")
+
+    def _exists(self, token_id):
+        return self.owners.get(token_id, ZERO_ADDRESS) != ZERO_ADDRESS
+
+    def _approve(self, to, token_id):
+        self.token_approvals[token_id] = to
+        owner = self.ownerOf(token_id)
+        self.emit('Approval', owner, to, *token_id)
+
+    def _clear_approval(self, token_id):
+        # nothing is written nor emitted when no address is approved
+        if self.token_approvals.get(token_id, ZERO_ADDRESS) != ZERO_ADDRESS:
+            self._approve(ZERO_ADDRESS, token_id)
+
+    def _is_approved_or_owner(self, spender, token_id):
+        revert_if(not self._exists(token_id), "ERC721: token id does not exist")
+        owner = self.ownerOf(token_id)
+        return (
+            owner == spender or
+            self.getApproved(token_id) == spender or
+            self.isApprovedForAll(owner, spender) == TRUE
+        )
+
+    def _check_approved(self, caller, token_id):
+        revert_if(not is_valid_uint(token_id), "ERC721: token_id is not a valid Uint256")
+        is_approved = self._is_approved_or_owner(caller, token_id)
+        revert_if(
+            caller == ZERO_ADDRESS or not is_approved,
+            "ERC721: either is not approved or the caller is the zero address"
+        )
+
+    def _transfer(self, from_, to, token_id):
+        revert_if(self.ownerOf(token_id) != from_, "ERC721: transfer from incorrect owner")
+        revert_if(to == ZERO_ADDRESS, "ERC721: cannot transfer to the zero address")
+        self._clear_approval(token_id)
+        self.balances[from_] -= 1
+        self.balances[to] = self.balances.get(to, 0) + 1
+        self.owners[token_id] = to
+        self.emit('Transfer', from_, to, *token_id)
+
+    def _check_receiver(self, to):
+        revert_if(to not in self.receivers, "ERC721: transfer to non ERC721Receiver implementer")
+
+
+class ERC721MintableBurnableModel(OwnableMixin, ERC721Model):
+    """Mirrors the `ERC721_Mintable_Burnable` preset."""
+
+    def __init__(self, name, symbol, owner, receivers=()):
+        super().__init__(name, symbol, receivers)
+        self._ownable_init(owner)
+
+    @transaction
+    def mint(self, caller, to, token_id):
+        self._only_owner(caller)
+        ERC721Model.mint(self, to, token_id)
+
+    @transaction
+    def burn(self, caller, token_id):
+        self._only_token_owner(caller, token_id)
+        ERC721Model.burn(self, token_id)
+
+    @transaction
+    def setTokenURI(self, caller, token_id, token_uri):
+        self._only_owner(caller)
+        ERC721Model.setTokenURI(self, token_id, token_uri)
+
+
+class ERC721MintablePausableModel(PausableMixin, OwnableMixin, ERC721Model):
+    """Mirrors the `ERC721_Mintable_Pausable` preset."""
+
+    def __init__(self, name, symbol, owner, receivers=()):
+        super().__init__(name, symbol, receivers)
+        self._ownable_init(owner)
+        self._pausable_init()
+
+    @transaction
+    def approve(self, caller, to, token_id):
+        self._when_not_paused()
+        ERC721Model.approve(self, caller, to, token_id)
+
+    @transaction
+    def setApprovalForAll(self, caller, operator, approved):
+        self._when_not_paused()
+        ERC721Model.setApprovalForAll(self, caller, operator, approved)
+
+    @transaction
+    def transferFrom(self, caller, from_, to, token_id):
+        self._when_not_paused()
+        ERC721Model.transferFrom(self, caller, from_, to, token_id)
+
+    @transaction
+    def safeTransferFrom(self, caller, from_, to, token_id, data=()):
+        self._when_not_paused()
+        ERC721Model.safeTransferFrom(self, caller, from_, to, token_id, data)
+
+    @transaction
+    def mint(self, caller, to, token_id):
+        self._when_not_paused()
+        self._only_owner(caller)
+        ERC721Model.mint(self, to, token_id)
+
+    @transaction
+    def setTokenURI(self, caller, token_id, token_uri):
+        self._only_owner(caller)
+        ERC721Model.setTokenURI(self, token_id, token_uri)
+
+
+class ERC721EnumerableModel(ERC721Model):
+    """
+    Mirrors `token/erc721_enumerable/library.cairo`.
+
+    Enumeration is kept slot by slot, exactly as the library stores it,
+    so stale entries left behind by the library are reproduced too.
+    """
+
+    def __init__(self, name, symbol, receivers=()):
+        super().__init__(name, symbol, receivers)
+        self.all_tokens_len = 0
+        self.all_tokens = {}
+        self.all_tokens_index = {}
+        self.owned_tokens = {}
+        self.owned_tokens_index = {}
+
+    #
+    # Getters
+    #
+
+    def totalSupply(self):
+        return to_uint(self.all_tokens_len)
+
+    def tokenByIndex(self, index):
+        revert_if(not is_valid_uint(index))
+        revert_if(from_uint(index) >= self.all_tokens_len, "ERC721_Enumerable: global index out of bounds")
+        return self.all_tokens.get(from_uint(index), to_uint(0))
+
+    def tokenOfOwnerByIndex(self, owner, index):
+        revert_if(not is_valid_uint(index))
+        length = from_uint(self.balanceOf(owner))
+        revert_if(from_uint(index) >= length, "ERC721_Enumerable: owner index out of bounds")
+        return self.owned_tokens.get((owner, from_uint(index)), to_uint(0))
+
+    #
+    # Externals
+    #
+
+    @transaction
+    def mint(self, to, token_id):
+        self._add_token_to_all_tokens_enumeration(token_id)
+        self._add_token_to_owner_enumeration(to, token_id)
+        ERC721Model.mint(self, to, token_id)
+
+    @transaction
+    def burn(self, token_id):
+        from_ = self.ownerOf(token_id)
+        self._remove_token_from_owner_enumeration(from_, token_id)
+        self._remove_token_from_all_tokens_enumeration(token_id)
+        ERC721Model.burn(self, token_id)
+
+    @transaction
+    def transferFrom(self, caller, from_, to, token_id):
+        self._transfer_token_owner_enumeration(from_, to, token_id)
+        ERC721Model.transferFrom(self, caller, from_, to, token_id)
+
+    @transaction
+    def safeTransferFrom(self, caller, from_, to, token_id, data=()):
+        self._transfer_token_owner_enumeration(from_, to, token_id)
+        ERC721Model.safeTransferFrom(self, caller, from_, to, token_id, data)
+
+    #
+    # Internals
+    #
+
+    def _add_token_to_all_tokens_enumeration(self, token_id):
+        supply = self.all_tokens_len
+        self.all_tokens[supply] = token_id
+        self.all_tokens_index[token_id] = supply
+        self.all_tokens_len = supply + 1
+
+    def _remove_token_from_all_tokens_enumeration(self, token_id):
+        last_token_index = self.all_tokens_len - 1
+        token_index = self.all_tokens_index.get(token_id, 0)
+        last_token_id = self.all_tokens.get(last_token_index, to_uint(0))
+
+        self.all_tokens[last_token_index] = to_uint(0)
+        self.all_tokens[token_index] = last_token_id
+        self.all_tokens_index[last_token_id] = token_index
+        self.all_tokens_index[token_id] = 0
+        self.all_tokens_len = last_token_index
+
+    def _add_token_to_owner_enumeration(self, to, token_id):
+        length = from_uint(self.balanceOf(to))
+        self.owned_tokens[(to, length)] = token_id
+        self.owned_tokens_index[token_id] = length
+
+    def _transfer_token_owner_enumeration(self, from_, to, token_id):
+        if from_ == to:
+            return
+        self._remove_token_from_owner_enumeration(from_, token_id)
+        self._add_token_to_owner_enumeration(to, token_id)
+
+    def _remove_token_from_owner_enumeration(self, from_, token_id):
+        balance = from_uint(self.balanceOf(from_))
+        last_token_index = balance - 1
+        token_index = self.owned_tokens_index.get(token_id, 0)
+
+        if token_index == last_token_index:
+            self.owned_tokens_index[token_id] = 0
+            self.owned_tokens[(from_, last_token_index)] = to_uint(0)
+            return
+
+        last_token_id = self.owned_tokens.get((from_, last_token_index), to_uint(0))
+        self.owned_tokens[(from_, token_index)] = last_token_id
+        self.owned_tokens_index[last_token_id] = token_index
+        self.owned_tokens_index[token_id] = 0
+        self.owned_tokens[(from_, last_token_index)] = to_uint(0)
+
+
+class ERC721EnumerableMintableBurnableModel(OwnableMixin, ERC721EnumerableModel):
+    """Mirrors the `ERC721_Enumerable_Mintable_Burnable` preset."""
+
+    def __init__(self, name, symbol, owner, receivers=()):
+        super().__init__(name, symbol, receivers)
+        self._ownable_init(owner)
+
+    @transaction
+    def mint(self, caller, to, token_id):
+        self._only_owner(caller)
+        ERC721EnumerableModel.mint(self, to, token_id)
+
+    @transaction
+    def burn(self, caller, token_id):
+        self._only_token_owner(caller, token_id)
+        ERC721EnumerableModel.burn(self, token_id)
+
+    @transaction
+    def setTokenURI(self, caller, token_id, token_uri):
+        self._only_owner(caller)
+        ERC721Model.setTokenURI(self, token_id, token_uri)
@@ -117,6 +117,59 @@ async def test_sub_le_overflow(safemath_mock):
     await assert_revert(safemath.test_sub_le(a, b).invoke())
 
 
+@pytest.mark.asyncio
+async def test_add_nocheck_inputs(safemath_mock):
+    safemath = safemath_mock
+
+    a = to_uint(56789)
+    b = to_uint(1234)
+    c = add_uint(a, b)
+
+    execution_info = await safemath.test_add_nocheck_inputs(a, b).invoke()
+    assert execution_info.result == (c,)
+
+
+@pytest.mark.asyncio
+async def test_add_nocheck_inputs_overflow(safemath_mock):
+    safemath = safemath_mock
+
+    a = MAX_UINT256
+    b = to_uint(1)
+
+    await assert_revert(
+        safemath.test_add_nocheck_inputs(a, b).invoke(),
+        reverted_with="Safemath: addition overflow"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sub_le_nocheck_inputs(safemath_mock):
+    safemath = safemath_mock
+
+    a = to_uint(56789)
+    b = to_uint(1234)
+    c = sub_uint(a, b)
+
+    execution_info = await safemath.test_sub_le_nocheck_inputs(a, b).invoke()
+    assert execution_info.result == (c,)
+
+    execution_info = await safemath.test_sub_le_nocheck_inputs(MAX_UINT256, MAX_UINT256).invoke()
+    assert execution_info.result == (to_uint(0),)
+
+
+@pytest.mark.asyncio
+async def test_sub_le_nocheck_inputs_overflow(safemath_mock):
+    safemath = safemath_mock
+
+    a = to_uint(1234)
+    b = to_uint(56789)
+
+    await assert_revert(
+        safemath.test_sub_le_nocheck_inputs(a, b).invoke(),
+        reverted_with="Safemath: subtraction overflow"
+    )
+
+
 @pytest.mark.asyncio
 async def test_mul(safemath_mock):
     safemath = safemath_mock
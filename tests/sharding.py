@@ -0,0 +1,211 @@
+"""
+Pytest plugin distributing test modules by their recorded duration.
+
+Durations are read from a JSON report produced by the timing plugin
+(`pytest --timing-report=tests/durations.json`). The cost of a module is
+the time of its tests plus the time of the fixtures it defines, so modules
+sharing module-scoped deployments are always kept together.
+
+Two modes are supported:
+
+    pytest -n auto --dist loadfile
+        pytest-xdist hands out whole modules, heaviest first, to whichever
+        worker is idle.
+
+    pytest --num-shards=4 --shard-id=0
+        only the modules assigned to shard 0 are run. Modules are assigned
+        heaviest first to the lightest shard, so every CI job sharing the
+        same durations file gets a disjoint, balanced subset.
+
+Modules missing from the durations file (e.g. new ones) are estimated from
+their number of tests and the average cost of a test. As few but slow tests
+are badly estimated, CI runs `pytest --collect-only --check-durations`, which
+fails when any collected test is missing from the durations file.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+DEFAULT_DURATIONS_PATH = 'tests/durations.json'
+
+
+def module_of(nodeid):
+    return nodeid.split('::', 1)[0]
+
+
+def load_report(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_module_durations(report):
+    """Returns the recorded cost in seconds of every module, tests and fixtures included."""
+    durations = {}
+    for nodeid, record in report.get('tests', {}).items():
+        module = module_of(nodeid)
+        durations[module] = durations.get(module, 0.0) + record['total']
+    for key, record in report.get('fixtures', {}).items():
+        # fixtures are keyed by `<baseid>::<name>`, where baseid is the defining module
+        module = module_of(key)
+        if module in durations:
+            durations[module] += record['total']
+    return durations
+
+
+def estimate_costs(module_tests, durations):
+    """
+    Returns the cost of every module in `module_tests` (a module to number
+    of tests mapping), estimating the ones without recorded durations.
+    """
+    known = [module for module in module_tests if module in durations]
+    known_tests = sum(module_tests[module] for module in known)
+    if known_tests > 0:
+        per_test = sum(durations[module] for module in known) / known_tests
+    else:
+        per_test = 1.0
+
+    return {
+        module: durations[module] if module in durations else n_tests * per_test
+        for module, n_tests in module_tests.items()
+    }
+
+
+def assign_shards(costs, num_shards):
+    """
+    Splits modules in `num_shards` groups of similar total cost.
+    Returns a list with the modules of each shard.
+    """
+    shards = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+    # sort by name first so ties are broken the same way on every job
+    for module in sorted(sorted(costs), key=lambda module: -costs[module]):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(module)
+        loads[lightest] += costs[module]
+    return shards
+
+
+class ShardingPlugin:
+    """
+    Deselects the modules of other shards and, under pytest-xdist,
+    schedules modules heaviest first.
+
+    Parameters
+    ----------
+
+    durations_path : str
+        Path of the timing report to read durations from.
+
+    num_shards : int
+
+    shard_id : int or None
+        Index of the shard to run, `None` to run every module.
+
+    check : bool
+        Whether to fail when collected tests are missing from the report.
+
+    """
+
+    def __init__(self, durations_path, num_shards=1, shard_id=None, check=False):
+        report = load_report(durations_path)
+        self.durations_path = durations_path
+        self.recorded = set(report.get('tests', {}))
+        self.durations = load_module_durations(report)
+        self.num_shards = num_shards
+        self.shard_id = shard_id
+        self.check = check
+
+    def pytest_collection_modifyitems(self, config, items):
+        if self.check:
+            self.check_durations(items)
+
+        if self.shard_id is None:
+            return
+
+        module_tests = {}
+        for item in items:
+            module = module_of(item.nodeid)
+            module_tests[module] = module_tests.get(module, 0) + 1
+
+        shards = assign_shards(estimate_costs(module_tests, self.durations), self.num_shards)
+        selected = set(shards[self.shard_id])
+
+        deselected = [item for item in items if module_of(item.nodeid) not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if module_of(item.nodeid) in selected]
+
+    def check_durations(self, items):
+        missing = sorted({
+            module_of(item.nodeid) for item in items if item.nodeid not in self.recorded
+        })
+        if missing:
+            raise pytest.UsageError(
+                "{} is stale, no durations recorded for tests of:\n    {}\n"
+                "Regenerate it with `pytest --timing-report={}`".format(
+                    self.durations_path, "\n    ".join(missing), DEFAULT_DURATIONS_PATH
+                )
+            )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        # other modes, `loadscope` included, keep their own xdist scheduler
+        if config.getvalue('dist') != 'loadfile':
+            return None
+        return make_duration_scheduler(config, log, self.durations)
+
+
+def make_duration_scheduler(config, log, durations):
+    from xdist.scheduler import LoadFileScheduling
+
+    class DurationScheduling(LoadFileScheduling):
+        """Like `--dist loadfile`, but always hands out the heaviest pending module."""
+
+        def _assign_work_unit(self, node):
+            module_tests = {scope: len(work_unit) for scope, work_unit in self.workqueue.items()}
+            costs = estimate_costs(module_tests, durations)
+            heaviest = max(self.workqueue, key=lambda scope: costs[scope])
+            self.workqueue.move_to_end(heaviest, last=False)
+            super()._assign_work_unit(node)
+
+    return DurationScheduling(config, log)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('sharding')
+    group.addoption(
+        '--shard-durations', action='store', default=DEFAULT_DURATIONS_PATH, metavar='PATH',
+        help="timing report used to balance modules (default: %(default)s)"
+    )
+    group.addoption(
+        '--num-shards', action='store', type=int, default=1,
+        help="split the test modules in this many shards"
+    )
+    group.addoption(
+        '--shard-id', action='store', type=int, default=None,
+        help="run only the modules of this shard, from 0 to --num-shards - 1"
+    )
+    group.addoption(
+        '--check-durations', action='store_true', default=False,
+        help="fail if any collected test is missing from --shard-durations"
+    )
+
+
+def pytest_configure(config):
+    num_shards = config.getoption('--num-shards')
+    shard_id = config.getoption('--shard-id')
+    if shard_id is not None and not 0 <= shard_id < num_shards:
+        raise pytest.UsageError("--shard-id must be between 0 and --num-shards - 1")
+
+    path = Path(config.getoption('--shard-durations'))
+    if not path.is_absolute():
+        path = config.rootpath / path
+
+    plugin = ShardingPlugin(path, num_shards, shard_id, config.getoption('--check-durations'))
+    config.pluginmanager.register(plugin, 'sharding-plugin')
@@ -0,0 +1,157 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import TRUE, FALSE, assert_revert, get_contract_def, cached_contract
+
+BITMAP = 1
+OTHER_BITMAP = 2
+BITS_PER_WORD = 251
+
+
+@pytest.fixture(scope='module')
+def bitmap_def():
+    return get_contract_def('tests/mocks/bitmap_mock.cairo')
+
+
+@pytest.fixture(scope='module')
+async def bitmap_init(bitmap_def):
+    starknet = await Starknet.empty()
+    bitmap = await starknet.deploy(contract_def=bitmap_def)
+    return starknet.state, bitmap
+
+
+@pytest.fixture
+def bitmap_mock(bitmap_def, bitmap_init):
+    state, bitmap = bitmap_init
+    _state = state.copy()
+    return cached_contract(_state, bitmap_def, bitmap)
+
+
+async def flags(bitmap, indices, bitmap_id=BITMAP):
+    values = []
+    for index in indices:
+        execution_info = await bitmap.get(bitmap_id, index).invoke()
+        values.append(execution_info.result.value)
+    return values
+
+
+@pytest.mark.asyncio
+async def test_get_unset(bitmap_mock):
+    bitmap = bitmap_mock
+
+    assert await flags(bitmap, [0, 1, BITS_PER_WORD, 10**9]) == [FALSE] * 4
+
+
+@pytest.mark.asyncio
+async def test_set(bitmap_mock):
+    bitmap = bitmap_mock
+    # first and last bits of the first two words
+    indices = [0, BITS_PER_WORD - 1, BITS_PER_WORD, 2 * BITS_PER_WORD - 1]
+
+    for index in indices:
+        await bitmap.set(BITMAP, index).invoke()
+
+    assert await flags(bitmap, indices) == [TRUE] * len(indices)
+    assert await flags(bitmap, [1, BITS_PER_WORD - 2, BITS_PER_WORD + 1]) == [FALSE] * 3
+
+    # setting twice keeps the flag
+    await bitmap.set(BITMAP, 0).invoke()
+    assert await flags(bitmap, [0]) == [TRUE]
+
+
+@pytest.mark.asyncio
+async def test_bitmaps_are_independent(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.set(BITMAP, 5).invoke()
+
+    assert await flags(bitmap, [5], OTHER_BITMAP) == [FALSE]
+
+
+@pytest.mark.asyncio
+async def test_clear(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.set(BITMAP, 3).invoke()
+    await bitmap.set(BITMAP, 4).invoke()
+    await bitmap.clear(BITMAP, 3).invoke()
+
+    assert await flags(bitmap, [3, 4]) == [FALSE, TRUE]
+
+    # clearing an unset flag is a no-op
+    await bitmap.clear(BITMAP, 3).invoke()
+    assert await flags(bitmap, [3, 4]) == [FALSE, TRUE]
+
+
+@pytest.mark.asyncio
+async def test_set_range(bitmap_mock):
+    bitmap = bitmap_mock
+    # spans the end of the first word, a whole word and the start of the next one
+    start, length = 200, 2 * BITS_PER_WORD
+
+    await bitmap.setRange(BITMAP, start, length).invoke()
+
+    indices = [start - 1, start, BITS_PER_WORD - 1, BITS_PER_WORD, start + length - 1, start + length]
+    assert await flags(bitmap, indices) == [FALSE, TRUE, TRUE, TRUE, TRUE, FALSE]
+
+
+@pytest.mark.asyncio
+async def test_set_range_within_word(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.setRange(BITMAP, 10, 3).invoke()
+
+    assert await flags(bitmap, range(9, 14)) == [FALSE, TRUE, TRUE, TRUE, FALSE]
+
+
+@pytest.mark.asyncio
+async def test_set_range_whole_word(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.setRange(BITMAP, BITS_PER_WORD, BITS_PER_WORD).invoke()
+
+    indices = [BITS_PER_WORD - 1, BITS_PER_WORD, 2 * BITS_PER_WORD - 1, 2 * BITS_PER_WORD]
+    assert await flags(bitmap, indices) == [FALSE, TRUE, TRUE, FALSE]
+
+
+@pytest.mark.asyncio
+async def test_set_range_empty(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.setRange(BITMAP, 10, 0).invoke()
+
+    assert await flags(bitmap, [9, 10, 11]) == [FALSE] * 3
+
+
+@pytest.mark.asyncio
+async def test_clear_range(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await bitmap.setRange(BITMAP, 0, 3 * BITS_PER_WORD).invoke()
+    await bitmap.clearRange(BITMAP, 100, BITS_PER_WORD + 50).invoke()
+
+    indices = [99, 100, BITS_PER_WORD, BITS_PER_WORD + 149, BITS_PER_WORD + 150]
+    assert await flags(bitmap, indices) == [TRUE, FALSE, FALSE, FALSE, TRUE]
+
+
+@pytest.mark.asyncio
+async def test_set_range_invalid(bitmap_mock):
+    bitmap = bitmap_mock
+
+    await assert_revert(
+        bitmap.setRange(BITMAP, 10, 2**128).invoke(),
+        reverted_with="Bitmap: invalid range"
+    )
+
+
+@pytest.mark.asyncio
+async def test_matches_naive(bitmap_mock):
+    bitmap = bitmap_mock
+    indices = [0, 7, 250, 251, 600]
+
+    for index in indices:
+        await bitmap.set(BITMAP, index).invoke()
+        await bitmap.naiveSet(BITMAP, index).invoke()
+
+    for index in indices + [1, 252, 599]:
+        execution_info = await bitmap.naiveGet(BITMAP, index).invoke()
+        assert await flags(bitmap, [index]) == [execution_info.result.value]
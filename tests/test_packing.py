@@ -0,0 +1,88 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import assert_revert, contract_path
+
+# (offset, size) of the fields of a sample layout
+DECIMALS = (0, 8)
+PAUSED = (8, 1)
+SUPPLY = (9, 128)
+# the last field ends on the last usable bit
+TAIL = (137, 114)
+
+
+@pytest.fixture(scope='module')
+async def packing_mock():
+    starknet = await Starknet.empty()
+    packing = await starknet.deploy(
+        contract_path("tests/mocks/packing_mock.cairo")
+    )
+
+    return packing
+
+
+async def pack(packing, word, value, field):
+    execution_info = await packing.set(word, value, *field).invoke()
+    return execution_info.result.new_word
+
+
+async def unpack(packing, word, field):
+    execution_info = await packing.get(word, *field).invoke()
+    return execution_info.result.value
+
+
+@pytest.mark.asyncio
+async def test_pack_and_unpack(packing_mock):
+    packing = packing_mock
+    values = {DECIMALS: 18, PAUSED: 1, SUPPLY: 2**128 - 1, TAIL: 2**114 - 1}
+
+    word = 0
+    for field, value in values.items():
+        word = await pack(packing, word, value, field)
+
+    assert word == sum(value << offset for (offset, _), value in values.items())
+    for field, value in values.items():
+        assert await unpack(packing, word, field) == value
+
+
+@pytest.mark.asyncio
+async def test_set_replaces_field(packing_mock):
+    packing = packing_mock
+
+    word = await pack(packing, 0, 18, DECIMALS)
+    word = await pack(packing, word, 1, PAUSED)
+    word = await pack(packing, word, 6, DECIMALS)
+    word = await pack(packing, word, 0, PAUSED)
+
+    assert word == 6
+    assert await unpack(packing, word, DECIMALS) == 6
+    assert await unpack(packing, word, PAUSED) == 0
+
+
+@pytest.mark.asyncio
+async def test_set_value_out_of_range(packing_mock):
+    packing = packing_mock
+
+    await assert_revert(
+        packing.set(0, 2**8, *DECIMALS).invoke(),
+        reverted_with="Packing: value out of range"
+    )
+
+    await assert_revert(
+        packing.set(0, 2, *PAUSED).invoke(),
+        reverted_with="Packing: value out of range"
+    )
+
+
+@pytest.mark.asyncio
+async def test_field_out_of_bounds(packing_mock):
+    packing = packing_mock
+
+    await assert_revert(
+        packing.get(0, 200, 52).invoke(),
+        reverted_with="Packing: field out of bounds"
+    )
+
+    await assert_revert(
+        packing.set(0, 0, 8, 0).invoke(),
+        reverted_with="Packing: field out of bounds"
+    )
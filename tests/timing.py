@@ -0,0 +1,216 @@
+"""
+Pytest plugin breaking down where the test suite spends its time.
+
+While enabled, the plugin wraps the helpers every test goes through and
+accumulates their wall time into phases:
+
+    compile  - `compile_starknet_files`, used by `get_contract_def` and `Starknet.deploy`
+    deploy   - `StarknetState.deploy`, including the constructor execution
+    copy     - `StarknetState.copy`, including the copies made by `.call()`
+    sign     - `get_transaction_hash` and `Signer.sign`
+    execute  - `StarknetState.invoke_raw`, i.e. VM execution of `.call()` and `.invoke()`
+
+Time is attributed to the fixture being set up or to the test being run, and
+anything not covered by a phase is reported as `other`. Nested phases are
+attributed to the outermost one so no time is counted twice.
+
+Enable it with `pytest --timing`, or write a JSON report with
+`pytest --timing-report=timing.json` (implies `--timing`).
+"""
+
+import functools
+import inspect
+import json
+import time
+from collections import defaultdict
+
+import pytest
+import starkware.starknet.testing.starknet as starknet_module
+from starkware.starknet.testing.state import StarknetState
+
+import utils
+
+
+PHASES = ('compile', 'deploy', 'copy', 'sign', 'execute')
+
+# (owner, attribute, phase) triples of the helpers being timed
+TARGETS = [
+    (utils, 'compile_starknet_files', 'compile'),
+    (starknet_module, 'compile_starknet_files', 'compile'),
+    (StarknetState, 'deploy', 'deploy'),
+    (StarknetState, 'copy', 'copy'),
+    (utils, 'get_transaction_hash', 'sign'),
+    (utils.Signer, 'sign', 'sign'),
+    (StarknetState, 'invoke_raw', 'execute'),
+]
+
+
+def new_record():
+    return {'total': 0.0, 'other': 0.0, **{phase: 0.0 for phase in PHASES}}
+
+
+def merge_records(into, records):
+    for key, record in records.items():
+        target = into.setdefault(key, new_record())
+        for field, value in record.items():
+            target[field] = target.get(field, 0.0) + value
+
+
+class TimingPlugin:
+    """
+    Collects per-phase timings for every fixture setup and test call.
+
+    Parameters
+    ----------
+
+    report_path : str or None
+        Path where the JSON report is written at the end of the session.
+
+    """
+
+    def __init__(self, report_path=None):
+        self.report_path = report_path
+        self.tests = defaultdict(new_record)
+        self.fixtures = defaultdict(new_record)
+        self._owners = []
+        self._depth = 0
+        self._originals = []
+
+    #
+    # Instrumentation
+    #
+
+    def install(self):
+        for owner, name, phase in TARGETS:
+            original = owner.__dict__[name]
+            self._originals.append((owner, name, original))
+            setattr(owner, name, self._wrap(original, phase))
+
+    def uninstall(self):
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+
+    def _wrap(self, func, phase):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = self._enter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._exit(phase, start)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = self._enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(phase, start)
+        return wrapper
+
+    def _enter(self):
+        self._depth += 1
+        return time.perf_counter()
+
+    def _exit(self, phase, start):
+        self._depth -= 1
+        if self._depth == 0 and self._owners:
+            self._owners[-1][phase] += time.perf_counter() - start
+
+    def _timed(self, record):
+        self._owners.append(record)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._owners.pop()
+            record['total'] += elapsed
+            # nested fixtures are timed on their own, don't count them twice
+            if self._owners:
+                self._owners[-1]['total'] -= elapsed
+
+    #
+    # Hooks
+    #
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        record = self.fixtures["{}::{}".format(fixturedef.baseid, fixturedef.argname)]
+        yield from self._timed(record)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._timed(self.tests[item.nodeid])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # gather the records of pytest-xdist workers on the controller
+        output = getattr(node, 'workeroutput', {}).get('timing')
+        if output is not None:
+            data = json.loads(output)
+            merge_records(self.tests, data['tests'])
+            merge_records(self.fixtures, data['fixtures'])
+
+    def pytest_sessionfinish(self, session):
+        self.uninstall()
+        for record in (*self.tests.values(), *self.fixtures.values()):
+            record['other'] = record['total'] - sum(record[phase] for phase in PHASES)
+
+        report = self.report()
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput['timing'] = json.dumps(report)
+        elif self.report_path is not None:
+            with open(self.report_path, 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        report = self.report()
+        terminalreporter.write_sep('=', 'timing breakdown')
+        for key, value in report['phases'].items():
+            terminalreporter.write_line("{:<8} {:>10.3f}s".format(key, value))
+
+        slowest = sorted(report['tests'].items(), key=lambda item: item[1]['total'], reverse=True)
+        terminalreporter.write_sep('-', 'slowest tests')
+        for nodeid, record in slowest[:10]:
+            phases = ' '.join("{}={:.3f}".format(phase, record[phase]) for phase in PHASES)
+            terminalreporter.write_line("{:>8.3f}s {} ({})".format(record['total'], nodeid, phases))
+
+    #
+    # Report
+    #
+
+    def report(self):
+        phases = new_record()
+        for record in (*self.tests.values(), *self.fixtures.values()):
+            for field, value in record.items():
+                phases[field] += value
+        return {
+            'phases': phases,
+            'tests': dict(self.tests),
+            'fixtures': dict(self.fixtures),
+        }
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('timing')
+    group.addoption(
+        '--timing', action='store_true', default=False,
+        help="report time spent compiling, deploying, copying state, signing and executing"
+    )
+    group.addoption(
+        '--timing-report', action='store', default=None, metavar='PATH',
+        help="write the timing breakdown as JSON to PATH (implies --timing)"
+    )
+
+
+def pytest_configure(config):
+    report_path = config.getoption('--timing-report')
+    if config.getoption('--timing') or report_path is not None:
+        plugin = TimingPlugin(report_path)
+        plugin.install()
+        config.pluginmanager.register(plugin, 'timing-plugin')
@@ -1,4 +1,7 @@
 import pytest
+from starkware.cairo.common.hash_state import compute_hash_on_elements
+from starkware.starknet.business_logic.state.state import BlockInfo
+from starkware.starknet.definitions.general_config import StarknetChainId
 from starkware.starknet.testing.starknet import Starknet
 from utils import (
     Signer, to_uint, add_uint, sub_uint, str_to_felt, MAX_UINT256, ZERO_ADDRESS, INVALID_UINT256,
@@ -6,6 +9,7 @@ from utils import (
 )
 
 signer = Signer(123456789987654321)
+other = Signer(987654321123456789)
 
 # testing vars
 RECIPIENT = 123
@@ -16,6 +20,7 @@ UINT_ZERO = to_uint(0)
 NAME = str_to_felt("Token")
 SYMBOL = str_to_felt("TKN")
 DECIMALS = 18
+DEADLINE = 100
 
 
 @pytest.fixture(scope='module')
@@ -128,6 +133,56 @@ async def test_decimals(erc20_factory):
     assert execution_info.result.decimals == DECIMALS
 
 
+#
+# balanceOfBatch and allowanceBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_balanceOfBatch(erc20_factory):
+    erc20, account, account2 = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *AMOUNT]
+    )
+
+    accounts = [account.contract_address, RECIPIENT, account2.contract_address, RECIPIENT]
+    execution_info = await erc20.balanceOfBatch(accounts).invoke()
+    assert execution_info.result.balances == [
+        sub_uint(INIT_SUPPLY, AMOUNT), AMOUNT, UINT_ZERO, AMOUNT
+    ]
+
+    execution_info = await erc20.balanceOfBatch([]).invoke()
+    assert execution_info.result.balances == []
+
+
+@pytest.mark.asyncio
+async def test_allowanceBatch(erc20_factory):
+    erc20, account, account2 = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [RECIPIENT, *AMOUNT]
+    )
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [account2.contract_address, *MAX_UINT256]
+    )
+
+    owners = [account.contract_address, account.contract_address, account2.contract_address]
+    spenders = [RECIPIENT, account2.contract_address, RECIPIENT]
+    execution_info = await erc20.allowanceBatch(owners, spenders).invoke()
+    assert execution_info.result.remaining == [AMOUNT, MAX_UINT256, UINT_ZERO]
+
+
+@pytest.mark.asyncio
+async def test_allowanceBatch_lengths_differ(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    await assert_revert(
+        erc20.allowanceBatch([account.contract_address], [RECIPIENT, RECIPIENT]).invoke(),
+        reverted_with="ERC20: owners and spenders lengths differ"
+    )
+
+
 #
 # approve
 #
@@ -328,6 +383,162 @@ async def test_transfer_invalid_uint256(erc20_factory):
     )
 
 
+#
+# transferBatch
+#
+
+
+def batch_calldata(recipients, amounts):
+    return [
+        len(recipients), *recipients,
+        len(amounts), *[felt for amount in amounts for felt in amount]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transferBatch(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    recipients = [RECIPIENT, account2.contract_address, RECIPIENT]
+    amounts = [AMOUNT, UINT_ONE, AMOUNT]
+
+    return_bool = await signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)
+    )
+    assert return_bool.result.response == [TRUE]
+
+    # check account balance
+    execution_info = await erc20.balanceOf(account.contract_address).invoke()
+    total = add_uint(add_uint(AMOUNT, UINT_ONE), AMOUNT)
+    assert execution_info.result.balance == sub_uint(INIT_SUPPLY, total)
+
+    # check recipients balances
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == add_uint(AMOUNT, AMOUNT)
+
+    execution_info = await erc20.balanceOf(account2.contract_address).invoke()
+    assert execution_info.result.balance == UINT_ONE
+
+    # check totalSupply
+    execution_info = await erc20.totalSupply().invoke()
+    assert execution_info.result.totalSupply == INIT_SUPPLY
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_emits_events(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    recipients = [RECIPIENT, account2.contract_address]
+    amounts = [AMOUNT, UINT_ONE]
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)
+    )
+
+    for recipient, amount in zip(recipients, amounts):
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc20.contract_address,
+            name='Transfer',
+            data=[
+                account.contract_address,
+                recipient,
+                *amount
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_to_self(erc20_factory):
+    erc20, account, _ = erc20_factory
+    recipients = [account.contract_address, RECIPIENT]
+    amounts = [INIT_SUPPLY, AMOUNT]
+
+    # the sender is debited for the whole batch before any credit
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: transfer amount exceeds balance"
+    )
+
+    recipients = [account.contract_address]
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, [AMOUNT])
+    )
+
+    execution_info = await erc20.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == INIT_SUPPLY
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_not_enough_balance(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    recipients = [RECIPIENT, account2.contract_address]
+    amounts = [INIT_SUPPLY, UINT_ONE]
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: transfer amount exceeds balance"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_total_overflow(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    recipients = [RECIPIENT, account2.contract_address]
+    amounts = [MAX_UINT256, UINT_ONE]
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: transfer amount exceeds balance"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_to_zero_address(erc20_factory):
+    erc20, account, _ = erc20_factory
+    recipients = [RECIPIENT, ZERO_ADDRESS]
+    amounts = [UINT_ONE, UINT_ONE]
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: cannot transfer to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_from_zero_address(erc20_factory):
+    erc20, _, _ = erc20_factory
+
+    # Without using an account abstraction, the caller address
+    # (get_caller_address) is zero
+    await assert_revert(
+        erc20.transferBatch([RECIPIENT], [UINT_ONE]).invoke(),
+        reverted_with="ERC20: cannot transfer from the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_lengths_differ(erc20_factory):
+    erc20, account, _ = erc20_factory
+    recipients = [RECIPIENT, RECIPIENT]
+    amounts = [UINT_ONE]
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: recipients and amounts lengths differ"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferBatch_invalid_uint256(erc20_factory):
+    erc20, account, _ = erc20_factory
+    recipients = [RECIPIENT, RECIPIENT]
+    amounts = [UINT_ONE, INVALID_UINT256]
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', batch_calldata(recipients, amounts)),
+        reverted_with="ERC20: amount is not a valid Uint256"
+    )
+
+
 #
 # transferFrom
 #
@@ -424,6 +635,40 @@ async def test_transferFrom_greater_than_allowance(erc20_factory):
     )
 
 
+@pytest.mark.asyncio
+async def test_transferFrom_unlimited_allowance(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [
+            spender.contract_address,
+            *MAX_UINT256
+        ]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        spender, erc20.contract_address, 'transferFrom', [
+            account.contract_address,
+            RECIPIENT,
+            *AMOUNT
+        ]
+    )
+
+    # the maximum allowance is never decreased
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == MAX_UINT256
+
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == AMOUNT
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[account.contract_address, RECIPIENT, *AMOUNT]
+    )
+
+
 @pytest.mark.asyncio
 async def test_transferFrom_from_zero_address(erc20_factory):
     erc20, _, spender = erc20_factory
@@ -459,6 +704,158 @@ async def test_transferFrom_to_zero_address(erc20_factory):
     )
 
 
+#
+# permit
+#
+
+
+def permit_calldata(erc20, owner, spender, amount, deadline, nonce, key=signer):
+    message_hash = compute_hash_on_elements([
+        str_to_felt("ERC20 Permit"),
+        StarknetChainId.TESTNET.value,
+        erc20.contract_address,
+        owner,
+        spender,
+        *amount,
+        deadline,
+        nonce
+    ])
+    signature = key.sign(message_hash)
+    return [owner, spender, *amount, deadline, nonce, len(signature), *signature]
+
+
+@pytest.mark.asyncio
+async def test_permit(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+
+    # anyone can submit the signed approval
+    return_bool = await signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata
+    )
+    assert return_bool.result.response == [TRUE]
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == AMOUNT
+
+    execution_info = await erc20.nonces(account.contract_address).invoke()
+    assert execution_info.result.nonce == 1
+
+
+@pytest.mark.asyncio
+async def test_permit_emits_event(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+
+    tx_exec_info = await signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Approval',
+        data=[account.contract_address, spender.contract_address, *AMOUNT]
+    )
+
+
+@pytest.mark.asyncio
+async def test_permit_and_transferFrom_in_one_transaction(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+
+    await signer.send_transactions(spender, [
+        (erc20.contract_address, 'permit', calldata),
+        (erc20.contract_address, 'transferFrom', [account.contract_address, RECIPIENT, *AMOUNT])
+    ])
+
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == AMOUNT
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == UINT_ZERO
+
+
+@pytest.mark.asyncio
+async def test_permit_replay(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+
+    await signer.send_transaction(spender, erc20.contract_address, 'permit', calldata)
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata),
+        reverted_with="ERC20: invalid permit nonce"
+    )
+
+
+@pytest.mark.asyncio
+async def test_permit_expired(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+
+    erc20.state.state.block_info = BlockInfo.create_for_testing(
+        block_number=1, block_timestamp=DEADLINE + 1)
+
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata),
+        reverted_with="ERC20: permit expired"
+    )
+
+
+@pytest.mark.asyncio
+async def test_permit_far_deadline(erc20_factory):
+    erc20, account, spender = erc20_factory
+    # more than 2^128 past the block timestamp
+    deadline = 2**251
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, deadline, 0)
+
+    await signer.send_transaction(spender, erc20.contract_address, 'permit', calldata)
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == AMOUNT
+
+
+@pytest.mark.asyncio
+async def test_permit_invalid_signature(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    # signed with a key the owner account doesn't hold
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0, key=other)
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata)
+    )
+
+    # signed for another amount
+    calldata = permit_calldata(
+        erc20, account.contract_address, spender.contract_address, AMOUNT, DEADLINE, 0)
+    calldata[2:4] = UINT_ONE
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata)
+    )
+
+    execution_info = await erc20.nonces(account.contract_address).invoke()
+    assert execution_info.result.nonce == 0
+
+
+@pytest.mark.asyncio
+async def test_permit_to_zero_address(erc20_factory):
+    erc20, account, spender = erc20_factory
+    calldata = permit_calldata(
+        erc20, account.contract_address, ZERO_ADDRESS, AMOUNT, DEADLINE, 0)
+
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'permit', calldata),
+        reverted_with="ERC20: cannot approve to the zero address"
+    )
+
+
 #
 # increaseAllowance
 #
@@ -114,6 +114,15 @@ async def test_pause(token_factory):
         reverted_with="Pausable: contract is paused"
     )
 
+    await assert_revert(signer.send_transaction(
+        owner,
+        token.contract_address,
+        'transferBatch',
+        [1, other.contract_address, 1, *AMOUNT]
+    ),
+        reverted_with="Pausable: contract is paused"
+    )
+
     await assert_revert(signer.send_transaction(
         owner,
         token.contract_address,
@@ -123,6 +132,16 @@ async def test_pause(token_factory):
         reverted_with="Pausable: contract is paused"
     )
 
+    # checked before the signature, which can be left empty
+    await assert_revert(signer.send_transaction(
+        owner,
+        token.contract_address,
+        'permit',
+        [owner.contract_address, other.contract_address, *AMOUNT, 0, 0, 0]
+    ),
+        reverted_with="Pausable: contract is paused"
+    )
+
     await assert_revert(signer.send_transaction(
         owner,
         token.contract_address,
@@ -0,0 +1,122 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import Signer, to_uint, str_to_felt, get_contract_def, cached_contract
+from models import ERC20MintableModel, ERC20PausableModel
+from differential import (
+    Generator, Replayer, explore, ERC20_MINTABLE_SPEC, ERC20_PAUSABLE_SPEC
+)
+
+signer = Signer(123456789987654321)
+
+# testing vars
+INIT_SUPPLY = to_uint(1000)
+NAME = str_to_felt("Token")
+SYMBOL = str_to_felt("TKN")
+DECIMALS = 18
+N_ACTORS = 3
+
+# model-only exploration is cheap, replays on the contract are not
+N_SEQUENCES = 500
+SEQUENCE_LENGTH = 50
+REPLAY_LENGTH = 12
+
+# the owner and initial holder is the first actor, i.e. placeholder address 1
+OWNER = 1
+
+
+def mintable_model():
+    return ERC20MintableModel(NAME, SYMBOL, DECIMALS, INIT_SUPPLY, OWNER, OWNER)
+
+
+def pausable_model():
+    return ERC20PausableModel(NAME, SYMBOL, DECIMALS, INIT_SUPPLY, OWNER, OWNER)
+
+
+def supply_invariant(model):
+    return sum(model.balances.values()) == model.total_supply
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    mintable_def = get_contract_def('openzeppelin/token/erc20/ERC20_Mintable.cairo')
+    pausable_def = get_contract_def('openzeppelin/token/erc20/ERC20_Pausable.cairo')
+    return account_def, mintable_def, pausable_def
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_defs):
+    account_def, mintable_def, pausable_def = contract_defs
+    starknet = await Starknet.empty()
+    accounts = [
+        await starknet.deploy(
+            contract_def=account_def,
+            constructor_calldata=[signer.public_key]
+        )
+        for _ in range(N_ACTORS)
+    ]
+    owner = accounts[OWNER - 1].contract_address
+    calldata = [NAME, SYMBOL, DECIMALS, *INIT_SUPPLY, owner, owner]
+    mintable = await starknet.deploy(contract_def=mintable_def, constructor_calldata=calldata)
+    pausable = await starknet.deploy(contract_def=pausable_def, constructor_calldata=calldata)
+    return starknet.state, accounts, mintable, pausable
+
+
+@pytest.fixture
+def erc20_factory(contract_defs, erc20_init):
+    account_def, mintable_def, pausable_def = contract_defs
+    state, accounts, mintable, pausable = erc20_init
+    _state = state.copy()
+    accounts = [cached_contract(_state, account_def, account) for account in accounts]
+    mintable = cached_contract(_state, mintable_def, mintable)
+    pausable = cached_contract(_state, pausable_def, pausable)
+    return accounts, mintable, pausable
+
+
+def erc20_views(generator):
+    views = [('totalSupply', ())]
+    for owner in generator.addresses:
+        views.append(('balanceOf', (owner,)))
+        for spender in generator.addresses:
+            views.append(('allowance', (owner, spender)))
+    return views
+
+
+@pytest.mark.parametrize('spec, model_factory', [
+    (ERC20_MINTABLE_SPEC, mintable_model),
+    (ERC20_PAUSABLE_SPEC, pausable_model),
+])
+def test_model_supply_invariant(spec, model_factory):
+    generator = Generator(spec, n_actors=N_ACTORS)
+    failing, _ = explore(
+        generator, model_factory, supply_invariant, N_SEQUENCES, SEQUENCE_LENGTH, sample_size=0
+    )
+    assert failing == []
+
+
+@pytest.mark.asyncio
+async def test_replay_mintable(erc20_factory):
+    accounts, erc20, _ = erc20_factory
+    generator = Generator(ERC20_MINTABLE_SPEC, n_actors=N_ACTORS)
+    _, sampled = explore(
+        generator, mintable_model, supply_invariant, 20, REPLAY_LENGTH, sample_size=1, seed=1
+    )
+
+    replayer = Replayer(erc20, accounts, signer, ERC20_MINTABLE_SPEC)
+    model = mintable_model()
+    await replayer.replay(model, sampled[0])
+    await replayer.compare_views(model, erc20_views(generator))
+
+
+@pytest.mark.asyncio
+async def test_replay_pausable(erc20_factory):
+    accounts, _, erc20 = erc20_factory
+    generator = Generator(ERC20_PAUSABLE_SPEC, n_actors=N_ACTORS)
+    _, sampled = explore(
+        generator, pausable_model, supply_invariant, 20, REPLAY_LENGTH, sample_size=1, seed=2
+    )
+
+    replayer = Replayer(erc20, accounts, signer, ERC20_PAUSABLE_SPEC)
+    model = pausable_model()
+    await replayer.replay(model, sampled[0])
+    await replayer.compare_views(model, erc20_views(generator) + [('paused', ())])
@@ -0,0 +1,105 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import Signer, to_uint, from_uint, str_to_felt, get_contract_def, cached_contract
+from differential import Generator, ERC20_MINTABLE_SPEC, ERC20_PAUSABLE_SPEC
+from fuzzing import Fuzzer, erc20_supply_invariant, view
+
+signer = Signer(123456789987654321)
+
+# testing vars
+INIT_SUPPLY = to_uint(1000)
+NAME = str_to_felt("Token")
+SYMBOL = str_to_felt("TKN")
+DECIMALS = 18
+N_ACTORS = 3
+
+# every step runs on the contract, so keep the runs short
+N_SEQUENCES = 2
+SEQUENCE_LENGTH = 10
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    mintable_def = get_contract_def('openzeppelin/token/erc20/ERC20_Mintable.cairo')
+    pausable_def = get_contract_def('openzeppelin/token/erc20/ERC20_Pausable.cairo')
+    return account_def, mintable_def, pausable_def
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_defs):
+    account_def, mintable_def, pausable_def = contract_defs
+    starknet = await Starknet.empty()
+    accounts = [
+        await starknet.deploy(
+            contract_def=account_def,
+            constructor_calldata=[signer.public_key]
+        )
+        for _ in range(N_ACTORS)
+    ]
+    owner = accounts[0].contract_address
+    calldata = [NAME, SYMBOL, DECIMALS, *INIT_SUPPLY, owner, owner]
+    mintable = await starknet.deploy(contract_def=mintable_def, constructor_calldata=calldata)
+    pausable = await starknet.deploy(contract_def=pausable_def, constructor_calldata=calldata)
+    return starknet.state, accounts, mintable, pausable
+
+
+def binder(account_def, erc20_def, accounts, erc20):
+    def bind(state):
+        return (
+            cached_contract(state, erc20_def, erc20),
+            [cached_contract(state, account_def, account) for account in accounts]
+        )
+    return bind
+
+
+@pytest.mark.asyncio
+async def test_fuzz_mintable(contract_defs, erc20_init):
+    account_def, mintable_def, _ = contract_defs
+    state, accounts, erc20, _ = erc20_init
+    generator = Generator(ERC20_MINTABLE_SPEC, n_actors=N_ACTORS)
+
+    fuzzer = Fuzzer(
+        state, binder(account_def, mintable_def, accounts, erc20), signer, generator,
+        [erc20_supply_invariant(generator.addresses)]
+    )
+    failure = await fuzzer.fuzz(N_SEQUENCES, SEQUENCE_LENGTH, seed=0)
+    assert failure is None, failure
+
+
+@pytest.mark.asyncio
+async def test_fuzz_pausable(contract_defs, erc20_init):
+    account_def, _, pausable_def = contract_defs
+    state, accounts, _, erc20 = erc20_init
+    generator = Generator(ERC20_PAUSABLE_SPEC, n_actors=N_ACTORS)
+
+    fuzzer = Fuzzer(
+        state, binder(account_def, pausable_def, accounts, erc20), signer, generator,
+        [erc20_supply_invariant(generator.addresses)]
+    )
+    failure = await fuzzer.fuzz(N_SEQUENCES, SEQUENCE_LENGTH, seed=1)
+    assert failure is None, failure
+
+
+@pytest.mark.asyncio
+async def test_fuzz_shrinks_to_minimal_sequence(contract_defs, erc20_init):
+    account_def, mintable_def, _ = contract_defs
+    state, accounts, erc20, _ = erc20_init
+    generator = Generator(ERC20_MINTABLE_SPEC, n_actors=N_ACTORS)
+
+    # broken by the first successful mint, which only the owner can send
+    async def constant_supply(contract, replayer):
+        total_supply = await view(contract, 'totalSupply')
+        if total_supply != INIT_SUPPLY:
+            return "total supply changed to {}".format(from_uint(total_supply))
+        return None
+
+    fuzzer = Fuzzer(
+        state, binder(account_def, mintable_def, accounts, erc20), signer, generator,
+        [constant_supply], snapshot_interval=3
+    )
+    failure = await fuzzer.fuzz(1, SEQUENCE_LENGTH, seed=3)
+
+    assert failure is not None
+    (op,) = failure.ops
+    assert (op.caller, op.method) == (0, 'mint')
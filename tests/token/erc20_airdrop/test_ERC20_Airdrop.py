@@ -0,0 +1,208 @@
+import pytest
+from starkware.cairo.common.hash_state import compute_hash_on_elements
+from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    Signer, to_uint, add_uint, str_to_felt, TRUE, FALSE,
+    get_contract_def, cached_contract, assert_revert, assert_event_emitted
+)
+
+signer = Signer(123456789987654321)
+
+# testing vars
+INIT_SUPPLY = to_uint(1000)
+NAME = str_to_felt("Token")
+SYMBOL = str_to_felt("TKN")
+DECIMALS = 18
+# spans two words of the claimed bitmap
+RECIPIENTS = [(1000 + i, to_uint(10 + i)) for i in range(260)]
+
+
+def leaf_hash(index, account, amount):
+    return compute_hash_on_elements([index, account, *amount])
+
+
+def merkle_levels(leaves):
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = []
+        for i in range(0, len(level), 2):
+            if i + 1 == len(level):
+                # a node without sibling moves up unchanged
+                parents.append(level[i])
+            else:
+                parents.append(pedersen_hash(*sorted(level[i:i + 2])))
+        levels.append(parents)
+    return levels
+
+
+def merkle_proof(levels, index):
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(level[sibling])
+        index //= 2
+    return proof
+
+
+LEVELS = merkle_levels([
+    leaf_hash(index, account, amount) for index, (account, amount) in enumerate(RECIPIENTS)
+])
+MERKLE_ROOT = LEVELS[-1][0]
+
+
+def claim_calldata(index, account=None, amount=None, proof=None):
+    account = RECIPIENTS[index][0] if account is None else account
+    amount = RECIPIENTS[index][1] if amount is None else amount
+    proof = merkle_proof(LEVELS, index) if proof is None else proof
+    return [index, account, *amount, len(proof), *proof]
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc20_def = get_contract_def(
+        'openzeppelin/token/erc20_airdrop/ERC20_Airdrop.cairo')
+
+    return account_def, erc20_def
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_defs):
+    account_def, erc20_def = contract_defs
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    erc20 = await starknet.deploy(
+        contract_def=erc20_def,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            DECIMALS,
+            *INIT_SUPPLY,
+            account.contract_address,         # recipient
+            MERKLE_ROOT
+        ]
+    )
+    return (
+        starknet.state,
+        account,
+        erc20
+    )
+
+
+@pytest.fixture
+def erc20_factory(contract_defs, erc20_init):
+    account_def, erc20_def = contract_defs
+    state, account, erc20 = erc20_init
+    _state = state.copy()
+    account = cached_contract(_state, account_def, account)
+    erc20 = cached_contract(_state, erc20_def, erc20)
+    return erc20, account
+
+
+@pytest.mark.asyncio
+async def test_constructor(erc20_factory):
+    erc20, _ = erc20_factory
+
+    execution_info = await erc20.merkleRoot().invoke()
+    assert execution_info.result.root == MERKLE_ROOT
+
+    execution_info = await erc20.isClaimed(0).invoke()
+    assert execution_info.result.claimed == FALSE
+
+
+@pytest.mark.asyncio
+async def test_claim(erc20_factory):
+    erc20, account = erc20_factory
+    index = 3
+    recipient, amount = RECIPIENTS[index]
+
+    # anyone can submit the claim on behalf of the recipient
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'claim', claim_calldata(index)
+    )
+    assert tx_exec_info.result.response == [TRUE]
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Claimed',
+        data=[index, recipient, *amount]
+    )
+
+    execution_info = await erc20.balanceOf(recipient).invoke()
+    assert execution_info.result.balance == amount
+
+    execution_info = await erc20.totalSupply().invoke()
+    assert execution_info.result.totalSupply == add_uint(INIT_SUPPLY, amount)
+
+    execution_info = await erc20.isClaimed(index).invoke()
+    assert execution_info.result.claimed == TRUE
+
+
+@pytest.mark.asyncio
+async def test_claim_tracks_each_index(erc20_factory):
+    erc20, account = erc20_factory
+    # both sides of the first word boundary, and the last leaf
+    claimed = [0, 250, 251, len(RECIPIENTS) - 1]
+
+    for index in claimed:
+        await signer.send_transaction(
+            account, erc20.contract_address, 'claim', claim_calldata(index)
+        )
+
+    for index in claimed + [1, 249, 252]:
+        execution_info = await erc20.isClaimed(index).invoke()
+        assert execution_info.result.claimed == (TRUE if index in claimed else FALSE)
+
+
+@pytest.mark.asyncio
+async def test_claim_twice(erc20_factory):
+    erc20, account = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'claim', claim_calldata(7)
+    )
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'claim', claim_calldata(7)),
+        reverted_with="ERC20_Airdrop: already claimed"
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_wrong_amount(erc20_factory):
+    erc20, account = erc20_factory
+    amount = add_uint(RECIPIENTS[5][1], to_uint(1))
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'claim', claim_calldata(5, amount=amount)),
+        reverted_with="ERC20_Airdrop: invalid proof"
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_wrong_account(erc20_factory):
+    erc20, account = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'claim',
+        claim_calldata(5, account=account.contract_address)),
+        reverted_with="ERC20_Airdrop: invalid proof"
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_proof_of_other_index(erc20_factory):
+    erc20, account = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'claim',
+        claim_calldata(5, proof=merkle_proof(LEVELS, 6))),
+        reverted_with="ERC20_Airdrop: invalid proof"
+    )
@@ -0,0 +1,382 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+from utils import (
+    Signer, to_uint, add_uint, sub_uint, str_to_felt, MAX_UINT256, INVALID_UINT256,
+    ZERO_ADDRESS, TRUE, get_contract_def, cached_contract, assert_revert, assert_event_emitted
+)
+
+signer = Signer(123456789987654321)
+
+# testing vars
+RECIPIENT = 123
+INIT_SUPPLY = to_uint(1000)
+CAP = to_uint(10000)
+AMOUNT = to_uint(200)
+UINT_ONE = to_uint(1)
+# smallest amount that no longer fits in a single felt
+BOUND = to_uint(2**128)
+NAME = str_to_felt("Token")
+SYMBOL = str_to_felt("TKN")
+DECIMALS = 18
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc20_def = get_contract_def(
+        'openzeppelin/token/erc20_compact/ERC20_Compact_Mintable.cairo')
+
+    return account_def, erc20_def
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_defs):
+    account_def, erc20_def = contract_defs
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    erc20 = await starknet.deploy(
+        contract_def=erc20_def,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            DECIMALS,
+            *CAP,
+            *INIT_SUPPLY,
+            account1.contract_address,        # recipient
+            account1.contract_address         # owner
+        ]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc20
+    )
+
+
+@pytest.fixture
+def erc20_factory(contract_defs, erc20_init):
+    account_def, erc20_def = contract_defs
+    state, account1, account2, erc20 = erc20_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_def, account1)
+    account2 = cached_contract(_state, account_def, account2)
+    erc20 = cached_contract(_state, erc20_def, erc20)
+    return erc20, account1, account2
+
+
+#
+# Constructor
+#
+
+
+@pytest.mark.asyncio
+async def test_constructor(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    execution_info = await erc20.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == INIT_SUPPLY
+
+    execution_info = await erc20.totalSupply().invoke()
+    assert execution_info.result.totalSupply == INIT_SUPPLY
+
+    execution_info = await erc20.cap().invoke()
+    assert execution_info.result.cap == CAP
+
+    execution_info = await erc20.decimals().invoke()
+    assert execution_info.result.decimals == DECIMALS
+
+
+@pytest.mark.asyncio
+async def test_constructor_cap_exceeds_bound(contract_defs):
+    _, erc20_def = contract_defs
+    starknet = await Starknet.empty()
+
+    with pytest.raises(StarkException) as err:
+        await starknet.deploy(
+            contract_def=erc20_def,
+            constructor_calldata=[
+                NAME,
+                SYMBOL,
+                DECIMALS,
+                *BOUND,
+                *INIT_SUPPLY,
+                RECIPIENT,
+                RECIPIENT
+            ]
+        )
+    assert "ERC20: cap exceeds 2^128" in err.value.args[1]['message']
+
+
+#
+# transfer
+#
+
+
+@pytest.mark.asyncio
+async def test_transfer(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    return_bool = await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *AMOUNT]
+    )
+    assert return_bool.result.response == [TRUE]
+
+    execution_info = await erc20.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == sub_uint(INIT_SUPPLY, AMOUNT)
+
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == AMOUNT
+
+    execution_info = await erc20.totalSupply().invoke()
+    assert execution_info.result.totalSupply == INIT_SUPPLY
+
+
+@pytest.mark.asyncio
+async def test_transfer_emits_event(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *AMOUNT]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Transfer',
+        data=[account.contract_address, RECIPIENT, *AMOUNT]
+    )
+
+
+@pytest.mark.asyncio
+async def test_transfer_not_enough_balance(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    for amount in (add_uint(INIT_SUPPLY, UINT_ONE), BOUND, MAX_UINT256):
+        await assert_revert(signer.send_transaction(
+            account, erc20.contract_address, 'transfer', [RECIPIENT, *amount]),
+            reverted_with="ERC20: transfer amount exceeds balance"
+        )
+
+
+@pytest.mark.asyncio
+async def test_transfer_to_zero_address(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [ZERO_ADDRESS, *UINT_ONE]),
+        reverted_with="ERC20: cannot transfer to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transfer_invalid_uint256(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [RECIPIENT, *INVALID_UINT256]),
+        reverted_with="ERC20: amount is not a valid Uint256"
+    )
+
+
+#
+# transferFrom
+#
+
+
+@pytest.mark.asyncio
+async def test_transferFrom(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *AMOUNT]
+    )
+    return_bool = await signer.send_transaction(
+        spender, erc20.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *UINT_ONE
+        ]
+    )
+    assert return_bool.result.response == [TRUE]
+
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == UINT_ONE
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == sub_uint(AMOUNT, UINT_ONE)
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_greater_than_allowance(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *AMOUNT]
+    )
+    await assert_revert(signer.send_transaction(
+        spender, erc20.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *add_uint(AMOUNT, UINT_ONE)
+        ]),
+        reverted_with="ERC20: transfer amount exceeds allowance"
+    )
+
+
+@pytest.mark.parametrize('amount', [MAX_UINT256, BOUND])
+@pytest.mark.asyncio
+async def test_transferFrom_unlimited_allowance(erc20_factory, amount):
+    erc20, account, spender = erc20_factory
+
+    # any allowance of 2^128 or more is unlimited
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *amount]
+    )
+    await signer.send_transaction(
+        spender, erc20.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *AMOUNT
+        ]
+    )
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == MAX_UINT256
+
+
+#
+# approve
+#
+
+
+@pytest.mark.asyncio
+async def test_approve_emits_event(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *AMOUNT]
+    )
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc20.contract_address,
+        name='Approval',
+        data=[account.contract_address, spender.contract_address, *AMOUNT]
+    )
+
+
+@pytest.mark.asyncio
+async def test_approve_to_zero_address(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'approve', [ZERO_ADDRESS, *AMOUNT]),
+        reverted_with="ERC20: cannot approve to the zero address"
+    )
+
+
+#
+# increaseAllowance / decreaseAllowance
+#
+
+
+@pytest.mark.asyncio
+async def test_increaseAllowance(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'increaseAllowance', [spender.contract_address, *AMOUNT]
+    )
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == AMOUNT
+
+    # saturates to an unlimited allowance
+    await signer.send_transaction(
+        account, erc20.contract_address, 'increaseAllowance', [
+            spender.contract_address, *sub_uint(BOUND, UINT_ONE)
+        ]
+    )
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == MAX_UINT256
+
+
+@pytest.mark.asyncio
+async def test_decreaseAllowance(erc20_factory):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *AMOUNT]
+    )
+    await signer.send_transaction(
+        account, erc20.contract_address, 'decreaseAllowance', [spender.contract_address, *UINT_ONE]
+    )
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == sub_uint(AMOUNT, UINT_ONE)
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'decreaseAllowance', [spender.contract_address, *AMOUNT]),
+        reverted_with="ERC20: allowance below zero"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('subtracted', [to_uint(0), UINT_ONE])
+async def test_decreaseAllowance_unlimited(erc20_factory, subtracted):
+    erc20, account, spender = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [spender.contract_address, *MAX_UINT256]
+    )
+
+    await assert_revert(signer.send_transaction(
+        account, erc20.contract_address, 'decreaseAllowance', [spender.contract_address, *subtracted]),
+        reverted_with="ERC20: cannot decrease an unlimited allowance"
+    )
+
+    execution_info = await erc20.allowance(account.contract_address, spender.contract_address).invoke()
+    assert execution_info.result.remaining == MAX_UINT256
+
+
+#
+# mint
+#
+
+
+@pytest.mark.asyncio
+async def test_mint(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'mint', [RECIPIENT, *sub_uint(CAP, INIT_SUPPLY)]
+    )
+
+    execution_info = await erc20.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result.balance == sub_uint(CAP, INIT_SUPPLY)
+
+    execution_info = await erc20.totalSupply().invoke()
+    assert execution_info.result.totalSupply == CAP
+
+
+@pytest.mark.asyncio
+async def test_mint_exceeds_cap(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    amount = add_uint(sub_uint(CAP, INIT_SUPPLY), UINT_ONE)
+    for amount in (amount, BOUND, MAX_UINT256):
+        await assert_revert(signer.send_transaction(
+            account, erc20.contract_address, 'mint', [RECIPIENT, *amount]),
+            reverted_with="ERC20: cap exceeded"
+        )
+
+
+@pytest.mark.asyncio
+async def test_mint_not_owner(erc20_factory):
+    erc20, _, not_owner = erc20_factory
+
+    await assert_revert(signer.send_transaction(
+        not_owner, erc20.contract_address, 'mint', [RECIPIENT, *AMOUNT]),
+        reverted_with="Ownable: caller is not the owner"
+    )
@@ -0,0 +1,235 @@
+import pytest
+from starkware.starknet.business_logic.state.state import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    Signer, to_uint, add_uint, sub_uint, str_to_felt, TRUE,
+    get_contract_def, cached_contract, assert_revert
+)
+
+signer = Signer(123456789987654321)
+
+# testing vars
+RECIPIENT = 123
+INIT_SUPPLY = to_uint(1000)
+AMOUNT = to_uint(200)
+UINT_ZERO = to_uint(0)
+NAME = str_to_felt("Token")
+SYMBOL = str_to_felt("TKN")
+DECIMALS = 18
+# block of the deployment
+INIT_BLOCK = 10
+
+
+def set_block(state, block_number):
+    state.state.block_info = BlockInfo.create_for_testing(
+        block_number=block_number, block_timestamp=block_number)
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc20_def = get_contract_def(
+        'openzeppelin/token/erc20_snapshot/ERC20_Snapshot_Mintable_Burnable.cairo')
+
+    return account_def, erc20_def
+
+
+@pytest.fixture(scope='module')
+async def erc20_init(contract_defs):
+    account_def, erc20_def = contract_defs
+    starknet = await Starknet.empty()
+    set_block(starknet.state, INIT_BLOCK)
+    account1 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    erc20 = await starknet.deploy(
+        contract_def=erc20_def,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            DECIMALS,
+            *INIT_SUPPLY,
+            account1.contract_address,        # recipient
+            account1.contract_address         # owner
+        ]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc20
+    )
+
+
+@pytest.fixture
+def erc20_factory(contract_defs, erc20_init):
+    account_def, erc20_def = contract_defs
+    state, account1, account2, erc20 = erc20_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_def, account1)
+    account2 = cached_contract(_state, account_def, account2)
+    erc20 = cached_contract(_state, erc20_def, erc20)
+    return erc20, account1, account2
+
+
+async def balance_at(erc20, account, block):
+    execution_info = await erc20.balanceOfAt(account, block).invoke()
+    return execution_info.result.balance
+
+
+async def supply_at(erc20, block):
+    execution_info = await erc20.totalSupplyAt(block).invoke()
+    return execution_info.result.totalSupply
+
+
+#
+# balanceOfAt
+#
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_before_any_checkpoint(erc20_factory):
+    erc20, account, _ = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK - 1) == UINT_ZERO
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK) == INIT_SUPPLY
+    assert await balance_at(erc20, RECIPIENT, INIT_BLOCK) == UINT_ZERO
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_after_transfers(erc20_factory):
+    erc20, account, account2 = erc20_factory
+
+    # one transfer every other block
+    blocks = [INIT_BLOCK + 2 * i for i in range(1, 5)]
+    for block in blocks:
+        set_block(erc20.state, block)
+        return_bool = await signer.send_transaction(
+            account, erc20.contract_address, 'transfer', [account2.contract_address, *AMOUNT]
+        )
+        assert return_bool.result.response == [TRUE]
+
+    set_block(erc20.state, blocks[-1] + 1)
+    sent = UINT_ZERO
+    for block in blocks:
+        sent = add_uint(sent, AMOUNT)
+        # the balance holds until the next checkpoint
+        for at in [block, block + 1]:
+            assert await balance_at(erc20, account.contract_address, at) == sub_uint(INIT_SUPPLY, sent)
+            assert await balance_at(erc20, account2.contract_address, at) == sent
+
+    assert await balance_at(erc20, account2.contract_address, blocks[0] - 1) == UINT_ZERO
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_keeps_last_change_of_block(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transfer', [account2.contract_address, *AMOUNT]
+    )
+    # the tokens leave account2 in the same block
+    await signer.send_transaction(
+        account2, erc20.contract_address, 'transfer', [RECIPIENT, *AMOUNT]
+    )
+
+    set_block(erc20.state, INIT_BLOCK + 2)
+    assert await balance_at(erc20, account2.contract_address, INIT_BLOCK + 1) == UINT_ZERO
+    assert await balance_at(erc20, RECIPIENT, INIT_BLOCK + 1) == AMOUNT
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_transferFrom(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'approve', [account2.contract_address, *AMOUNT]
+    )
+    await signer.send_transaction(
+        account2, erc20.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *AMOUNT
+        ]
+    )
+
+    set_block(erc20.state, INIT_BLOCK + 2)
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK + 1) == sub_uint(INIT_SUPPLY, AMOUNT)
+    assert await balance_at(erc20, RECIPIENT, INIT_BLOCK + 1) == AMOUNT
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_transferBatch(erc20_factory):
+    erc20, account, account2 = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    await signer.send_transaction(
+        account, erc20.contract_address, 'transferBatch', [
+            2, RECIPIENT, account2.contract_address,
+            2, *AMOUNT, *AMOUNT
+        ]
+    )
+
+    set_block(erc20.state, INIT_BLOCK + 2)
+    total = add_uint(AMOUNT, AMOUNT)
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK + 1) == sub_uint(INIT_SUPPLY, total)
+    assert await balance_at(erc20, RECIPIENT, INIT_BLOCK + 1) == AMOUNT
+    assert await balance_at(erc20, account2.contract_address, INIT_BLOCK + 1) == AMOUNT
+
+
+@pytest.mark.asyncio
+async def test_balanceOfAt_current_block(erc20_factory):
+    erc20, account, _ = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    await assert_revert(
+        erc20.balanceOfAt(account.contract_address, INIT_BLOCK + 1).invoke(),
+        reverted_with="ERC20_Snapshot: block not yet mined"
+    )
+
+
+#
+# totalSupplyAt
+#
+
+
+@pytest.mark.asyncio
+async def test_totalSupplyAt_mint_and_burn(erc20_factory):
+    erc20, account, _ = erc20_factory
+
+    set_block(erc20.state, INIT_BLOCK + 1)
+    await signer.send_transaction(
+        account, erc20.contract_address, 'mint', [account.contract_address, *AMOUNT]
+    )
+
+    set_block(erc20.state, INIT_BLOCK + 3)
+    await signer.send_transaction(
+        account, erc20.contract_address, 'burn', [*INIT_SUPPLY]
+    )
+
+    set_block(erc20.state, INIT_BLOCK + 4)
+    assert await supply_at(erc20, INIT_BLOCK - 1) == UINT_ZERO
+    assert await supply_at(erc20, INIT_BLOCK) == INIT_SUPPLY
+    assert await supply_at(erc20, INIT_BLOCK + 1) == add_uint(INIT_SUPPLY, AMOUNT)
+    assert await supply_at(erc20, INIT_BLOCK + 2) == add_uint(INIT_SUPPLY, AMOUNT)
+    assert await supply_at(erc20, INIT_BLOCK + 3) == AMOUNT
+
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK + 2) == add_uint(INIT_SUPPLY, AMOUNT)
+    assert await balance_at(erc20, account.contract_address, INIT_BLOCK + 3) == AMOUNT
+
+
+@pytest.mark.asyncio
+async def test_totalSupplyAt_current_block(erc20_factory):
+    erc20, _, _ = erc20_factory
+    set_block(erc20.state, INIT_BLOCK + 1)
+
+    await assert_revert(
+        erc20.totalSupplyAt(INIT_BLOCK + 2).invoke(),
+        reverted_with="ERC20_Snapshot: block not yet mined"
+    )
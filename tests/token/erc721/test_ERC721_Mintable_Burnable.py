@@ -1,5 +1,6 @@
 import pytest
 from starkware.starknet.testing.starknet import Starknet
+from starkware.starknet.public.abi import get_selector_from_name, get_storage_var_address
 from utils import (
     Signer, str_to_felt, ZERO_ADDRESS, TRUE, FALSE, assert_revert, INVALID_UINT256,
     assert_event_emitted, get_contract_def, cached_contract, to_uint, sub_uint, add_uint
@@ -20,6 +21,8 @@ DATA = [0x42, 0x89, 0x55]
 # random URIs
 SAMPLE_URI_1 = str_to_felt('mock://mytoken.v1')
 SAMPLE_URI_2 = str_to_felt('mock://mytoken.v2')
+# base URI as short strings
+BASE_URI = [str_to_felt('ipfs://QmWgvnxZ4Eo3Dh5iLT5dH3Zj'), str_to_felt('/')]
 
 # selector ids
 IERC165_ID = 0x01ffc9a7
@@ -29,6 +32,25 @@ INVALID_ID = 0xffffffff
 UNSUPPORTED_ID = 0xabcd1234
 
 
+def flatten(tokens):
+    # Uint256 array calldata
+    return [n for token in tokens for n in token]
+
+
+def approval_events(tx_exec_info):
+    return [
+        event for event in tx_exec_info.raw_events
+        if event.keys == [get_selector_from_name('Approval')]
+    ]
+
+
+def approval_written(erc721, token):
+    # whether the approval slot of `token` was ever written
+    key = get_storage_var_address('ERC721_token_approvals', *token)
+    contract_state = erc721.state.state.contract_states[erc721.contract_address]
+    return key in contract_state.storage_updates
+
+
 @pytest.fixture(scope='module')
 def contract_defs():
     account_def = get_contract_def('openzeppelin/account/Account.cairo')
@@ -228,6 +250,89 @@ async def test_ownerOf_invalid_uint256(erc721_factory):
     )
 
 
+#
+# ownerOfBatch, getApprovedBatch and isApprovedForAllBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_ownerOfBatch(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *TOKENS[1]]
+    )
+
+    execution_info = await erc721.ownerOfBatch([*TOKENS, TOKEN]).invoke()
+    assert execution_info.result.owners == [
+        account.contract_address, RECIPIENT, account.contract_address
+    ]
+
+    execution_info = await erc721.ownerOfBatch([]).invoke()
+    assert execution_info.result.owners == []
+
+
+@pytest.mark.asyncio
+async def test_ownerOfBatch_nonexistent_token(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.ownerOfBatch([TOKEN, NONEXISTENT_TOKEN]).invoke(),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_getApprovedBatch(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKEN]
+    )
+
+    execution_info = await erc721.getApprovedBatch(TOKENS).invoke()
+    assert execution_info.result.approved == [spender.contract_address, ZERO_ADDRESS]
+
+
+@pytest.mark.asyncio
+async def test_getApprovedBatch_nonexistent_token(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.getApprovedBatch([NONEXISTENT_TOKEN]).invoke(),
+        reverted_with="ERC721: approved query for nonexistent token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_isApprovedForAllBatch(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    owners = [account.contract_address, account.contract_address, spender.contract_address]
+    operators = [spender.contract_address, RECIPIENT, account.contract_address]
+    execution_info = await erc721.isApprovedForAllBatch(owners, operators).invoke()
+    assert execution_info.result.isApproved == [TRUE, FALSE, FALSE]
+
+
+@pytest.mark.asyncio
+async def test_isApprovedForAllBatch_lengths_differ(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await assert_revert(
+        erc721.isApprovedForAllBatch(
+            [account.contract_address], [spender.contract_address, RECIPIENT]
+        ).invoke(),
+        reverted_with="ERC721: owners and operators lengths differ"
+    )
+
+
 #
 # mint
 #
@@ -513,6 +618,21 @@ async def test_approve_owner_is_recipient(erc721_minted):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('to', [RECIPIENT, ZERO_ADDRESS])
+async def test_approve_nonexistent_token(erc721_minted, to):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'approve', [
+                to,
+                *NONEXISTENT_TOKEN
+            ]),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+
+
 @pytest.mark.asyncio
 async def test_approve_not_owner_or_operator(erc721_factory):
     erc721, account, spender, _, _ = erc721_factory
@@ -723,10 +843,34 @@ async def test_transferFrom_owner(erc721_minted):
     assert execution_info.result == (0,)
 
 
+@pytest.mark.asyncio
+async def test_transferFrom_to_self(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    previous_balance = execution_info.result.balance
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, account.contract_address, *TOKEN]
+    )
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == previous_balance
+
+    execution_info = await erc721.ownerOf(TOKEN).invoke()
+    assert execution_info.result == (account.contract_address,)
+
+
 @pytest.mark.asyncio
 async def test_transferFrom_emits_events(erc721_minted):
     erc721, account, spender, _ = erc721_minted
 
+    # approve recipient, so that the approval is cleared by the transfer
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [RECIPIENT, *TOKEN]
+    )
+
     # setApprovalForAll
     await signer.send_transaction(
         account, erc721.contract_address, 'setApprovalForAll', [
@@ -807,6 +951,78 @@ async def test_transferFrom_operator(erc721_minted):
     assert execution_info.result == (to_uint(1),)
 
 
+@pytest.mark.asyncio
+async def test_transferFrom_operator_with_approved_user(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    # approve recipient and make spender an operator
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [RECIPIENT, *TOKEN]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    # the operator transfers token from account to recipient
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *TOKEN]
+    )
+
+    execution_info = await erc721.ownerOf(TOKEN).invoke()
+    assert execution_info.result == (RECIPIENT,)
+
+    execution_info = await erc721.getApproved(TOKEN).invoke()
+    assert execution_info.result == (ZERO_ADDRESS,)
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_clears_approval(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKEN]
+    )
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *TOKEN]
+    )
+
+    execution_info = await erc721.getApproved(TOKEN).invoke()
+    assert execution_info.result == (ZERO_ADDRESS,)
+
+    assert_event_emitted(
+        tx_exec_info,
+        from_address=erc721.contract_address,
+        name='Approval',
+        data=[
+            account.contract_address,
+            ZERO_ADDRESS,
+            *TOKEN
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_without_approval(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *TOKEN]
+    )
+
+    # nothing was approved, so the approval is neither written nor cleared
+    assert approval_events(tx_exec_info) == []
+    assert not approval_written(erc721, TOKEN)
+
+    execution_info = await erc721.getApproved(TOKEN).invoke()
+    assert execution_info.result == (ZERO_ADDRESS,)
+
+
 @pytest.mark.asyncio
 async def test_transferFrom_when_not_approved_or_owner(erc721_minted):
     erc721, account, spender, _ = erc721_minted
@@ -929,7 +1145,12 @@ async def test_safeTransferFrom(erc721_minted):
 
 @pytest.mark.asyncio
 async def test_safeTransferFrom_emits_events(erc721_minted):
-    erc721, account, _, erc721_holder = erc721_minted
+    erc721, account, spender, erc721_holder = erc721_minted
+
+    # approve spender, so that the approval is cleared by the transfer
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [spender.contract_address, *TOKEN]
+    )
 
     tx_exec_info = await signer.send_transaction(
         account, erc721.contract_address, 'safeTransferFrom', [
@@ -1132,6 +1353,300 @@ async def test_safeTransferFrom_invalid_uint256(erc721_minted):
     )
 
 
+#
+# receiver capability
+#
+
+
+def receiver_calls(tx_exec_info):
+    # the account calls the token, which calls the recipient
+    (token_call,) = tx_exec_info.call_info.internal_calls
+    return len(token_call.internal_calls)
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_caches_receiver(erc721_minted):
+    erc721, account, _, erc721_holder = erc721_minted
+
+    calls = []
+    for token in TOKENS:
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, 'safeTransferFrom', [
+                account.contract_address,
+                erc721_holder.contract_address,
+                *token,
+                len(DATA),
+                *DATA
+            ]
+        )
+        calls.append(receiver_calls(tx_exec_info))
+
+    # supportsInterface and onERC721Received, then onERC721Received only
+    assert calls == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFrom_caches_account(erc721_minted):
+    erc721, account, account2, _ = erc721_minted
+
+    calls = []
+    for token in TOKENS:
+        tx_exec_info = await signer.send_transaction(
+            account, erc721.contract_address, 'safeTransferFrom', [
+                account.contract_address,
+                account2.contract_address,
+                *token,
+                len(DATA),
+                *DATA
+            ]
+        )
+        calls.append(receiver_calls(tx_exec_info))
+
+    # supportsInterface for receivers and accounts, then nothing
+    assert calls == [2, 0]
+
+
+@pytest.mark.asyncio
+async def test_refreshReceiverCapability(erc721_minted):
+    erc721, account, account2, _ = erc721_minted
+
+    # anyone can refresh the capability of any address
+    tx_exec_info = await signer.send_transaction(
+        account2, erc721.contract_address, 'refreshReceiverCapability', [
+            account2.contract_address]
+    )
+    assert receiver_calls(tx_exec_info) == 2
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'safeTransferFrom', [
+            account.contract_address,
+            account2.contract_address,
+            *TOKEN,
+            len(DATA),
+            *DATA
+        ]
+    )
+    assert receiver_calls(tx_exec_info) == 0
+
+    execution_info = await erc721.ownerOf(TOKEN).invoke()
+    assert execution_info.result == (account2.contract_address,)
+
+
+#
+# transferFromBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    previous_balance = execution_info.result.balance
+
+    tx_exec_info = await signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *flatten(TOKENS)
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == sub_uint(
+        previous_balance, to_uint(len(TOKENS)))
+
+    for token in TOKENS:
+        execution_info = await erc721.ownerOf(token).invoke()
+        assert execution_info.result == (RECIPIENT,)
+
+        assert_event_emitted(
+            tx_exec_info,
+            from_address=erc721.contract_address,
+            name='Transfer',
+            data=[
+                account.contract_address,
+                RECIPIENT,
+                *token
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_to_self(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    previous_balance = execution_info.result.balance
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            account.contract_address,
+            len(TOKENS),
+            *flatten(TOKENS)
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(account.contract_address).invoke()
+    assert execution_info.result.balance == previous_balance
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_operator(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setApprovalForAll', [
+            spender.contract_address, TRUE]
+    )
+
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *flatten(TOKENS)
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(RECIPIENT).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_approved_for_some_tokens(erc721_minted):
+    erc721, account, spender, _ = erc721_minted
+
+    # approve spender for the first token only
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            spender.contract_address, *TOKENS[0]]
+    )
+
+    await signer.send_transaction(
+        spender, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address, RECIPIENT, 1, *TOKENS[0]]
+    )
+
+    await assert_revert(signer.send_transaction(
+        spender, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address, RECIPIENT, 1, *TOKENS[1]]),
+        reverted_with="ERC721: either is not approved or the caller is the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_from_incorrect_owner(erc721_minted):
+    erc721, account, account2, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account2, erc721.contract_address, 'transferFromBatch', [
+            account2.contract_address,
+            RECIPIENT,
+            len(TOKENS),
+            *flatten(TOKENS)
+        ]),
+        reverted_with="ERC721: transfer from incorrect owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_duplicate_token(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            RECIPIENT,
+            2,
+            *TOKEN,
+            *TOKEN
+        ]),
+        reverted_with="ERC721: transfer from incorrect owner"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_to_zero_address(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            ZERO_ADDRESS,
+            len(TOKENS),
+            *flatten(TOKENS)
+        ]),
+        reverted_with="ERC721: cannot transfer to the zero address"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_nonexistent_token(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    await assert_revert(signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address,
+            RECIPIENT,
+            2,
+            *TOKEN,
+            *NONEXISTENT_TOKEN
+        ]),
+        reverted_with="ERC721: token id does not exist"
+    )
+
+
+#
+# safeTransferFromBatch
+#
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFromBatch(erc721_minted):
+    erc721, account, _, erc721_holder = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'safeTransferFromBatch', [
+            account.contract_address,
+            erc721_holder.contract_address,
+            len(TOKENS),
+            *flatten(TOKENS),
+            len(DATA),
+            *DATA
+        ]
+    )
+
+    execution_info = await erc721.balanceOf(erc721_holder.contract_address).invoke()
+    assert execution_info.result == (to_uint(len(TOKENS)),)
+
+    for token in TOKENS:
+        execution_info = await erc721.ownerOf(token).invoke()
+        assert execution_info.result == (erc721_holder.contract_address,)
+
+
+@pytest.mark.asyncio
+async def test_safeTransferFromBatch_to_unsupported_contract(erc721_unsupported):
+    erc721, account, _, _, unsupported = erc721_unsupported
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'safeTransferFromBatch', [
+                account.contract_address,
+                unsupported.contract_address,
+                len(TOKENS),
+                *flatten(TOKENS),
+                len(DATA),
+                *DATA
+            ])
+    )
+
+
 #
 # tokenURI
 #
@@ -1206,3 +1721,56 @@ async def test_setTokenURI_for_nonexistent_token(erc721_minted):
         ]),
         reverted_with="Ownable: caller is not the owner"
     )
+
+
+#
+# tokenURIFromBase
+#
+
+
+@pytest.mark.asyncio
+async def test_tokenURIFromBase(erc721_minted):
+    erc721, account, _, _ = erc721_minted
+
+    # empty without a base URI
+    execution_info = await erc721.tokenURIFromBase(TOKEN).invoke()
+    assert execution_info.result.tokenURI == []
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+    )
+
+    execution_info = await erc721.baseURI().invoke()
+    assert execution_info.result.baseURI == BASE_URI
+    execution_info = await erc721.tokenURIFromBase(TOKEN).invoke()
+    assert execution_info.result.tokenURI == BASE_URI + [str_to_felt('5042')]
+
+    # the URI set for the token takes precedence
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setTokenURI', [*TOKEN, SAMPLE_URI_1]
+    )
+
+    execution_info = await erc721.tokenURIFromBase(TOKEN).invoke()
+    assert execution_info.result.tokenURI == [SAMPLE_URI_1]
+
+
+@pytest.mark.asyncio
+async def test_tokenURIFromBase_nonexistent_token(erc721_minted):
+    erc721, _, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokenURIFromBase(NONEXISTENT_TOKEN).invoke(),
+        reverted_with="ERC721_Metadata: URI query for nonexistent token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setBaseURI_from_not_owner(erc721_minted):
+    erc721, _, not_owner, _ = erc721_minted
+
+    await assert_revert(
+        signer.send_transaction(
+            not_owner, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+        ),
+        reverted_with="Ownable: caller is not the owner"
+    )
@@ -130,6 +130,28 @@ async def test_pause(erc721_minted):
         reverted_with="Pausable: contract is paused"
     )
 
+    await assert_revert(signer.send_transaction(
+        owner, erc721.contract_address, 'transferFromBatch', [
+            owner.contract_address,
+            other.contract_address,
+            len(TOKENS),
+            *[n for token in TOKENS for n in token]
+        ]),
+        reverted_with="Pausable: contract is paused"
+    )
+
+    await assert_revert(signer.send_transaction(
+        owner, erc721.contract_address, 'safeTransferFromBatch', [
+            owner.contract_address,
+            erc721_holder.contract_address,
+            len(TOKENS),
+            *[n for token in TOKENS for n in token],
+            len(DATA),
+            *DATA
+        ]),
+        reverted_with="Pausable: contract is paused"
+    )
+
     await assert_revert(signer.send_transaction(
         owner, erc721.contract_address, 'mint', [
             other.contract_address,
@@ -0,0 +1,60 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import MAX_UINT256, str_to_felt, to_uint, from_uint, contract_path
+
+
+def decimal_felts(n):
+    # decimal digits in short strings of 31 digits, the first one being shorter
+    digits = str(n)
+    head = len(digits) % 31 or 31
+    chunks = [digits[:head]] + [digits[i:i + 31] for i in range(head, len(digits), 31)]
+    return [str_to_felt(chunk) for chunk in chunks]
+
+
+@pytest.fixture(scope='module')
+async def decimal_mock():
+    starknet = await Starknet.empty()
+    decimal = await starknet.deploy(
+        contract_path("tests/mocks/ERC721_decimal_mock.cairo")
+    )
+
+    return decimal
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('value', [
+    0,
+    7,
+    10**30,
+    # chunk boundary: 31 digits fit a single short string, 32 don't
+    10**31 - 1,
+    10**31,
+    10**31 + 1,
+    # the second chunk is padded with zeros
+    10**31 + 10**30,
+    2 * 10**31 + 5,
+    10**62 - 1,
+    10**62,
+    from_uint(MAX_UINT256)
+])
+async def test_write_decimal(decimal_mock, value):
+    decimal = decimal_mock
+
+    execution_info = await decimal.test_write_decimal(to_uint(value)).invoke()
+    assert execution_info.result.res == decimal_felts(value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('value, min_digits, expected', [
+    [0, 1, '0'],
+    [42, 1, '42'],
+    [42, 5, '00042'],
+    [0, 31, '0' * 31],
+    [10**31 - 1, 31, '9' * 31],
+    [5, 31, '0' * 30 + '5'],
+])
+async def test_ascii_digits(decimal_mock, value, min_digits, expected):
+    decimal = decimal_mock
+
+    execution_info = await decimal.test_ascii_digits(value, min_digits).invoke()
+    assert execution_info.result == (str_to_felt(expected),)
@@ -0,0 +1,481 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    Signer, str_to_felt, to_uint, assert_revert, get_contract_def, cached_contract
+)
+
+
+signer = Signer(123456789987654321)
+
+NAME = str_to_felt("Non Fungible Token")
+SYMBOL = str_to_felt("NFT")
+# consecutive batches of the deployment: tokens 0-9 and 10-14
+QUANTITIES = [10, 5]
+TOTAL = sum(QUANTITIES)
+# random user address
+RECIPIENT = 555
+MAX_BATCH = 500
+# base URI as short strings
+BASE_URI = [str_to_felt('ipfs://QmWgvnxZ4Eo3Dh5iLT5dH3Zj'), str_to_felt('/')]
+SAMPLE_URI = str_to_felt('mock://mytoken.v1')
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc721_def = get_contract_def(
+        'openzeppelin/token/erc721_consecutive/ERC721_Consecutive_Mintable_Burnable.cairo')
+
+    return account_def, erc721_def
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_defs):
+    account_def, erc721_def = contract_defs
+    starknet = await Starknet.empty()
+    account1 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    account2 = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_def=erc721_def,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            account1.contract_address,          # owner
+            2, account1.contract_address, account2.contract_address,
+            2, *QUANTITIES
+        ]
+    )
+    return (
+        starknet.state,
+        account1,
+        account2,
+        erc721
+    )
+
+
+@pytest.fixture
+def erc721_factory(contract_defs, erc721_init):
+    account_def, erc721_def = contract_defs
+    state, account1, account2, erc721 = erc721_init
+    _state = state.copy()
+    account1 = cached_contract(_state, account_def, account1)
+    account2 = cached_contract(_state, account_def, account2)
+    erc721 = cached_contract(_state, erc721_def, erc721)
+    return erc721, account1, account2
+
+
+async def owner_of(erc721, token):
+    execution_info = await erc721.ownerOf(to_uint(token)).invoke()
+    return execution_info.result.owner
+
+
+async def balance_of(erc721, account):
+    execution_info = await erc721.balanceOf(account).invoke()
+    return execution_info.result.balance
+
+
+async def token_uri(erc721, token):
+    execution_info = await erc721.tokenURIFromBase(to_uint(token)).invoke()
+    return execution_info.result.tokenURI
+
+
+def decimal_felts(n):
+    # decimal digits in short strings of 31 digits, the first one being shorter
+    digits = str(n)
+    head = len(digits) % 31 or 31
+    chunks = [digits[:head]] + [digits[i:i + 31] for i in range(head, len(digits), 31)]
+    return [str_to_felt(chunk) for chunk in chunks]
+
+
+#
+# Constructor
+#
+
+
+@pytest.mark.asyncio
+async def test_constructor(erc721_factory):
+    erc721, account, account2 = erc721_factory
+
+    assert await balance_of(erc721, account.contract_address) == to_uint(10)
+    assert await balance_of(erc721, account2.contract_address) == to_uint(5)
+
+    for token in range(TOTAL):
+        expected = account.contract_address if token < 10 else account2.contract_address
+        assert await owner_of(erc721, token) == expected
+
+
+@pytest.mark.asyncio
+async def test_ownerOfBatch_across_batches(erc721_factory):
+    erc721, account, account2 = erc721_factory
+
+    tokens = [to_uint(token) for token in [9, 0, 10, 14]]
+    execution_info = await erc721.ownerOfBatch(tokens).invoke()
+    assert execution_info.result.owners == [
+        account.contract_address,
+        account.contract_address,
+        account2.contract_address,
+        account2.contract_address
+    ]
+
+
+@pytest.mark.asyncio
+async def test_constructor_past_last_batch(erc721_factory):
+    erc721, _, _ = erc721_factory
+
+    await assert_revert(
+        erc721.ownerOf(to_uint(TOTAL)).invoke(),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_constructor_invalid_batch_size(contract_defs, erc721_factory):
+    _, erc721_def = contract_defs
+    erc721, account, _ = erc721_factory
+    starknet = await Starknet.empty()
+
+    for quantity in [0, MAX_BATCH + 1]:
+        await assert_revert(
+            starknet.deploy(
+                contract_def=erc721_def,
+                constructor_calldata=[
+                    NAME,
+                    SYMBOL,
+                    account.contract_address,
+                    1, account.contract_address,
+                    1, quantity
+                ]
+            ),
+            reverted_with="ERC721_Consecutive: invalid batch size"
+        )
+
+
+@pytest.mark.asyncio
+async def test_constructor_lengths_differ(contract_defs, erc721_factory):
+    _, erc721_def = contract_defs
+    erc721, account, _ = erc721_factory
+    starknet = await Starknet.empty()
+
+    await assert_revert(
+        starknet.deploy(
+            contract_def=erc721_def,
+            constructor_calldata=[
+                NAME,
+                SYMBOL,
+                account.contract_address,
+                1, account.contract_address,
+                2, 1, 1
+            ]
+        ),
+        reverted_with="ERC721_Consecutive: recipients and quantities lengths differ"
+    )
+
+
+@pytest.mark.asyncio
+async def test_constructor_max_batch(contract_defs):
+    account_def, erc721_def = contract_defs
+    starknet = await Starknet.empty()
+    account = await starknet.deploy(
+        contract_def=account_def,
+        constructor_calldata=[signer.public_key]
+    )
+    erc721 = await starknet.deploy(
+        contract_def=erc721_def,
+        constructor_calldata=[
+            NAME,
+            SYMBOL,
+            account.contract_address,
+            1, account.contract_address,
+            1, MAX_BATCH
+        ]
+    )
+
+    # the last token of the batch scans back to the first one
+    assert await owner_of(erc721, MAX_BATCH - 1) == account.contract_address
+    assert await balance_of(erc721, account.contract_address) == to_uint(MAX_BATCH)
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(MAX_BATCH - 1)
+        ]
+    )
+
+    assert await owner_of(erc721, MAX_BATCH - 1) == RECIPIENT
+    assert await owner_of(erc721, MAX_BATCH - 2) == account.contract_address
+
+
+#
+# Transfers
+#
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_inside_batch(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(3)
+        ]
+    )
+
+    assert await owner_of(erc721, 3) == RECIPIENT
+    for token in [0, 2, 4, 9]:
+        assert await owner_of(erc721, token) == account.contract_address
+    assert await balance_of(erc721, account.contract_address) == to_uint(9)
+    assert await balance_of(erc721, RECIPIENT) == to_uint(1)
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_end_of_batch(erc721_factory):
+    erc721, account, account2 = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(9)
+        ]
+    )
+
+    assert await owner_of(erc721, 8) == account.contract_address
+    assert await owner_of(erc721, 9) == RECIPIENT
+    assert await owner_of(erc721, 10) == account2.contract_address
+
+
+@pytest.mark.asyncio
+async def test_transferFrom_twice(erc721_factory):
+    erc721, account, account2 = erc721_factory
+
+    await signer.send_transaction(
+        account2, erc721.contract_address, 'transferFrom', [
+            account2.contract_address, account.contract_address, *to_uint(12)
+        ]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(12)
+        ]
+    )
+
+    assert await owner_of(erc721, 12) == RECIPIENT
+    assert await owner_of(erc721, 13) == account2.contract_address
+    assert await balance_of(erc721, account.contract_address) == to_uint(10)
+    assert await balance_of(erc721, account2.contract_address) == to_uint(4)
+
+
+@pytest.mark.asyncio
+async def test_transferFromBatch_inside_batch(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFromBatch', [
+            account.contract_address, RECIPIENT, 2, *to_uint(2), *to_uint(3)
+        ]
+    )
+
+    for token in [2, 3]:
+        assert await owner_of(erc721, token) == RECIPIENT
+    for token in [1, 4, 9]:
+        assert await owner_of(erc721, token) == account.contract_address
+    assert await balance_of(erc721, account.contract_address) == to_uint(8)
+    assert await balance_of(erc721, RECIPIENT) == to_uint(2)
+
+
+@pytest.mark.asyncio
+async def test_approve_inside_batch(erc721_factory):
+    erc721, account, account2 = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'approve', [
+            account2.contract_address, *to_uint(3)
+        ]
+    )
+    execution_info = await erc721.getApproved(to_uint(3)).invoke()
+    assert execution_info.result.approved == account2.contract_address
+
+    await signer.send_transaction(
+        account2, erc721.contract_address, 'transferFrom', [
+            account.contract_address, RECIPIENT, *to_uint(3)
+        ]
+    )
+
+    assert await owner_of(erc721, 3) == RECIPIENT
+    assert await owner_of(erc721, 4) == account.contract_address
+
+
+#
+# Burn
+#
+
+
+@pytest.mark.asyncio
+async def test_burn_first_of_batch(erc721_factory):
+    erc721, _, account2 = erc721_factory
+
+    await signer.send_transaction(
+        account2, erc721.contract_address, 'burn', [*to_uint(10)]
+    )
+
+    await assert_revert(
+        erc721.ownerOf(to_uint(10)).invoke(),
+        reverted_with="ERC721: owner query for nonexistent token"
+    )
+    assert await owner_of(erc721, 11) == account2.contract_address
+    assert await balance_of(erc721, account2.contract_address) == to_uint(4)
+
+
+@pytest.mark.asyncio
+async def test_burn_adjacent_tokens(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    for token in [5, 4]:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'burn', [*to_uint(token)]
+        )
+
+    for token in [4, 5]:
+        await assert_revert(
+            erc721.ownerOf(to_uint(token)).invoke(),
+            reverted_with="ERC721: owner query for nonexistent token"
+        )
+    assert await owner_of(erc721, 3) == account.contract_address
+    assert await owner_of(erc721, 6) == account.contract_address
+    assert await balance_of(erc721, account.contract_address) == to_uint(8)
+
+
+#
+# Mint
+#
+
+
+@pytest.mark.asyncio
+async def test_mint_consecutive_token(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'mint', [
+                RECIPIENT, *to_uint(7)
+            ]
+        ),
+        reverted_with="ERC721: token already minted"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_burned_consecutive_token(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burn', [*to_uint(7)]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, *to_uint(7)]
+    )
+
+    assert await owner_of(erc721, 7) == RECIPIENT
+    assert await owner_of(erc721, 8) == account.contract_address
+
+
+@pytest.mark.asyncio
+async def test_mint_after_batches(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [RECIPIENT, *to_uint(TOTAL)]
+    )
+
+    assert await owner_of(erc721, TOTAL) == RECIPIENT
+    assert await owner_of(erc721, TOTAL - 1) != RECIPIENT
+
+
+#
+# Metadata
+#
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_without_base(erc721_factory):
+    erc721, _, _ = erc721_factory
+
+    assert await token_uri(erc721, 3) == []
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_from_base(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+    )
+
+    execution_info = await erc721.baseURI().invoke()
+    assert execution_info.result.baseURI == BASE_URI
+
+    for token in [0, 3, 14]:
+        assert await token_uri(erc721, token) == BASE_URI + [str_to_felt(str(token))]
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_from_base_large_token_id(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    for token in [10**40 + 7, 2**256 - 1]:
+        await signer.send_transaction(
+            account, erc721.contract_address, 'mint', [RECIPIENT, *to_uint(token)]
+        )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+    )
+
+    for token in [10**40 + 7, 2**256 - 1]:
+        assert await token_uri(erc721, token) == BASE_URI + decimal_felts(token)
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_set_for_token(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'setTokenURI', [*to_uint(3), SAMPLE_URI]
+    )
+
+    assert await token_uri(erc721, 3) == [SAMPLE_URI]
+    assert await token_uri(erc721, 4) == BASE_URI + [str_to_felt('4')]
+
+    # the standard view only returns the URI set for the token
+    execution_info = await erc721.tokenURI(to_uint(3)).invoke()
+    assert execution_info.result == (SAMPLE_URI,)
+    execution_info = await erc721.tokenURI(to_uint(4)).invoke()
+    assert execution_info.result == (0,)
+
+
+@pytest.mark.asyncio
+async def test_tokenURI_nonexistent_token(erc721_factory):
+    erc721, _, _ = erc721_factory
+
+    for view in [erc721.tokenURI, erc721.tokenURIFromBase]:
+        await assert_revert(
+            view(to_uint(TOTAL)).invoke(),
+            reverted_with="ERC721_Metadata: URI query for nonexistent token"
+        )
+
+
+@pytest.mark.asyncio
+async def test_setBaseURI_from_not_owner(erc721_factory):
+    erc721, _, account2 = erc721_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account2, erc721.contract_address, 'setBaseURI', [len(BASE_URI), *BASE_URI]
+        ),
+        reverted_with="Ownable: caller is not the owner"
+    )
@@ -0,0 +1,78 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    str_to_felt, to_uint, assert_revert, get_contract_def, cached_contract
+)
+
+
+# random user addresses
+RECIPIENT = 555
+OTHER = 777
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    erc721_def = get_contract_def('tests/mocks/ERC721_Consecutive_mock.cairo')
+
+    return erc721_def
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_defs):
+    erc721_def = contract_defs
+    starknet = await Starknet.empty()
+    erc721 = await starknet.deploy(
+        contract_def=erc721_def,
+        constructor_calldata=[
+            str_to_felt("Non Fungible Token"),  # name
+            str_to_felt("NFT")                  # ticker
+        ]
+    )
+    return starknet.state, erc721
+
+
+@pytest.fixture
+def erc721_factory(contract_defs, erc721_init):
+    erc721_def = contract_defs
+    state, erc721 = erc721_init
+    _state = state.copy()
+    erc721 = cached_contract(_state, erc721_def, erc721)
+    return erc721
+
+
+@pytest.mark.asyncio
+async def test_initialize_twice(erc721_factory):
+    erc721 = erc721_factory
+
+    await erc721.initialize([RECIPIENT], [3]).invoke()
+
+    await assert_revert(
+        erc721.initialize([OTHER], [3]).invoke(),
+        reverted_with="ERC721_Consecutive: already initialized"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_before_initialize(erc721_factory):
+    erc721 = erc721_factory
+
+    await assert_revert(
+        erc721.mint(OTHER, to_uint(1)).invoke(),
+        reverted_with="ERC721_Consecutive: not initialized"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mint_after_initialize(erc721_factory):
+    erc721 = erc721_factory
+
+    await erc721.initialize([RECIPIENT], [3]).invoke()
+
+    await assert_revert(
+        erc721.mint(OTHER, to_uint(1)).invoke(),
+        reverted_with="ERC721: token already minted"
+    )
+
+    await erc721.mint(OTHER, to_uint(3)).invoke()
+    execution_info = await erc721.ownerOf(to_uint(3)).invoke()
+    assert execution_info.result.owner == OTHER
@@ -1,5 +1,6 @@
 import pytest
 from starkware.starknet.testing.starknet import Starknet
+from starkware.starknet.public.abi import get_storage_var_address
 from utils import (
     Signer, str_to_felt, MAX_UINT256, get_contract_def, cached_contract,
     TRUE, assert_revert, to_uint, sub_uint, add_uint
@@ -138,6 +139,23 @@ async def test_tokenOfOwnerByIndex_greater_than_supply(erc721_minted):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('index', [
+    TOTAL_TOKENS,
+    (0, 1),
+    (len(TOKENS) - 1, 1),
+    MAX_UINT256
+])
+async def test_tokenOfOwnerByIndex_out_of_bounds(erc721_minted, index):
+    erc721, account, _ = erc721_minted
+
+    # the balance itself, and indices whose low part alone would be in range
+    await assert_revert(
+        erc721.tokenOfOwnerByIndex(account.contract_address, index).invoke(),
+        reverted_with="ERC721_Enumerable: owner index out of bounds"
+    )
+
+
 @pytest.mark.asyncio
 async def test_tokenOfOwnerByIndex_owner_with_no_tokens(erc721_minted):
     erc721, _, _ = erc721_minted
@@ -238,6 +256,23 @@ async def test_tokenByIndex_greater_than_supply(erc721_minted):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('index', [
+    TOTAL_TOKENS,
+    (0, 1),
+    (len(TOKENS) - 1, 1),
+    MAX_UINT256
+])
+async def test_tokenByIndex_out_of_bounds(erc721_minted, index):
+    erc721, _, _ = erc721_minted
+
+    # the total supply itself, and indices whose low part alone would be in range
+    await assert_revert(
+        erc721.tokenByIndex(index).invoke(),
+        reverted_with="ERC721_Enumerable: global index out of bounds"
+    )
+
+
 @pytest.mark.asyncio
 async def test_tokenByIndex_burn_last_token(erc721_minted):
     erc721, account, _ = erc721_minted
@@ -309,3 +344,264 @@ async def test_tokenByIndex_burn_and_mint(erc721_minted):
     for i in range(0, len(TOKENS)):
         execution_info = await erc721.tokenByIndex(to_uint(i)).invoke()
         assert execution_info.result == (TOKENS[i],)
+
+
+#
+# tokensOfOwner
+#
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit, expected', [
+    [0, len(TOKENS), TOKENS],
+    [0, 2, TOKENS[:2]],
+    [2, 2, TOKENS[2:4]],
+    [3, 10, TOKENS[3:]],
+    [len(TOKENS), 1, []],
+    [1, 0, []],
+])
+async def test_tokensOfOwner(erc721_minted, offset, limit, expected):
+    erc721, account, _ = erc721_minted
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == expected
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_owner_with_no_tokens(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokensOfOwner(RECIPIENT, to_uint(0), 10).invoke()
+    assert execution_info.result.tokenIds == []
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_greater_than_balance(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    tokens_plus_one = add_uint(TOTAL_TOKENS, to_uint(1))
+
+    await assert_revert(
+        erc721.tokensOfOwner(account.contract_address, tokens_plus_one, 1).invoke(),
+        reverted_with="ERC721_Enumerable: owner index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokensOfOwner_after_transfer(erc721_minted):
+    erc721, account, account2 = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, account2.contract_address, *TOKENS[0]]
+    )
+
+    # the last token takes the place of the transferred one
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[-1]] + TOKENS[1:-1]
+
+    execution_info = await erc721.tokensOfOwner(
+        account2.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[0]]
+
+
+#
+# tokensByRange
+#
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('offset, limit, expected', [
+    [0, len(TOKENS), TOKENS],
+    [1, 3, TOKENS[1:4]],
+    [4, 10, TOKENS[4:]],
+    [len(TOKENS), 1, []],
+])
+async def test_tokensByRange(erc721_minted, offset, limit, expected):
+    erc721, _, _ = erc721_minted
+
+    execution_info = await erc721.tokensByRange(to_uint(offset), limit).invoke()
+    assert execution_info.result.tokenIds == expected
+
+
+@pytest.mark.asyncio
+async def test_tokensByRange_greater_than_supply(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    tokens_plus_one = add_uint(TOTAL_TOKENS, to_uint(1))
+
+    await assert_revert(
+        erc721.tokensByRange(tokens_plus_one, 1).invoke(),
+        reverted_with="ERC721_Enumerable: global index out of bounds"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokensByRange_negative_limit(erc721_minted):
+    erc721, _, _ = erc721_minted
+
+    await assert_revert(
+        erc721.tokensByRange(to_uint(0), -1).invoke(),
+        reverted_with="ERC721_Enumerable: limit is negative"
+    )
+
+
+#
+# mintBatch
+#
+
+
+def flatten(tokens):
+    # Uint256 array calldata
+    return [n for token in tokens for n in token]
+
+
+async def assert_enumeration(erc721, owner, expected):
+    # the owner holds every token of the contract
+    execution_info = await erc721.totalSupply().invoke()
+    assert execution_info.result == (to_uint(len(expected)),)
+    execution_info = await erc721.balanceOf(owner).invoke()
+    assert execution_info.result == (to_uint(len(expected)),)
+
+    for i, token in enumerate(expected):
+        execution_info = await erc721.tokenByIndex(to_uint(i)).invoke()
+        assert execution_info.result == (token,)
+        execution_info = await erc721.tokenOfOwnerByIndex(owner, to_uint(i)).invoke()
+        assert execution_info.result == (token,)
+
+
+@pytest.mark.asyncio
+async def test_mintBatch(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            account.contract_address, len(TOKENS), *flatten(TOKENS)]
+    )
+
+    await assert_enumeration(erc721, account.contract_address, TOKENS)
+    for token in TOKENS:
+        execution_info = await erc721.ownerOf(token).invoke()
+        assert execution_info.result == (account.contract_address,)
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_after_mint(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mint', [
+            account.contract_address, *TOKENS[0]]
+    )
+    await signer.send_transaction(
+        account, erc721.contract_address, 'mintBatch', [
+            account.contract_address, len(TOKENS) - 1, *flatten(TOKENS[1:])]
+    )
+
+    await assert_enumeration(erc721, account.contract_address, TOKENS)
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_duplicate_token(erc721_factory):
+    erc721, account, _ = erc721_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account, erc721.contract_address, 'mintBatch', [
+                account.contract_address, 2, *TOKENS[0], *TOKENS[0]]
+        ),
+        reverted_with="ERC721: token already minted"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mintBatch_not_owner(erc721_factory):
+    erc721, _, account2 = erc721_factory
+
+    await assert_revert(
+        signer.send_transaction(
+            account2, erc721.contract_address, 'mintBatch', [
+                account2.contract_address, len(TOKENS), *flatten(TOKENS)]
+        ),
+        reverted_with="Ownable: caller is not the owner"
+    )
+
+
+#
+# burnBatch
+#
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('burnt, remaining', [
+    # each burnt token is replaced by the last one
+    [[0, 2], [4, 1, 3]],
+    [[4, 3], [0, 1, 2]],
+    [[0, 1, 2, 3, 4], []],
+])
+async def test_burnBatch(erc721_minted, burnt, remaining):
+    erc721, account, _ = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [
+            len(burnt), *flatten([TOKENS[i] for i in burnt])]
+    )
+
+    await assert_enumeration(
+        erc721, account.contract_address, [TOKENS[i] for i in remaining])
+    for i in burnt:
+        await assert_revert(
+            erc721.ownerOf(TOKENS[i]).invoke(),
+            reverted_with="ERC721: owner query for nonexistent token"
+        )
+
+
+def owned_token_slot(erc721, owner, index):
+    # raw Uint256 stored in `owned_tokens` at `(owner, index)`
+    key = get_storage_var_address('ERC721_Enumerable_owned_tokens_felt', owner, index)
+    storage = erc721.state.state.contract_states[erc721.contract_address].storage_updates
+    return tuple(
+        storage[k].value if k in storage else 0 for k in [key, key + 1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_clears_vacated_slots(erc721_minted):
+    erc721, account, _ = erc721_minted
+
+    # both tokens are replaced by the last ones, freeing indices 3 and 4
+    burnt = [TOKENS[0], TOKENS[1]]
+    await signer.send_transaction(
+        account, erc721.contract_address, 'burnBatch', [len(burnt), *flatten(burnt)]
+    )
+
+    for index in [3, 4]:
+        assert owned_token_slot(erc721, account.contract_address, index) == (0, 0)
+        await assert_revert(
+            erc721.tokenOfOwnerByIndex(account.contract_address, to_uint(index)).invoke(),
+            reverted_with="ERC721_Enumerable: owner index out of bounds"
+        )
+
+    execution_info = await erc721.tokensOfOwner(
+        account.contract_address, to_uint(0), len(TOKENS)).invoke()
+    assert execution_info.result.tokenIds == [TOKENS[4], TOKENS[3], TOKENS[2]]
+
+
+@pytest.mark.asyncio
+async def test_burnBatch_not_token_owner(erc721_minted):
+    erc721, account, account2 = erc721_minted
+
+    await signer.send_transaction(
+        account, erc721.contract_address, 'transferFrom', [
+            account.contract_address, account2.contract_address, *TOKENS[0]]
+    )
+
+    await assert_revert(
+        signer.send_transaction(
+            account2, erc721.contract_address, 'burnBatch', [
+                2, *TOKENS[0], *TOKENS[1]]
+        ),
+        reverted_with="ERC721: burn from incorrect owner"
+    )
@@ -0,0 +1,109 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import (
+    Signer, str_to_felt, to_uint, get_contract_def, cached_contract, ZERO_ADDRESS
+)
+from models import ERC721EnumerableMintableBurnableModel
+from differential import Generator, Replayer, explore, ERC721_ENUMERABLE_SPEC
+
+signer = Signer(123456789987654321)
+
+# testing vars
+NAME = str_to_felt("Non Fungible Token")
+SYMBOL = str_to_felt("NFT")
+N_ACTORS = 3
+N_TOKENS = 5
+
+# model-only exploration is cheap, replays on the contract are not
+N_SEQUENCES = 500
+SEQUENCE_LENGTH = 50
+REPLAY_LENGTH = 12
+
+# the owner is the first actor, i.e. placeholder address 1
+OWNER = 1
+
+
+def enumerable_model():
+    return ERC721EnumerableMintableBurnableModel(NAME, SYMBOL, OWNER)
+
+
+def supply_invariant(model):
+    # burnt tokens are left behind with the zero address as owner
+    minted = sum(1 for owner in model.owners.values() if owner != ZERO_ADDRESS)
+    return model.all_tokens_len == minted and sum(model.balances.values()) == minted
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc721_def = get_contract_def(
+        'openzeppelin/token/erc721_enumerable/ERC721_Enumerable_Mintable_Burnable.cairo')
+    return account_def, erc721_def
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_defs):
+    account_def, erc721_def = contract_defs
+    starknet = await Starknet.empty()
+    accounts = [
+        await starknet.deploy(
+            contract_def=account_def,
+            constructor_calldata=[signer.public_key]
+        )
+        for _ in range(N_ACTORS)
+    ]
+    erc721 = await starknet.deploy(
+        contract_def=erc721_def,
+        constructor_calldata=[NAME, SYMBOL, accounts[OWNER - 1].contract_address]
+    )
+    return starknet.state, accounts, erc721
+
+
+@pytest.fixture
+def erc721_factory(contract_defs, erc721_init):
+    account_def, erc721_def = contract_defs
+    state, accounts, erc721 = erc721_init
+    _state = state.copy()
+    accounts = [cached_contract(_state, account_def, account) for account in accounts]
+    erc721 = cached_contract(_state, erc721_def, erc721)
+    return accounts, erc721
+
+
+def erc721_views(generator):
+    views = [('totalSupply', ())]
+    for index in range(generator.n_tokens):
+        views.append(('tokenByIndex', (to_uint(index),)))
+    for token in generator.tokens:
+        views.append(('ownerOf', (token,)))
+        views.append(('getApproved', (token,)))
+    for owner in generator.addresses:
+        views.append(('balanceOf', (owner,)))
+        for index in range(generator.n_tokens):
+            views.append(('tokenOfOwnerByIndex', (owner, to_uint(index))))
+        for operator in generator.addresses:
+            views.append(('isApprovedForAll', (owner, operator)))
+    return views
+
+
+def test_model_supply_invariant():
+    generator = Generator(ERC721_ENUMERABLE_SPEC, n_actors=N_ACTORS, n_tokens=N_TOKENS)
+    failing, _ = explore(
+        generator, enumerable_model, supply_invariant, N_SEQUENCES, SEQUENCE_LENGTH, sample_size=0
+    )
+    assert failing == []
+
+
+@pytest.mark.asyncio
+async def test_replay_enumerable(erc721_factory):
+    accounts, erc721 = erc721_factory
+    generator = Generator(ERC721_ENUMERABLE_SPEC, n_actors=N_ACTORS, n_tokens=N_TOKENS)
+    _, sampled = explore(
+        generator, enumerable_model, supply_invariant, 20, REPLAY_LENGTH, sample_size=1, seed=6
+    )
+
+    replayer = Replayer(erc721, accounts, signer, ERC721_ENUMERABLE_SPEC)
+    model = enumerable_model()
+    await replayer.replay(model, sampled[0])
+    await replayer.compare_views(
+        model, erc721_views(generator), address_views=('ownerOf', 'getApproved')
+    )
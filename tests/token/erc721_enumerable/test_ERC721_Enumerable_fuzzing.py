@@ -0,0 +1,77 @@
+import pytest
+from starkware.starknet.testing.starknet import Starknet
+from utils import Signer, str_to_felt, to_uint, get_contract_def, cached_contract
+from differential import Generator, Operation, ERC721_ENUMERABLE_SPEC
+from fuzzing import Fuzzer, erc721_enumeration_invariant
+
+signer = Signer(123456789987654321)
+
+# testing vars
+NAME = str_to_felt("Non Fungible Token")
+SYMBOL = str_to_felt("NFT")
+TOKEN = to_uint(1)
+N_ACTORS = 3
+N_TOKENS = 5
+
+# every step runs on the contract, so keep the runs short
+N_SEQUENCES = 2
+SEQUENCE_LENGTH = 10
+
+
+@pytest.fixture(scope='module')
+def contract_defs():
+    account_def = get_contract_def('openzeppelin/account/Account.cairo')
+    erc721_def = get_contract_def(
+        'openzeppelin/token/erc721_enumerable/ERC721_Enumerable_Mintable_Burnable.cairo')
+    return account_def, erc721_def
+
+
+@pytest.fixture(scope='module')
+async def erc721_init(contract_defs):
+    account_def, erc721_def = contract_defs
+    starknet = await Starknet.empty()
+    accounts = [
+        await starknet.deploy(
+            contract_def=account_def,
+            constructor_calldata=[signer.public_key]
+        )
+        for _ in range(N_ACTORS)
+    ]
+    erc721 = await starknet.deploy(
+        contract_def=erc721_def,
+        constructor_calldata=[NAME, SYMBOL, accounts[0].contract_address]
+    )
+    return starknet.state, accounts, erc721
+
+
+@pytest.fixture
+def fuzzer(contract_defs, erc721_init):
+    account_def, erc721_def = contract_defs
+    state, accounts, erc721 = erc721_init
+
+    def bind(state):
+        return (
+            cached_contract(state, erc721_def, erc721),
+            [cached_contract(state, account_def, account) for account in accounts]
+        )
+
+    generator = Generator(ERC721_ENUMERABLE_SPEC, n_actors=N_ACTORS, n_tokens=N_TOKENS)
+    return Fuzzer(
+        state, bind, signer, generator, [erc721_enumeration_invariant(generator.addresses)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_fuzz_enumerable(fuzzer):
+    failure = await fuzzer.fuzz(N_SEQUENCES, SEQUENCE_LENGTH, seed=0)
+    assert failure is None, failure
+
+
+@pytest.mark.asyncio
+async def test_enumeration_after_transfer_to_self(fuzzer):
+    # the owner (actor 0, placeholder 1) mints a token and sends it to itself
+    failed_at, message, _ = await fuzzer.run([
+        Operation(0, 'mint', (1, TOKEN)),
+        Operation(0, 'transferFrom', (1, 1, TOKEN)),
+    ])
+    assert failed_at is None, message